@@ -22,4 +22,12 @@ app.conf.beat_schedule = {
         "task": "request_a_govuk_domain.request.tasks.check_email_failure_and_notify",
         "schedule": crontab(minute="*/1"),
     },
+    "bank-holidays-refresh": {
+        "task": "request_a_govuk_domain.request.tasks.refresh_bank_holidays",
+        "schedule": crontab(hour="3", minute="0"),
+    },
+    "history-partitions": {
+        "task": "request_a_govuk_domain.request.tasks.manage_history_partitions",
+        "schedule": crontab(hour="2", minute="30"),
+    },
 }
@@ -0,0 +1,96 @@
+from django.core.paginator import Page, Paginator
+from django.db.models import F, Q, Window
+from django.db.models.functions import Coalesce, Lag
+
+# Number of history records shown in each table of the history pages
+HISTORY_PAGE_SIZE = 50
+
+# Fields whose changes are not listed in the history, as they change with every update
+UNLISTED_CHANGES = {"last_updated_by"}
+
+
+def since_submission(history, application):
+    """
+    Bound the history of an application, or of its review, to the time it was submitted, which is
+    before any of its history records. The historical tables are partitioned by history_date, so
+    the bound lets Postgres skip the partitions of the months before the submission.
+    :param history: the history records of the application or review
+    :param application: the application
+    :return: the same history records, bounded on history_date
+    """
+    return history.filter(history_date__gte=application.time_submitted)
+
+
+def describe_changes(record, older) -> str:
+    """
+    Describe the fields changed by a history record.
+    If none of the fields are changed and still, there is a history object, then it suggests
+    that the application was saved while updating the review.
+    :param record: history record
+    :param older: the record before it, or None for the first record of the object
+    :return: names of the changed fields, in the order they are defined on the model
+    """
+    if older is None:
+        return "Initial Data"
+    changed = set(record.diff_against(older, excluded_fields=UNLISTED_CHANGES).changed_fields)
+    changes = [field.name for field in record.tracked_fields if field.name in changed]
+    return ", ".join(changes) if changes else "No Changes"
+
+
+def history_page(history, page_number) -> Page:
+    """
+    Get one page of the history of an object, newest first, with the changes made by each record
+    set on its changed_fields_summary attribute.
+
+    The page is read with the record just before it in one query, and each record is compared
+    with the one before it in memory, instead of reading the previous record for each row.
+    :param history: the history records of an object, e.g. Application.history.filter(id=1)
+    :param page_number: page requested, invalid page numbers are treated like Paginator.get_page does
+    :return: the page, holding the history records it shows
+    """
+    history = history.order_by("-history_date", "-history_id")
+    page = Paginator(history, HISTORY_PAGE_SIZE).get_page(page_number)
+    start = max(page.start_index() - 1, 0)
+    window = list(history[start : start + HISTORY_PAGE_SIZE + 1])
+    records = window[:HISTORY_PAGE_SIZE]
+    for record, older in zip(records, window[1:] + [None]):
+        record.changed_fields_summary = describe_changes(record, older)
+    page.object_list = records
+    return page
+
+
+def status_change_page(history, page_number) -> Page:
+    """
+    Get one page of the status changes of an application, newest first.
+
+    A record is shown when it is the latest one, or when the record after it changes the status,
+    owner or last updated by. The records are picked in a subquery comparing each one with the record
+    after it, so only the records on the page are read, with their owner and last updated by.
+    :param history: the history records of an application, e.g. Application.history.filter(id=1)
+    :param page_number: page requested, invalid page numbers are treated like Paginator.get_page does
+    :return: the page, holding the history records it shows
+    """
+    newest_first = [F("history_date").desc(), F("history_id").desc()]
+    compared = {
+        "status": F("status"),
+        # Users who were removed or never set are compared as 0, as NULL never equals anything
+        "owner": Coalesce("owner_id", 0),
+        "last_updated_by": Coalesce("last_updated_by_id", 0),
+    }
+    shown = history.annotate(
+        newer_history_id=Window(Lag("history_id"), partition_by=F("id"), order_by=newest_first),
+        **{f"{name}_value": value for name, value in compared.items()},
+        **{
+            f"newer_{name}": Window(Lag(value), partition_by=F("id"), order_by=newest_first)
+            for name, value in compared.items()
+        },
+    )
+    changed = Q(newer_history_id__isnull=True)
+    for name in compared:
+        changed |= ~Q(**{f"{name}_value": F(f"newer_{name}")})
+    history = (
+        history.filter(history_id__in=shown.filter(changed).values("history_id"))
+        .select_related("owner", "last_updated_by")
+        .order_by(*newest_first)
+    )
+    return Paginator(history, HISTORY_PAGE_SIZE).get_page(page_number)
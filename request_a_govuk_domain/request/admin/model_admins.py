@@ -1,20 +1,20 @@
 import csv
 import logging
 from datetime import datetime
+from itertools import batched
+from typing import Iterator
 from zoneinfo import ZoneInfo
 
 import django.db.models.fields.files
-import markdown
-import pandas as pd
-import requests
 from django.contrib import admin, messages
 from django.contrib.admin import ModelAdmin
 from django.contrib.admin.widgets import AdminFileWidget
 from django.contrib.auth.admin import GroupAdmin, UserAdmin
-from django.http import FileResponse, HttpResponse, HttpResponseRedirect
-from django.template.loader import render_to_string
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponseRedirect, StreamingHttpResponse
 from django.urls import path, reverse
-from django.utils.html import format_html
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
 from simple_history.admin import SimpleHistoryAdmin
 
 from request_a_govuk_domain.request.models import (
@@ -26,10 +26,12 @@ from request_a_govuk_domain.request.models import (
     RegistrarPerson,
     RegistryPublishedPerson,
     Review,
-    ReviewFormGuidance,
 )
 
-from ..models.storage_util import s3_root_storage
+from ..caches import guidance_html
+from ..downloads import file_download_response
+from ..holidays import business_days_between
+from ..models.storage_util import root_storage
 from .filters import (
     LastUpdatedFilter,
     OwnerFilter,
@@ -39,6 +41,8 @@ from .filters import (
     wrap_with_application_filter,
 )
 from .forms import ReviewForm
+from .pagination import KeysetPaginationMixin
+from .search import ApplicationSearchMixin
 
 LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +62,20 @@ class FileDownloadMixin:
         """
         pass
 
+    def get_downloaded_object(self, request, object_id):
+        """
+        The object containing the file to download, if the user may view it
+        :param request: Current request object
+        :param object_id: id of the object containing the field
+        :return:
+        """
+        obj = self.get_object(request, object_id)
+        if obj is None:
+            raise Http404
+        if not self.has_view_permission(request, obj):
+            raise PermissionDenied
+        return obj
+
     @property
     def uid(self):
         """
@@ -117,6 +135,16 @@ def convert_to_local_time(obj):
     return obj.astimezone(ZoneInfo("Europe/London")).strftime("%d %b %Y %H:%M:%S %p") if obj else "-"
 
 
+class Echo:
+    """
+    File-like object that returns what is written to it, so csv.writer can be used to generate the
+    lines of a streamed response
+    """
+
+    def write(self, value):
+        return value
+
+
 class ReportDownLoadMixin:
     """
     Mixin that can be included in to any model admin to generate csv reports.
@@ -129,10 +157,8 @@ class ReportDownLoadMixin:
         """
         return [field.name for field in self.model._meta.fields]
 
-    def changelist_view(self, request, extra_context=None):
-        # Fetch holidays when the page loads
-        self._uk_holidays = self._fetch_bank_holidays()
-        return super().changelist_view(request, extra_context)
+    # Number of rows fetched from the database at a time when exporting
+    export_chunk_size = 2000
 
     @admin.action(  # type: ignore
         permissions=["export"],
@@ -141,6 +167,9 @@ class ReportDownLoadMixin:
     def export(self, _request, queryset):
         """
         Generate a CSV file from the given queryset.
+
+        The file is streamed as it is generated, reading the queryset in chunks, so the memory used
+        doesn't grow with the number of rows exported.
         :param _request:
         :param queryset:
         :return:
@@ -148,42 +177,38 @@ class ReportDownLoadMixin:
         meta = self.model._meta
         field_names = self.get_field_names()
 
-        response = HttpResponse(content_type="text/csv")
+        response = StreamingHttpResponse(self.generate_csv(queryset, field_names), content_type="text/csv")
         response[
             "Content-Disposition"
         ] = f"attachment; filename={meta}_{datetime.today().strftime('%Y-%m-%d')}_data_backup.csv"
-        writer = csv.writer(response)
-
-        writer.writerow(field_names)
-        for obj in queryset:
-            row = []
-            for field in field_names:
-                if field == "Date Submitted":
-                    row.append(self.format_date(obj.time_submitted))
-                elif field == "Registrar org":
-                    row.append(obj.registrar_org.name if obj.registrar_org else "")
-                elif field == "Domain name":
-                    row.append(obj.domain_name)
-                elif field == "Organisation type":
-                    row.append("")
-                elif field == "Application month":
-                    row.append(self.get_application_month(obj.time_submitted))
-                elif field == "Calendar days to complete":
-                    row.append(self.get_days_between(obj))
-                elif field == "Date application is processed":
-                    row.append(self.get_date_application_processed(obj))
-                elif field == "Business days to complete":
-                    row.append(self.get_business_days_to_complete(obj))
-                elif field == "Application reviewed by":
-                    row.append(obj.last_updated_by)
-                elif field == "Approval Rejection comment":
-                    row.append(obj.approval_or_rejection_comment)
-                else:
-                    row.append(self.format_field(obj, field))
-            writer.writerow(row)
-
         return response
 
+    def generate_csv(self, queryset, field_names: list[str]) -> Iterator[str]:
+        """
+        Generate the lines of the CSV file for the given queryset
+        :param queryset:
+        :param field_names: column names, as returned by get_field_names
+        :return: iterator of CSV formatted lines
+        """
+        writer = csv.writer(Echo())
+        yield writer.writerow(field_names)
+        for row in self.get_export_rows(queryset, field_names):
+            yield writer.writerow(row)
+
+    def get_export_rows(self, queryset, field_names: list[str]) -> Iterator[list]:
+        """
+        Generate the rows of the CSV export, one list of column values per object.
+
+        Related objects are fetched in the same query, so the number of queries doesn't depend on the
+        number of rows.
+        :param queryset:
+        :param field_names: column names, as returned by get_field_names
+        :return: iterator of rows
+        """
+        related_fields = [field.name for field in self.model._meta.fields if field.is_relation]
+        for obj in queryset.select_related(*related_fields).iterator(chunk_size=self.export_chunk_size):
+            yield [self.format_field(obj, field) for field in field_names]
+
     def get_application_month(self, date: datetime | None) -> str:
         """
         Get the application month from the date_submitted field.
@@ -192,31 +217,29 @@ class ReportDownLoadMixin:
         """
         return date.strftime("%B") if date else ""
 
-    def get_date_application_processed(self, app: Application) -> str:
+    def get_report_application(self, obj) -> Application:
         """
-        Get the date the application was processed (approved or rejected).
-        :param app: Application object
-        :return: Date as a string
-        """
-        if app.status in [ApplicationStatus.APPROVED, ApplicationStatus.REJECTED]:
-            return self.format_date(app.time_decided)
-        return ""
-
-    def _fetch_bank_holidays(self) -> list[datetime]:
-        """Return a list of dates of UK bank holiday dates as returned by gov.uk"""
-        try:
-            response = requests.get("https://www.gov.uk/bank-holidays.json")
-            response.raise_for_status()
-            data = response.json()
-            uk_holidays = [item["date"] for item in data["england-and-wales"]["events"]]
-            uk_bank_holidays = pd.to_datetime(uk_holidays)
-            holidays_list = (
-                uk_bank_holidays.date.tolist() if hasattr(uk_bank_holidays, "date") else list(uk_bank_holidays)
-            )
-        except Exception as e:
-            LOGGER.error(f"Error fetching holidays data: {e}")
-            holidays_list = []
-        return holidays_list
+        The application reported on by a row of the changelist
+        :param obj: object shown in the row
+        :return: Application object
+        """
+        return obj
+
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)
+        # Work out the business days for the whole page at once, for the duration column
+        self.set_business_days_to_complete([self.get_report_application(obj) for obj in changelist.result_list])
+        return changelist
+
+    def set_business_days_to_complete(self, apps: list[Application]) -> None:
+        """
+        Calculate the number of business days to complete each of the given applications,
+        so get_business_days_to_complete doesn't have to calculate them one at a time.
+        :param apps: list of Application objects
+        """
+        business_days = business_days_between([app.time_submitted for app in apps], [app.time_decided for app in apps])
+        for app, days in zip(apps, business_days):
+            app._business_days_to_complete = days
 
     def get_business_days_to_complete(self, app: Application) -> int:
         """
@@ -224,15 +247,9 @@ class ReportDownLoadMixin:
         :param app: Application object
         :return: Number of business days
         """
-        if not app.time_submitted or not app.time_decided or app.time_submitted == app.time_decided:
-            return 0
-
-        net_days = len(pd.bdate_range(app.time_submitted, app.time_decided, freq="C", holidays=self._uk_holidays))
-
-        if net_days == 1:
-            return 0
-        else:
-            return max(0, net_days - 1)
+        if not hasattr(app, "_business_days_to_complete"):
+            self.set_business_days_to_complete([app])
+        return app._business_days_to_complete
 
     def format_field(self, obj: object, field: str) -> str:
         """
@@ -256,9 +273,6 @@ class ReportDownLoadMixin:
         """
         return date.strftime("%d/%m/%Y") if date else ""
 
-    def get_days_between(self, app: Application) -> int:
-        return app.time_elapsed().days
-
     def has_export_permission(self, request, obj=None):
         return request.user.is_superuser
 
@@ -281,7 +295,14 @@ class ArchiveMixin:
         return request.user.is_superuser
 
 
-class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, admin.ModelAdmin):
+class ReviewAdmin(
+    KeysetPaginationMixin,
+    ApplicationSearchMixin,
+    SimpleHistoryAdmin,
+    FileDownloadMixin,
+    ReportDownLoadMixin,
+    admin.ModelAdmin,
+):
     model = Review
     form = ReviewForm
     change_form_template = "admin/review_change_form.html"
@@ -315,26 +336,36 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
         wrap_with_application_filter(RegistrantOrgFilter),
         wrap_with_application_filter(LastUpdatedFilter),
     )
+    # Searched by ApplicationSearchMixin
     search_fields = [
         "application__reference",
         "application__domain_name",
         "application__status",
+        "application__registrar_org__name",
+        "application__registrant_org__name",
+        "application__owner__username",
     ]
+    application_path = "application"
+    keyset_fields = ("application__time_submitted", "application__id")
 
     def download_file_view(self, request, object_id, field_name):
-        review = self.model.objects.get(id=object_id)
-        application = review.application
-        file = getattr(application, field_name)
-        # We need to use root_storage as the default storage always
+        review = self.get_downloaded_object(request, object_id)
+        # We need to use root_storage as the default storage on S3 always
         # refer to the TEMP_STORAGE_ROOT as the parent.
-        return FileResponse(s3_root_storage().open(file.name, "rb"))
+        return file_download_response(root_storage(), review.application.evidence_path(field_name))
 
     @property
     def uid(self):
         return "review"
 
+    def get_report_application(self, obj):
+        return obj.application
+
     def _get_formatted_display_fields(self, display_fields: dict) -> str:
-        return render_to_string("admin/reviewer_read_only_fields.html", {"display_fields": display_fields})
+        return format_html(
+            "<div>{}</div>",
+            format_html_join("", "<p><strong>{}:</strong> {}</p>", display_fields.items()),
+        )
 
     def get_registrar_fieldset(self, obj):
         return (
@@ -349,7 +380,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                         "Email address": obj.application.registrar_person.email_address,
                     }
                 )
-                + markdown.markdown(ReviewFormGuidance.objects.get(name="registrar_details").how_to),
+                + guidance_html("registrar_details"),
             },
         )
 
@@ -367,7 +398,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                         "Reason for request": obj.application.domain_purpose,
                     }
                 )
-                + markdown.markdown(ReviewFormGuidance.objects.get(name="domain_name_availability").how_to),
+                + guidance_html("domain_name_availability"),
             },
         )
 
@@ -379,7 +410,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                 "description": self._get_formatted_display_fields(
                     {"Registrant's organisation": obj.application.registrant_org.name}
                 )
-                + markdown.markdown(ReviewFormGuidance.objects.get(name="registrant_org").how_to),
+                + guidance_html("registrant_org"),
             },
         )
 
@@ -395,7 +426,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                         "Email address": obj.application.registrant_person.email_address,
                     }
                 )
-                + markdown.markdown(ReviewFormGuidance.objects.get(name="registrant_person").how_to),
+                + guidance_html("registrant_person"),
             },
         )
 
@@ -407,7 +438,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                 {
                     "fields": ("registrant_permission", "registrant_permission_notes"),
                     "description": self._get_formatted_display_fields({"Evidence": download_link})
-                    + markdown.markdown(ReviewFormGuidance.objects.get(name="registrant_permission").how_to),
+                    + guidance_html("registrant_permission"),
                 },
             )
 
@@ -419,7 +450,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                 {
                     "fields": ("policy_exemption", "policy_exemption_notes"),
                     "description": self._get_formatted_display_fields({"Evidence": download_link})
-                    + markdown.markdown(ReviewFormGuidance.objects.get(name="policy_exemption").how_to),
+                    + guidance_html("policy_exemption"),
                 },
             )
 
@@ -431,7 +462,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                 "description": self._get_formatted_display_fields(
                     {"Domain name requested": obj.application.domain_name}
                 )
-                + markdown.markdown(ReviewFormGuidance.objects.get(name="domain_name_rules").how_to),
+                + guidance_html("domain_name_rules"),
             },
         )
 
@@ -446,7 +477,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                         "registrant_senior_support_notes",
                     ),
                     "description": self._get_formatted_display_fields({"Evidence": download_link})
-                    + markdown.markdown(ReviewFormGuidance.objects.get(name="registrant_senior_support").how_to),
+                    + guidance_html("registrant_senior_support"),
                 },
             )
 
@@ -461,7 +492,7 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
                         "Registrant email": obj.application.registry_published_person.email_address,
                     }
                 )
-                + markdown.markdown(ReviewFormGuidance.objects.get(name="registry_details").how_to),
+                + guidance_html("registry_details"),
             },
         )
 
@@ -563,16 +594,20 @@ class ReviewAdmin(SimpleHistoryAdmin, FileDownloadMixin, ReportDownLoadMixin, ad
             LOGGER.info(f"Initial owner assigned {obj.application} - {obj.application.owner}")
 
         obj.application.last_updated_by = request.user
-        LOGGER.info(
-            f"Application {obj.application.reference} changed by {request.user} owner is {obj.application.owner}"
-        )
-        obj.application.save()
+        # The application, and its history, are only saved when one of its fields changed
+        if obj.application.get_dirty_fields():
+            LOGGER.info(
+                f"Application {obj.application.reference} changed by {request.user} owner is {obj.application.owner}"
+            )
+            obj.application.save()
 
     def has_add_permission(self, request):
         return False
 
 
 class ApplicationAdmin(
+    KeysetPaginationMixin,
+    ApplicationSearchMixin,
     SimpleHistoryAdmin,
     FileDownloadMixin,
     ReportDownLoadMixin,
@@ -612,6 +647,7 @@ class ApplicationAdmin(
         "registrant_org",
         "registrar_org",
     ]
+    # Searched by ApplicationSearchMixin
     search_fields = [
         "reference",
         "domain_name",
@@ -653,10 +689,75 @@ class ApplicationAdmin(
         ]
         return field_names
 
+    def get_export_rows(self, queryset, field_names: list[str]) -> Iterator[list]:
+        """
+        Generate the rows of the CSV export from a projection of the columns needed by get_field_names.
+
+        The business days of each chunk of rows are calculated together.
+        :param queryset:
+        :param field_names: column names, as returned by get_field_names
+        :return: iterator of rows
+        """
+        values = queryset.values(
+            "id",
+            "reference",
+            "time_submitted",
+            "time_decided",
+            "registrar_org__name",
+            "domain_name",
+            "status",
+            "last_updated_by__username",
+            "approval_or_rejection_comment",
+        )
+        now = timezone.now()
+        for chunk in batched(values.iterator(chunk_size=self.export_chunk_size), self.export_chunk_size):
+            business_days = business_days_between(
+                [row["time_submitted"] for row in chunk], [row["time_decided"] for row in chunk]
+            )
+            for row, days in zip(chunk, business_days):
+                yield [self.format_export_value(row, field, days, now) for field in field_names]
+
+    def format_export_value(self, row: dict, field: str, business_days: int, now: datetime):
+        """
+        Value of a column of the CSV export
+        :param row: application values
+        :param field: column name
+        :param business_days: number of business days to complete the application
+        :param now: time the export started
+        :return: the column value
+        """
+        if field == "Date Submitted":
+            return self.format_date(row["time_submitted"])
+        elif field == "Registrar org":
+            return row["registrar_org__name"] or ""
+        elif field == "Domain name":
+            return row["domain_name"]
+        elif field == "Organisation type":
+            return ""
+        elif field == "status":
+            return ApplicationStatus(row["status"]).label
+        elif field == "Application month":
+            return self.get_application_month(row["time_submitted"])
+        elif field == "Calendar days to complete":
+            return Application.calculate_time_elapsed(
+                row["id"], row["status"], row["time_submitted"], row["time_decided"], now
+            ).days
+        elif field == "Date application is processed":
+            if row["status"] in [ApplicationStatus.APPROVED, ApplicationStatus.REJECTED]:
+                return self.format_date(row["time_decided"])
+            return ""
+        elif field == "Business days to complete":
+            return business_days
+        elif field == "Application reviewed by":
+            return row["last_updated_by__username"]
+        elif field == "Approval Rejection comment":
+            return row["approval_or_rejection_comment"]
+        else:
+            return row[field]
+
     def download_file_view(self, request, object_id, field_name):
-        application = self.model.objects.get(id=object_id)
-        file = getattr(application, field_name)
-        return FileResponse(s3_root_storage().open(file.name, "rb"))
+        application = self.get_downloaded_object(request, object_id)
+        return file_download_response(root_storage(), application.evidence_path(field_name))
 
     @property
     def uid(self):
@@ -0,0 +1,168 @@
+from datetime import datetime
+from functools import reduce
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
+from django.db import connection
+from django.db.models import Q
+
+CURSOR_VAR = "cursor"
+NEXT = "next"
+PREVIOUS = "previous"
+
+# Below this many rows the planner estimate is not reliable enough, and counting is cheap anyway
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+def estimated_row_count(model) -> int | None:
+    """
+    The number of rows in the table of a model, as estimated by the Postgres planner statistics.
+
+    :param model: model class
+    :return: estimated number of rows, or None if the table has not been analysed yet
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Changelist paginated with a cursor on the keyset fields of the model admin, newest first.
+
+    A page is fetched with "WHERE (keyset) < (cursor) ORDER BY keyset DESC LIMIT n", which uses the
+    index on the keyset however deep the page, instead of the default OFFSET pagination which
+    reads and discards every row before the page. The number of results is only counted when the
+    list is filtered or searched, otherwise the planner estimate of the table size is used.
+
+    The default pagination is still used when the list is sorted on another column or all the
+    results are shown.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR)
+        super().__init__(request, *args, **kwargs)
+        # Changing a filter, the search or the sort order goes back to the first page
+        self.params.pop(CURSOR_VAR, None)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    @property
+    def keyset_fields(self) -> tuple[str, ...]:
+        return tuple(self.model_admin.keyset_fields)
+
+    def get_results(self, request):
+        self.keyset_pagination = ORDER_VAR not in self.params and not self.show_all and not self.list_editable
+        if not self.keyset_pagination:
+            return super().get_results(request)
+
+        direction, values = self.parse_cursor(self.cursor)
+        queryset = self.queryset
+        page_size = self.list_per_page
+        if direction == PREVIOUS:
+            # Fetch the rows just after the cursor in ascending order, then put them back newest first
+            rows = list(queryset.filter(self.keyset_filter(values, "gt")).reverse()[: page_size + 1])
+            has_previous = len(rows) > page_size
+            rows = rows[:page_size][::-1]
+            has_next = True
+        else:
+            if direction == NEXT:
+                queryset = queryset.filter(self.keyset_filter(values, "lt"))
+            rows = list(queryset[: page_size + 1])
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            has_previous = direction == NEXT
+
+        self.result_count, self.result_count_is_estimate = self.get_keyset_result_count()
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows
+        self.can_show_all = False
+        self.multi_page = has_next or has_previous
+        self.paginator = None
+        self.next_page_url = self.cursor_url(NEXT, rows[-1]) if has_next and rows else None
+        self.previous_page_url = self.cursor_url(PREVIOUS, rows[0]) if has_previous and rows else None
+        self.first_page_url = self.get_query_string(remove=[CURSOR_VAR, PAGE_VAR]) if has_previous else None
+
+    def get_ordering(self, request, queryset):
+        if ORDER_VAR in self.params:
+            return super().get_ordering(request, queryset)
+        return [f"-{field}" for field in self.keyset_fields]
+
+    def get_keyset_result_count(self) -> tuple[int, bool]:
+        """
+        The number of results, and whether it is an estimate
+        """
+        if not self.has_active_filters and not self.query:
+            estimate = estimated_row_count(self.model)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate, True
+        return self.queryset.count(), False
+
+    def keyset_filter(self, values: tuple, lookup: str) -> Q:
+        """
+        Rows before ("lt") or after ("gt") the given keyset values, in keyset order.
+
+        (a, b) < (x, y) is written as a <= x AND (a < x OR (a = x AND b < y)), which Django can
+        express. The redundant a <= x lets Postgres start the index scan at the cursor rather than
+        filtering every row before it.
+        """
+        conditions = []
+        for position, field in enumerate(self.keyset_fields):
+            equal = {name: value for name, value in zip(self.keyset_fields[:position], values)}
+            conditions.append(Q(**equal, **{f"{field}__{lookup}": values[position]}))
+        bound = Q(**{f"{self.keyset_fields[0]}__{lookup}e": values[0]})
+        return bound & reduce(lambda left, right: left | right, conditions)
+
+    def keyset_values(self, obj) -> tuple:
+        """
+        The keyset values of an object, following relations in field paths like "application__id"
+        """
+        return tuple(reduce(getattr, field.split("__"), obj) for field in self.keyset_fields)
+
+    def cursor_url(self, direction: str, obj) -> str:
+        values = self.keyset_values(obj)
+        cursor = ",".join(
+            [direction, *(value.isoformat() if isinstance(value, datetime) else str(value) for value in values)]
+        )
+        return self.get_query_string({CURSOR_VAR: cursor}, [PAGE_VAR])
+
+    def parse_cursor(self, cursor: str | None) -> tuple[str | None, tuple]:
+        """
+        Read the cursor parameter, e.g. "next,2024-05-01T10:00:00+00:00,123"
+
+        :return: the direction to page in and the keyset values to page from, or (None, ()) for the first page
+        :raises IncorrectLookupParameters: if the cursor is not valid, which the admin shows as an error
+        """
+        if not cursor:
+            return None, ()
+        direction, *raw_values = cursor.split(",")
+        if direction not in (NEXT, PREVIOUS) or len(raw_values) != len(self.keyset_fields):
+            raise IncorrectLookupParameters(f"Invalid cursor {cursor}")
+        try:
+            values = (datetime.fromisoformat(raw_values[0]), *(int(value) for value in raw_values[1:]))
+        except ValueError as e:
+            raise IncorrectLookupParameters(f"Invalid cursor {cursor}") from e
+        return direction, values
+
+
+class KeysetPaginationMixin:
+    """
+    Model admin mixin paginating the changelist with KeysetChangeList
+    """
+
+    # Fields the changelist is ordered and paginated on, newest first: a timestamp followed by integer
+    # fields identifying the row, e.g. the id. Objects with an application are ordered on the application fields,
+    # e.g. ("application__time_submitted", "application__id") for reviews.
+    keyset_fields: tuple[str, ...] = ("time_submitted", "id")
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
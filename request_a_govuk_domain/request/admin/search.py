@@ -0,0 +1,70 @@
+from typing import Iterable
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+from django.utils.text import smart_split, unescape_string_literal
+
+from request_a_govuk_domain.request.models import Application
+
+
+def matching_application_ids(term: str, search_fields: Iterable[str]):
+    """
+    Subquery of the ids of the applications matching a search term.
+
+    The fields of the application are searched together, and the fields of each related table on
+    their own, using the trigram index on each field, and the results are combined with UNION.
+    Searching all the fields with a single OR across the joined tables would make Postgres scan
+    every application instead.
+
+    :param term: text to find in the fields, ignoring case
+    :param search_fields: searched fields of the application, e.g. "reference" or "owner__username"
+    :return: queryset of application ids
+    """
+    local = Q()
+    related: dict[str, Q] = {}
+    for field in search_fields:
+        relation, _, path = field.partition("__")
+        if path:
+            related[relation] = related.get(relation, Q()) | Q(**{f"{path}__icontains": term})
+        else:
+            local |= Q(**{f"{field}__icontains": term})
+    queries = [Application.objects.filter(local).values("id")] if local else []
+    for relation, condition in related.items():
+        related_model = Application._meta.get_field(relation).related_model
+        queries.append(
+            Application.objects.filter(**{f"{relation}__in": related_model.objects.filter(condition)}).values("id")
+        )
+    first, *others = queries
+    return first.union(*others)
+
+
+class ApplicationSearchMixin:
+    """
+    Admin search for applications, or for objects with an application, backed by trigram indexes.
+
+    The fields of the application in search_fields are searched. Like the default admin search, the
+    search text is split into words (keeping quoted phrases together) and an object must match every
+    word.
+    """
+
+    # Property path to the application from the objects listed, e.g. "application" for reviews.
+    # Leave empty when listing applications.
+    application_path = ""
+
+    def get_search_results(self, request, queryset, search_term):
+        prefix = f"{self.application_path}__" if self.application_path else ""
+        search_fields = []
+        for field in self.get_search_fields(request):
+            if not field.startswith(prefix):
+                raise ImproperlyConfigured(
+                    f"{type(self).__name__} can't search {field}, which is not on the application"
+                )
+            search_fields.append(field.removeprefix(prefix))
+        if not search_fields:
+            return queryset, False
+        id_field = f"{self.application_path}__id__in" if self.application_path else "id__in"
+        for term in smart_split(search_term):
+            if term.startswith(('"', "'")) and term[0] == term[-1]:
+                term = unescape_string_literal(term)
+            queryset = queryset.filter(**{id_field: matching_application_ids(term, search_fields)})
+        return queryset, False
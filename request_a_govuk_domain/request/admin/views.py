@@ -3,16 +3,21 @@ from datetime import timedelta
 
 from django.contrib import admin, messages
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db.models import Count, Q
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
 from django.utils.html import escape
 from django.views import View
 from django.views.generic import RedirectView
 
 from request_a_govuk_domain.request.models import Application, ApplicationStatus, Review
+from request_a_govuk_domain.request.models.application import OPEN_STATUSES
 
 from .email import send_approval_or_rejection_email
 
@@ -53,28 +58,28 @@ class DecisionConfirmationView(View, admin.ModelAdmin):
         }
         return render(request, "admin/application_decision_confirmation.html", context)
 
-    def _set_application_status(self, request):
+    def _set_application_status(self, request) -> Application:
+        """
+        Set the decision on the application, with the reviewer's comment, in a single save
+        """
         obj = Application.objects.get(pk=request.POST.get("obj_id"))
         obj.status = ApplicationStatus(request.POST.get("status"))
         obj.time_decided = timezone.now()
+        # Validate and sanitize input
+        ar_reason = request.POST.get("ar_reason", "").strip()
+        obj.approval_or_rejection_comment = escape(ar_reason)  # Sanitize input to prevent XSS
         obj.save()
+        return obj
 
     def post(self, request):
         if "_confirm" in request.POST:
             try:
                 send_approval_or_rejection_email(request)
-                self._set_application_status(request)
+                obj = self._set_application_status(request)
                 # To show the backend app user a message "[Approval/Rejection] email sent", get the type of
                 # action ( i.e. whether it is Approval or Rejection )
                 approval_or_rejection = request.POST["action"].capitalize()
                 self.message_user(request, f"{approval_or_rejection} email sent", messages.SUCCESS)
-                obj = Application.objects.get(pk=request.GET.get("obj_id"))
-
-                # Validate and sanitize input
-                ar_reason = request.POST.get("ar_reason", "").strip()
-                sanitized_reason = escape(ar_reason)  # Sanitize input to prevent XSS
-                obj.approval_or_rejection_comment = sanitized_reason
-                obj.save()
 
                 LOGGER.info(f"Application {obj.reference} status set to {approval_or_rejection}")
                 return HttpResponseRedirect(reverse("admin:request_review_changelist"))
@@ -166,94 +171,165 @@ class ChangeStatusView(View, admin.ModelAdmin):
         return HttpResponseRedirect(reverse("admin:request_review_change", args=[review.id]))
 
 
+# Number of applications shown in each list on the dashboard
+DASHBOARD_PAGE_SIZE = 10
+# How long, in seconds, a user's dashboard is cached for, so refreshing it doesn't query the database each time
+DASHBOARD_CACHE_TIMEOUT = 10
+
+
+class PrecountedPaginator(Paginator):
+    """
+    Paginator for a list whose length has already been counted, so the paginator doesn't count it again
+    """
+
+    def __init__(self, object_list, per_page, count: int):
+        super().__init__(object_list, per_page)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        return self._count
+
+
 class AdminDashboardView(View, admin.ModelAdmin):
     @method_decorator(staff_member_required)
     def dispatch(self, *args, **kwargs):
         return super().dispatch(*args, **kwargs)
 
-    def get(self, request):
-        user = request.user
+    def get_page(self, queryset, count: int, page_number) -> Page:
+        """
+        Get one page of a list of applications shown on the dashboard
+        :param queryset: the applications in the list
+        :param count: number of applications in the list
+        :param page_number: page requested, invalid page numbers are treated like Paginator.get_page does
+        :return: the page, holding the applications it shows
+        """
+        paginator = PrecountedPaginator([], DASHBOARD_PAGE_SIZE, count)
+        number = paginator.get_page(page_number).number
+        bottom = (number - 1) * DASHBOARD_PAGE_SIZE
+        applications = (
+            list(
+                queryset.select_related("registrar_org", "registrant_org", "last_updated_by").order_by(
+                    "time_submitted", "id"
+                )[bottom : bottom + DASHBOARD_PAGE_SIZE]
+            )
+            if count
+            else []
+        )
+        return Page(applications, number, paginator)
+
+    def get_dashboard_data(self, user, page_numbers: dict) -> dict:
+        """
+        Get the counts and lists of applications shown on the dashboard for the given user.
+
+        All the counts are calculated in a single query, and the result is cached for
+        DASHBOARD_CACHE_TIMEOUT seconds.
+        :param user: logged-in user
+        :param page_numbers: page requested for each list, keyed by the name of the list
+        :return: dashboard template context
+        """
+        cache_key = f"admin-dashboard:{user.id}:{user.is_superuser}:" + ":".join(
+            f"{name}={number}" for name, number in sorted(page_numbers.items())
+        )
+        data = cache.get(cache_key)
+        if data is not None:
+            return data
+
         applications = Application.objects.all()
         seven_days_ago = timezone.now() - timedelta(days=7)
+        owned = Q(owner=user)
+        late = Q(time_submitted__lt=seven_days_ago)
+        on_schedule = Q(time_submitted__gte=seven_days_ago)
 
-        new_allusers_total = applications.filter(status=ApplicationStatus.NEW)
-        nac_owner_total_count = applications.filter(status=ApplicationStatus.CURRENTLY_WITH_NAC, owner=user).count()
-        nac_allusers_total_count = applications.filter(status=ApplicationStatus.CURRENTLY_WITH_NAC).count()
-        context = admin.site.each_context(request)
-        context.update(
-            {
-                "username": user.username,
-                "userid": user.id,
-                "new_allusers_total": new_allusers_total,
-                "new_allusers_total_count": new_allusers_total.count(),
-                "nac_owner_total_count": nac_owner_total_count,
-                "nac_allusers_total_count": nac_allusers_total_count,
-                "is_nav_sidebar_enabled": True,
-            }
-        )
+        def count(status, *conditions):
+            return Count("id", filter=Q(status=status, *conditions))
 
+        counts = {
+            "new_allusers_total_count": count(ApplicationStatus.NEW),
+            "nac_owner_total_count": count(ApplicationStatus.CURRENTLY_WITH_NAC, owned),
+            "nac_allusers_total_count": count(ApplicationStatus.CURRENTLY_WITH_NAC),
+        }
         if user.is_superuser:
-            ready2i_allusers_total_count = applications.filter(
-                status=ApplicationStatus.READY_2I,
-            ).count()
-            ready2i_owner_total_count = applications.filter(status=ApplicationStatus.READY_2I, owner=user).count()
-            ready2i_owner_late = applications.filter(
-                status=ApplicationStatus.READY_2I,
-                time_submitted__lt=seven_days_ago,
-                owner=user,
+            counts.update(
+                {
+                    "ready2i_allusers_total_count": count(ApplicationStatus.READY_2I),
+                    "ready2i_owner_total_count": count(ApplicationStatus.READY_2I, owned),
+                    "ready2i_owner_late_count": count(ApplicationStatus.READY_2I, owned, late),
+                    "ready2i_owner_onschedule_count": count(ApplicationStatus.READY_2I, owned, on_schedule),
+                    "ready2i_all_onschedule_count": count(ApplicationStatus.READY_2I, on_schedule),
+                }
             )
-            ready2i_owner_onschedule = applications.filter(
-                status=ApplicationStatus.READY_2I,
-                time_submitted__gte=seven_days_ago,
-                owner=user,
+        else:
+            counts.update(
+                {
+                    "inprogress_allusers_total_count": count(ApplicationStatus.IN_PROGRESS),
+                    "inprogress_owner_total_count": count(ApplicationStatus.IN_PROGRESS, owned),
+                    "moreinfo_allusers_total_count": count(ApplicationStatus.MORE_INFORMATION),
+                    "moreinfo_owner_total_count": count(ApplicationStatus.MORE_INFORMATION, owned),
+                    "moreinfo_owner_late_count": count(ApplicationStatus.MORE_INFORMATION, owned, late),
+                    "moreinfo_owner_onschedule_count": count(ApplicationStatus.MORE_INFORMATION, owned, on_schedule),
+                }
             )
-            ready2i_all_onschedule_count = applications.filter(
-                status=ApplicationStatus.READY_2I, time_submitted__gte=seven_days_ago
-            ).count()
-            context.update(
+        # Every count is of open applications, so only those are read, from the partial index
+        data = applications.filter(status__in=OPEN_STATUSES).aggregate(**counts)
+
+        if user.is_superuser:
+            data.update(
                 {
                     "user_is_reviewer": False,
-                    "ready2i_allusers_total_count": ready2i_allusers_total_count,
-                    "ready2i_owner_total_count": ready2i_owner_total_count,
-                    "ready2i_owner_late": ready2i_owner_late,
-                    "ready2i_owner_onschedule": ready2i_owner_onschedule,
-                    "ready2i_all_onschedule_count": ready2i_all_onschedule_count,
+                    "ready2i_owner_late": self.get_page(
+                        applications.filter(owned, late, status=ApplicationStatus.READY_2I),
+                        data["ready2i_owner_late_count"],
+                        page_numbers.get("late_page"),
+                    ),
+                    "ready2i_owner_onschedule": self.get_page(
+                        applications.filter(owned, on_schedule, status=ApplicationStatus.READY_2I),
+                        data["ready2i_owner_onschedule_count"],
+                        page_numbers.get("onschedule_page"),
+                    ),
                 }
             )
         else:
-            inprogress_allusers_total_count = applications.filter(status=ApplicationStatus.IN_PROGRESS).count()
-            inprogress_owner_total_count = applications.filter(
-                status=ApplicationStatus.IN_PROGRESS,
-                owner=user,
-            ).count()
-            moreinfo_allusers_total_count = applications.filter(
-                status=ApplicationStatus.MORE_INFORMATION,
-            ).count()
-            moreinfo_owner_total_count = applications.filter(
-                status=ApplicationStatus.MORE_INFORMATION, owner=user
-            ).count()
-            moreinfo_owner_late = applications.filter(
-                status=ApplicationStatus.MORE_INFORMATION,
-                time_submitted__lt=seven_days_ago,
-                owner=user,
-            )
-            moreinfo_owner_onschedule = applications.filter(
-                status=ApplicationStatus.MORE_INFORMATION,
-                time_submitted__gte=seven_days_ago,
-                owner=user,
-            )
-            context.update(
+            data.update(
                 {
                     "user_is_reviewer": True,
-                    "inprogress_allusers_total_count": inprogress_allusers_total_count,
-                    "inprogress_owner_total_count": inprogress_owner_total_count,
-                    "moreinfo_allusers_total_count": moreinfo_allusers_total_count,
-                    "moreinfo_owner_total_count": moreinfo_owner_total_count,
-                    "moreinfo_owner_late": moreinfo_owner_late,
-                    "moreinfo_owner_onschedule": moreinfo_owner_onschedule,
+                    "new_allusers_total": self.get_page(
+                        applications.filter(status=ApplicationStatus.NEW),
+                        data["new_allusers_total_count"],
+                        page_numbers.get("new_page"),
+                    ),
+                    "moreinfo_owner_late": self.get_page(
+                        applications.filter(owned, late, status=ApplicationStatus.MORE_INFORMATION),
+                        data["moreinfo_owner_late_count"],
+                        page_numbers.get("late_page"),
+                    ),
+                    "moreinfo_owner_onschedule": self.get_page(
+                        applications.filter(owned, on_schedule, status=ApplicationStatus.MORE_INFORMATION),
+                        data["moreinfo_owner_onschedule_count"],
+                        page_numbers.get("onschedule_page"),
+                    ),
                 }
             )
 
+        cache.set(cache_key, data, DASHBOARD_CACHE_TIMEOUT)
+        return data
+
+    def get(self, request):
+        user = request.user
+        page_numbers = {
+            name: int(request.GET[name])
+            for name in ("new_page", "late_page", "onschedule_page")
+            if request.GET.get(name, "").isdigit()
+        }
+        context = admin.site.each_context(request)
+        context.update(
+            {
+                "username": user.username,
+                "userid": user.id,
+                "is_nav_sidebar_enabled": True,
+            }
+        )
+        context.update(self.get_dashboard_data(user, page_numbers))
         return render(request, "admin/dashboard.html", context)
 
 
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class RequestConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "request_a_govuk_domain.request"
+
+    def ready(self):
+        from . import scanning, signals  # noqa: F401
+
+        scanning.check_settings()
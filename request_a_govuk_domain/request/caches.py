@@ -0,0 +1,215 @@
+"""
+Caches for reference data that is read on most requests but rarely changes.
+
+Each cache keeps a snapshot of the data in the process, and a copy in the shared
+(Django "default") cache so a change made on one instance is picked up by every
+other instance. The shared cache holds a version token for each cache: invalidating
+the cache replaces the token, and a snapshot is only used while its version matches
+the current token.
+
+Without a shared cache, e.g. without REDIS_CACHE_URL, the "default" cache is local to the process, so an
+invalidation made by another process never reaches it. The version and data are then only kept for
+settings.LOCAL_REFERENCE_CACHE_TIMEOUT seconds, after which the data is read from the database again.
+"""
+
+import logging
+import threading
+import uuid
+from typing import Any, Callable, NamedTuple
+
+import markdown
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from .models.organisation import Registrar
+from .models.review import ReviewFormGuidance
+
+logger = logging.getLogger(__name__)
+
+
+def is_shared_cache(alias: str) -> bool:
+    """
+    :param alias: alias of a cache in settings.CACHES
+    :return: whether the cache is seen by every process, unlike the local memory cache
+    """
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+class VersionedCache:
+    """
+    A versioned snapshot of some reference data
+
+    :param name: name of the cache, used as the prefix of the shared cache keys
+    :param loader: callable building the snapshot from the database. The snapshot must be picklable
+        and treated as read-only by callers, as it is shared by every thread in the process.
+    :param cache_alias: alias of the shared cache in settings.CACHES
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any], cache_alias: str = "default"):
+        self.name = name
+        self.loader = loader
+        self.cache_alias = cache_alias
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self._snapshot: Any = None
+
+    @property
+    def shared_cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def timeout(self) -> int | None:
+        """
+        Seconds the version and data are kept in the shared cache, for as long as they are valid unless the
+        cache is local to the process
+        """
+        if is_shared_cache(self.cache_alias):
+            return None
+        return settings.LOCAL_REFERENCE_CACHE_TIMEOUT
+
+    @property
+    def version_key(self) -> str:
+        return f"{self.name}:version"
+
+    def data_key(self, version: str) -> str:
+        return f"{self.name}:data:{version}"
+
+    def current_version(self) -> str:
+        """
+        The version of the data in the shared cache, creating one if there is none yet
+        """
+        version = self.shared_cache.get(self.version_key)
+        if version is None:
+            self.shared_cache.add(self.version_key, uuid.uuid4().hex, timeout=self.timeout)
+            version = self.shared_cache.get(self.version_key)
+        return version
+
+    def get(self) -> Any:
+        """
+        Return the snapshot for the current version, loading it from the shared cache or the
+        database if the one held by this process is out of date
+        """
+        version = self.current_version()
+        with self._lock:
+            if self._version == version:
+                return self._snapshot
+
+        snapshot = self.shared_cache.get(self.data_key(version))
+        if snapshot is None:
+            logger.debug("Loading %s cache version %s", self.name, version)
+            snapshot = self.loader()
+            self.shared_cache.set(self.data_key(version), snapshot, timeout=self.timeout)
+
+        with self._lock:
+            self._version = version
+            self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self) -> None:
+        """
+        Start a new version, so every process reloads the data on its next read.
+
+        The version is replaced straight away so this process sees its own changes, and again once
+        the current transaction commits, so another process can't keep a snapshot it loaded while the
+        change was not yet visible to it.
+        """
+        self._new_version()
+        transaction.on_commit(self._new_version)
+
+    def _new_version(self) -> None:
+        self.shared_cache.set(self.version_key, uuid.uuid4().hex, timeout=self.timeout)
+        with self._lock:
+            self._version = None
+            self._snapshot = None
+
+
+class RegistrarEntry(NamedTuple):
+    id: int
+    name: str
+    active: bool
+
+
+class RegistrarSnapshot:
+    """
+    All the registrars, as read from the database at one point in time
+    """
+
+    def __init__(self, entries: list[RegistrarEntry]):
+        self.entries = tuple(entries)
+        self.by_id = {entry.id: entry for entry in self.entries}
+        self.choices = tuple((registrar_choice_value(entry.id), entry.name) for entry in self.entries if entry.active)
+
+
+def _load_registrars() -> RegistrarSnapshot:
+    return RegistrarSnapshot(
+        [RegistrarEntry(*values) for values in Registrar.objects.order_by("id").values_list("id", "name", "active")]
+    )
+
+
+registrar_cache = VersionedCache("registrars", _load_registrars)
+
+
+def registrar_choice_value(registrar_id: int) -> str:
+    """
+    The value used for a registrar in the registrar organisation choice field and the session
+    """
+    return f"registrar-{registrar_id}"
+
+
+def registrar_id_from_choice(value: str) -> int:
+    """
+    Registrar id from a registrar organisation choice value, e.g. "registrar-12" -> 12
+    """
+    return int(value.rsplit("-", 1)[1])
+
+
+def active_registrar_choices() -> tuple[tuple[str, str], ...]:
+    """
+    Choices for the registrar organisation field, one for each active registrar
+    """
+    return registrar_cache.get().choices
+
+
+def get_registrar(registrar_id: int) -> Registrar:
+    """
+    Return the registrar with the given id, without querying the database.
+
+    The returned instance can be used as a foreign key value, but is not fetched from the database
+    so should not be saved.
+
+    :param registrar_id: id of the registrar
+    :raises Registrar.DoesNotExist: if there is no registrar with this id
+    """
+    entry = registrar_cache.get().by_id.get(registrar_id)
+    if entry is None:
+        raise Registrar.DoesNotExist(f"Registrar matching id {registrar_id} does not exist.")
+    registrar = Registrar(id=entry.id, name=entry.name, active=entry.active)
+    registrar._state.adding = False
+    registrar._state.db = "default"
+    return registrar
+
+
+def _load_guidance() -> dict[str, str]:
+    return {
+        name: how_to_html or markdown.markdown(how_to)
+        for name, how_to, how_to_html in ReviewFormGuidance.objects.values_list("name", "how_to", "how_to_html")
+    }
+
+
+guidance_cache = VersionedCache("guidance", _load_guidance)
+
+
+def guidance_html(name: str) -> str:
+    """
+    The reviewer guidance for a section of the review form, as HTML
+
+    :param name: name of the guidance section, e.g. "registrar_details"
+    :raises ReviewFormGuidance.DoesNotExist: if there is no guidance with this name
+    """
+    try:
+        return guidance_cache.get()[name]
+    except KeyError:
+        raise ReviewFormGuidance.DoesNotExist(f"ReviewFormGuidance matching name {name} does not exist.")
@@ -0,0 +1,937 @@
+"""
+Client of the clamd virus scanner.
+
+Uploaded files are streamed to clamd with the INSTREAM command. Connections to clamd are kept open in
+a bounded pool, each running a clamd session (IDSESSION), so a burst of uploads reuses a few
+connections rather than opening one per file. clamd closes sessions idle for longer than its
+IdleTimeout, so connections idle for longer than settings.CLAMD_MAX_IDLE are closed rather than
+reused, and a scan failing on a reused connection is retried once on a new one.
+
+Scans can be shared by several clamd hosts, settings.CLAMD_HOSTS, see ClamdCluster: a slow or
+restarting host is ejected from the cluster until it answers health checks again.
+
+Registrars often upload the same file more than once, e.g. the same letter for several applications.
+The verdicts of clamd are kept in the shared cache for settings.CLAMD_VERDICT_CACHE_TIMEOUT seconds,
+keyed with the SHA-256 of the file and the version of the clamd signatures: a file already scanned is
+only scanned again once the signatures have been updated.
+
+The scanner of the process is given by get_scanner(), and keeps metrics of the scans. For tests and
+load tests without ClamAV, see fake_clamd.
+"""
+
+import hashlib
+import logging
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import IO, Iterator, NamedTuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class ClamdError(Exception):
+    """
+    clamd could not scan a file: it is unreachable, timed out, closed the connection or replied with an error
+    """
+
+
+class ClamdConnectionError(ClamdError):
+    """
+    The connection to clamd could not be opened, or was closed by clamd
+    """
+
+
+class ClamdBusyError(ClamdError):
+    """
+    All the connections to clamd are in use
+    """
+
+
+class ScanResult(NamedTuple):
+    infected: bool
+    # Name of the signature matched by an infected file
+    signature: str | None = None
+
+
+class ClamdConnection:
+    """
+    A connection to clamd running a session, in which commands are run one at a time
+
+    :param address: (host, port) of clamd
+    :param connect_timeout: seconds allowed to connect
+    :param timeout: seconds allowed for each read and write
+    """
+
+    def __init__(self, address: tuple[str, int], connect_timeout: float, timeout: float):
+        self.address = address
+        self.socket = socket.create_connection(address, timeout=connect_timeout)
+        self.socket.settimeout(timeout)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket.sendall(b"zIDSESSION\0")
+        self.request_id = 0
+        self.last_used = time.monotonic()
+        self._received = b""
+
+    def command(self, command: str) -> str:
+        """
+        Run a command without data, e.g. PING or VERSION
+
+        :return: the reply of clamd
+        """
+        self.socket.sendall(f"z{command}\0".encode())
+        return self._reply()
+
+    def instream(self, file: IO[bytes], chunk_size: int) -> str:
+        """
+        Stream a file to clamd to be scanned
+
+        :param file: the file, read from its current position
+        :param chunk_size: bytes sent at a time
+        :return: the reply of clamd, e.g. "stream: OK"
+        """
+        self.start_instream()
+        while chunk := file.read(chunk_size):
+            self.send_chunk(chunk)
+        return self.end_instream()
+
+    def start_instream(self):
+        """
+        Start streaming a file to clamd, to be sent with send_chunk then end_instream
+        """
+        self.socket.sendall(b"zINSTREAM\0")
+
+    def send_chunk(self, chunk: bytes):
+        self.socket.sendall(struct.pack("!L", len(chunk)) + chunk)
+
+    def end_instream(self) -> str:
+        """
+        :return: the reply of clamd to the file streamed, e.g. "stream: OK"
+        """
+        self.socket.sendall(struct.pack("!L", 0))
+        return self._reply()
+
+    def _reply(self) -> str:
+        while b"\0" not in self._received:
+            data = self.socket.recv(4096)
+            if not data:
+                raise ClamdConnectionError(f"clamd at {self.address[0]}:{self.address[1]} closed the connection")
+            self._received += data
+        reply, _, self._received = self._received.partition(b"\0")
+        self.request_id += 1
+        self.last_used = time.monotonic()
+        # Replies in a session are prefixed with the number of the command in the session
+        request_id, _, reply = reply.decode().partition(": ")
+        if request_id != str(self.request_id):
+            raise ClamdError(f"Unexpected reply from clamd: {request_id}: {reply}")
+        # clamd ends the session after an error, e.g. a stream over its StreamMaxLength
+        if reply.endswith(" ERROR"):
+            raise ClamdError(f"clamd could not run the command: {reply}")
+        return reply
+
+    def close(self):
+        try:
+            self.socket.sendall(b"zEND\0")
+        except OSError:
+            pass
+        self.socket.close()
+
+
+class ClamdPool:
+    """
+    A bounded pool of connections to one clamd host, shared by the threads of the process
+
+    :param address: (host, port) of clamd
+    :param size: maximum number of connections, in use or idle
+    :param connect_timeout: seconds allowed to connect
+    :param timeout: seconds allowed for each read and write, and to wait for a connection when they are all in use
+    :param max_idle: seconds after which an idle connection is closed rather than reused
+    :param metrics: metrics of the scans on the host, new ones by default
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        size: int,
+        connect_timeout: float,
+        timeout: float,
+        max_idle: float,
+        metrics: "ScanMetrics | None" = None,
+    ):
+        self.address = address
+        self.size = size
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: deque[ClamdConnection] = deque()
+        self.metrics = metrics or ScanMetrics()
+
+    def host_metrics(self, address: tuple[str, int]) -> "ScanMetrics":
+        return self.metrics
+
+    @contextmanager
+    def connection(self, reuse: bool = True, wait: bool = True) -> Iterator[tuple[ClamdConnection, bool]]:
+        """
+        A connection of the pool, put back in the pool at the end of the block unless the block fails
+
+        :param reuse: whether an idle connection may be used, rather than a new one
+        :param wait: whether to wait up to timeout for a connection when they are all in use
+        :return: the connection, and whether it was reused
+        :raises ClamdBusyError: if no connection is available
+        """
+        if not self._slots.acquire(timeout=self.timeout if wait else 0):
+            raise ClamdBusyError(f"No connection to clamd available after {self.timeout if wait else 0}s")
+        try:
+            connection = self._take_idle() if reuse else None
+            reused = connection is not None
+            if connection is None:
+                try:
+                    connection = ClamdConnection(self.address, self.connect_timeout, self.timeout)
+                except OSError as e:
+                    raise ClamdConnectionError(
+                        f"Could not connect to clamd at {self.address[0]}:{self.address[1]}: {e}"
+                    ) from e
+                self.metrics.record_connection(reused=False)
+            else:
+                self.metrics.record_connection(reused=True)
+            try:
+                yield connection, reused
+            except BaseException:
+                connection.close()
+                raise
+            with self._lock:
+                self._idle.append(connection)
+        finally:
+            self._slots.release()
+
+    def _take_idle(self) -> ClamdConnection | None:
+        expired = []
+        connection = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if time.monotonic() - candidate.last_used < self.max_idle:
+                    connection = candidate
+                    break
+                expired.append(candidate)
+            # The least recently used connections are the first ones
+            while self._idle and time.monotonic() - self._idle[0].last_used >= self.max_idle:
+                expired.append(self._idle.popleft())
+        for candidate in expired:
+            candidate.close()
+        return connection
+
+    def clear(self):
+        """
+        Close the idle connections
+        """
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for connection in idle:
+            connection.close()
+
+    def after_fork(self):
+        """
+        Forget the connections inherited from the parent process, without closing the parent's sessions
+        """
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle = deque()
+
+    def run(self, operation, retry: bool = True, wait: bool = True):
+        """
+        Run an operation on a connection, retrying it once on a new connection if a reused one fails,
+        as clamd may have closed it in the meantime
+
+        :param operation: callable given the connection
+        :param retry: whether the operation may be run again
+        :param wait: whether to wait for a connection when they are all in use, see connection
+        :return: the result of the operation
+        """
+        reused = False
+        try:
+            with self.connection(wait=wait) as (connection, reused):
+                return operation(connection)
+        except TimeoutError:
+            # clamd is slow rather than gone
+            raise
+        except (OSError, ClamdConnectionError):
+            if not (reused and retry):
+                raise
+        logger.info("Reused connection to clamd at %s:%s failed, retrying on a new one", *self.address)
+        with self.connection(reuse=False) as (connection, reused):
+            return operation(connection)
+
+
+class CircuitBreaker:
+    """
+    Ejects a clamd host after consecutive failures. An ejected host is sent one request again after
+    reset_timeout seconds, or once it answers a health check: the host is back if it succeeds, and ejected
+    again otherwise.
+
+    Not thread-safe, see ClamdCluster.
+
+    :param failure_threshold: consecutive failures after which the host is ejected
+    :param reset_timeout: seconds after which an ejected host is tried again
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def available(self) -> bool:
+        """
+        :return: whether a request may be sent to the host, see probe
+        """
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self.probing)
+
+    def probe(self):
+        """
+        Record that a request is sent to the host. A single request is sent to a half-open host until it
+        succeeds or fails.
+        """
+        if self.state == self.HALF_OPEN:
+            self.probing = True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.probing or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+
+class ClamdHost:
+    """
+    A clamd host of a cluster: its connection pool, circuit breaker, and requests in progress
+    """
+
+    def __init__(self, pool: ClamdPool, breaker: CircuitBreaker):
+        self.pool = pool
+        self.breaker = breaker
+        self.outstanding = 0
+        self.ping_ms: float | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.pool.address[0]}:{self.pool.address[1]}"
+
+
+class ClamdCluster:
+    """
+    Several clamd hosts, sharing the scans of the process.
+
+    Each request goes to the available host with the fewest requests in progress. A host failing to
+    connect or reply is ejected by its circuit breaker after failure_threshold consecutive failures, and
+    the request is sent to another host. Hosts are PINGed every health_check_interval seconds by a
+    background thread: a host failing the check counts a failure, and an ejected host answering it is
+    back in the cluster.
+
+    The cluster has the interface of a ClamdPool for ClamdScanner. Its metrics add up the metrics of its
+    hosts, see host_metrics.
+
+    :param pools: a connection pool for each host
+    :param failure_threshold: consecutive failures after which a host is ejected
+    :param reset_timeout: seconds after which an ejected host is tried again
+    :param health_check_interval: seconds between health checks, 0 for none
+    """
+
+    def __init__(
+        self,
+        pools: list[ClamdPool],
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        health_check_interval: float = 10.0,
+    ):
+        self.metrics = ScanMetrics()
+        self.hosts = []
+        for pool in pools:
+            pool.metrics.parent = self.metrics
+            self.hosts.append(ClamdHost(pool, CircuitBreaker(failure_threshold, reset_timeout)))
+        self.health_check_interval = health_check_interval
+        self._lock = threading.Lock()
+        self._next = 0
+        self._health_checks: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def host_metrics(self, address: tuple[str, int]) -> "ScanMetrics":
+        return next(host.pool.metrics for host in self.hosts if host.pool.address == address)
+
+    def _acquire_host(self, excluded: list[ClamdHost]) -> ClamdHost:
+        with self._lock:
+            available = [host for host in self.hosts if host not in excluded and host.breaker.available()]
+            if not available:
+                raise ClamdConnectionError("No clamd host available")
+            # Ties go to the hosts in turn
+            self._next = (self._next + 1) % len(self.hosts)
+            host = min(
+                available,
+                key=lambda host: (host.outstanding, (self.hosts.index(host) - self._next) % len(self.hosts)),
+            )
+            host.breaker.probe()
+            host.outstanding += 1
+        return host
+
+    def _release_host(self, host: ClamdHost, failed: bool | None):
+        """
+        :param failed: whether the host failed, None if the request ended without telling, e.g. on a reply
+            with an error
+        """
+        with self._lock:
+            host.outstanding -= 1
+            if failed:
+                host.breaker.record_failure()
+                if host.breaker.state != CircuitBreaker.CLOSED:
+                    logger.warning("clamd at %s ejected after %s failures", host.name, host.breaker.failures)
+            elif failed is not None:
+                host.breaker.record_success()
+
+    @contextmanager
+    def connection(self, wait: bool = True) -> Iterator[tuple[ClamdConnection, bool]]:
+        """
+        A connection to the least busy available host, for operations which cannot be run again on
+        another host, see ClamdPool.connection
+        """
+        self._start_health_checks()
+        host = self._acquire_host([])
+        failed = None
+        try:
+            with host.pool.connection(wait=wait) as (connection, reused):
+                yield connection, reused
+            failed = False
+        except (OSError, ClamdConnectionError):
+            failed = True
+            raise
+        finally:
+            self._release_host(host, failed)
+
+    def run(self, operation, retry: bool = True, wait: bool = True):
+        """
+        Run an operation on a connection to the least busy available host, and on other hosts while
+        they fail if the operation may be run again
+
+        :param operation: callable given the connection
+        :param retry: whether the operation may be run again
+        :param wait: whether to wait for a connection when they are all in use, see ClamdPool.connection
+        :return: the result of the operation
+        """
+        self._start_health_checks()
+        tried = []
+        while True:
+            host = self._acquire_host(tried)
+            tried.append(host)
+            failed = None
+            try:
+                result = host.pool.run(operation, retry, wait)
+                failed = False
+                return result
+            except (OSError, ClamdConnectionError) as e:
+                failed = True
+                if not retry or len(tried) == len(self.hosts):
+                    raise
+                logger.info("clamd at %s failed, trying another host: %s", host.name, e)
+            finally:
+                self._release_host(host, failed)
+
+    def check_health(self):
+        """
+        PING every host, on a new connection so that a health check never waits for the pool
+        """
+        for host in self.hosts:
+            start = time.perf_counter()
+            try:
+                connection = ClamdConnection(host.pool.address, host.pool.connect_timeout, host.pool.connect_timeout)
+                try:
+                    healthy = connection.command("PING") == "PONG"
+                finally:
+                    connection.close()
+            except (OSError, ClamdError):
+                healthy = False
+            with self._lock:
+                if healthy:
+                    host.ping_ms = (time.perf_counter() - start) * 1000
+                    if host.breaker.state != CircuitBreaker.CLOSED:
+                        logger.info("clamd at %s is healthy again", host.name)
+                    host.breaker.record_success()
+                else:
+                    host.ping_ms = None
+                    host.breaker.record_failure()
+
+    def _start_health_checks(self):
+        if not self.health_check_interval or self._health_checks is not None:
+            return
+        with self._lock:
+            if self._health_checks is None:
+                self._stop = threading.Event()
+                self._health_checks = threading.Thread(
+                    target=self._run_health_checks, args=(self._stop,), name="clamd-health-checks", daemon=True
+                )
+                self._health_checks.start()
+
+    def _run_health_checks(self, stop: threading.Event):
+        while not stop.wait(self.health_check_interval):
+            self.check_health()
+
+    def snapshot(self) -> dict:
+        """
+        :return: the metrics of the cluster, with the metrics, state and latest PING latency of each host
+        """
+        snapshot = self.metrics.snapshot()
+        snapshot["hosts"] = {
+            host.name: host.pool.metrics.snapshot()
+            | {"state": host.breaker.state, "outstanding": host.outstanding, "ping_ms": host.ping_ms}
+            for host in self.hosts
+        }
+        return snapshot
+
+    def clear(self):
+        """
+        Close the idle connections, and stop the health checks until the next request
+        """
+        self._stop.set()
+        self._health_checks = None
+        for host in self.hosts:
+            host.pool.clear()
+
+    def after_fork(self):
+        """
+        Forget the connections and health check thread inherited from the parent process
+        """
+        self._lock = threading.Lock()
+        self._health_checks = None
+        for host in self.hosts:
+            host.outstanding = 0
+            host.pool.after_fork()
+
+
+class ScanMetrics:
+    """
+    Counters of the scans, verdict cache lookups and connections of a pool, shared by the threads of
+    the process. Scans answered by the verdict cache are not counted as scans.
+    """
+
+    # Upper bounds of the latency histogram, in milliseconds
+    LATENCY_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+    def __init__(self, parent: "ScanMetrics | None" = None):
+        """
+        :param parent: metrics also counting the scans and connections, e.g. of the cluster of a host
+        """
+        self._lock = threading.Lock()
+        self.parent = parent
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.scans = 0
+            self.infected = 0
+            self.errors = 0
+            self.bytes = 0
+            self.latency_total = 0.0
+            self.latency_max = 0.0
+            self.latency_histogram = [0] * len(self.LATENCY_BUCKETS)
+            self.connections_opened = 0
+            self.connections_reused = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def record_cache(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def record_connection(self, reused: bool):
+        with self._lock:
+            if reused:
+                self.connections_reused += 1
+            else:
+                self.connections_opened += 1
+        if self.parent is not None:
+            self.parent.record_connection(reused)
+
+    def record_scan(self, seconds: float, size: int, result: ScanResult | None):
+        """
+        :param seconds: time taken by the scan
+        :param size: bytes scanned
+        :param result: result of the scan, None if it failed
+        """
+        milliseconds = seconds * 1000
+        with self._lock:
+            self.scans += 1
+            self.bytes += size
+            if result is None:
+                self.errors += 1
+            elif result.infected:
+                self.infected += 1
+            self.latency_total += milliseconds
+            self.latency_max = max(self.latency_max, milliseconds)
+            self.latency_histogram[next(i for i, b in enumerate(self.LATENCY_BUCKETS) if milliseconds <= b)] += 1
+        if self.parent is not None:
+            self.parent.record_scan(seconds, size, result)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """
+        :param percentile: e.g. 95
+        :return: upper bound in milliseconds of the histogram bucket holding the percentile, None without scans
+        """
+        with self._lock:
+            if not self.scans:
+                return None
+            threshold = self.scans * percentile / 100
+            seen = 0
+            for bound, count in zip(self.LATENCY_BUCKETS, self.latency_histogram):
+                seen += count
+                if seen >= threshold:
+                    return bound
+        return None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            snapshot = {
+                "scans": self.scans,
+                "infected": self.infected,
+                "errors": self.errors,
+                "bytes": self.bytes,
+                "latency_mean_ms": self.latency_total / self.scans if self.scans else None,
+                "latency_max_ms": self.latency_max,
+                "connections_opened": self.connections_opened,
+                "connections_reused": self.connections_reused,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "cache_hit_rate": (
+                    self.cache_hits / (self.cache_hits + self.cache_misses)
+                    if self.cache_hits + self.cache_misses
+                    else None
+                ),
+            }
+        snapshot["latency_p50_ms"] = self.latency_percentile(50)
+        snapshot["latency_p95_ms"] = self.latency_percentile(95)
+        return snapshot
+
+
+class ScanVerdictCache:
+    """
+    Verdicts of clamd, by SHA-256 of the scanned files and version of the signatures
+
+    :param timeout: seconds a verdict is kept
+    :param cache_alias: alias of the shared cache in settings.CACHES
+    """
+
+    def __init__(self, timeout: int, cache_alias: str = "default"):
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+
+    @staticmethod
+    def key(digest: str, signature_version: str) -> str:
+        return f"scan-verdict:{signature_version}:{digest}"
+
+    def get(self, digest: str, signature_version: str) -> ScanResult | None:
+        verdict = caches[self.cache_alias].get(self.key(digest, signature_version))
+        return None if verdict is None else ScanResult(*verdict)
+
+    def set(self, digest: str, signature_version: str, result: ScanResult):
+        caches[self.cache_alias].set(self.key(digest, signature_version), tuple(result), self.timeout)
+
+
+class ClamdScanner:
+    """
+    Scans files with clamd through a connection pool
+
+    :param pool: the pool of connections to clamd, or a cluster of clamd hosts
+    :param chunk_size: bytes sent to clamd at a time
+    :param verdict_cache: cache of the verdicts by content, None to scan every file
+    :param version_check_interval: seconds the version of the signatures is cached for, see signature_version
+    """
+
+    def __init__(
+        self,
+        pool: ClamdPool | ClamdCluster,
+        chunk_size: int,
+        verdict_cache: ScanVerdictCache | None = None,
+        version_check_interval: float = 60.0,
+    ):
+        self.pool = pool
+        self.chunk_size = chunk_size
+        self.verdict_cache = verdict_cache
+        self.version_check_interval = version_check_interval
+        self._signature_version: tuple[float, str] | None = None
+
+    @property
+    def metrics(self) -> ScanMetrics:
+        return self.pool.metrics
+
+    def scan(self, file: IO[bytes]) -> ScanResult:
+        """
+        Scan a file, from its start if it can seek. A file which can seek is looked up in the verdict
+        cache first, and only sent to clamd if it was not scanned with the current signatures.
+
+        :param file: the file
+        :return: the result of the scan
+        :raises ClamdError: if clamd could not scan the file
+        """
+        if self.verdict_cache is None or not hasattr(file, "seek"):
+            return self._instream(file)
+        digest = self._digest(file)
+        signature_version = self.signature_version()
+        result = self.verdict_cache.get(digest, signature_version)
+        self.metrics.record_cache(hit=result is not None)
+        if result is not None:
+            logger.info("Scan verdict of %s found in the cache: %s", digest, result.signature or "clean")
+            return result
+        result = self._instream(file)
+        self.verdict_cache.set(digest, signature_version, result)
+        return result
+
+    def _digest(self, file: IO[bytes]) -> str:
+        sha256 = hashlib.sha256()
+        file.seek(0)
+        while chunk := file.read(self.chunk_size):
+            sha256.update(chunk)
+        file.seek(0)
+        return sha256.hexdigest()
+
+    def signature_version(self, wait: bool = True) -> str:
+        """
+        :param wait: whether to wait for a connection to clamd when they are all in use, see ClamdPool.connection
+        :return: the version of the signatures of clamd, e.g. "27301", asked to clamd at most once per
+            version_check_interval
+        """
+        cached = self._signature_version
+        if cached is not None and time.monotonic() - cached[0] < self.version_check_interval:
+            return cached[1]
+        # "ClamAV <engine version>/<signatures version>/<signatures date>", without the signatures if none are loaded
+        version = self.version(wait).split("/")
+        signature_version = version[1] if len(version) > 1 else version[0]
+        self._signature_version = (time.monotonic(), signature_version)
+        return signature_version
+
+    def _instream(self, file: IO[bytes]) -> ScanResult:
+        seekable = hasattr(file, "seek")
+        start = time.perf_counter()
+        size = 0
+        address = None
+
+        def instream(connection: ClamdConnection) -> str:
+            nonlocal size, address
+            address = connection.address
+            if seekable:
+                file.seek(0)
+            counting = _CountingReader(file)
+            try:
+                return connection.instream(counting, self.chunk_size)
+            finally:
+                size = counting.size
+
+        result = None
+        try:
+            # A file which cannot seek cannot be sent again
+            reply = self.pool.run(instream, retry=seekable)
+            result = self._parse(reply)
+            return result
+        finally:
+            if seekable:
+                file.seek(0)
+            self._record_scan(address, time.perf_counter() - start, size, result)
+
+    @contextmanager
+    def stream(self, wait: bool = True) -> Iterator["ScanStream"]:
+        """
+        Scan a file written a chunk at a time, e.g. as it is uploaded, rather than read from a file.
+        A stream which is not finished, see ScanStream.result, is abandoned, closing its connection.
+
+        :param wait: whether to wait for a connection to clamd when they are all in use, see ClamdPool.connection
+        """
+        try:
+            with self.pool.connection(wait=wait) as (connection, reused):
+                stream = ScanStream(self, connection)
+                yield stream
+                if not stream.finished:
+                    # The connection is in the middle of a command, so cannot be reused
+                    raise _AbandonedStream()
+        except _AbandonedStream:
+            pass
+
+    def _record_scan(self, address: tuple[str, int] | None, seconds: float, size: int, result: ScanResult | None):
+        # Counted by the host which scanned the file last, and by the cluster
+        metrics = self.metrics if address is None else self.pool.host_metrics(address)
+        metrics.record_scan(seconds, size, result)
+        logger.info(
+            "Scanned %s bytes in %.1f ms: %s",
+            size,
+            seconds * 1000,
+            "failed" if result is None else result.signature or "clean",
+        )
+
+    def version(self, wait: bool = True) -> str:
+        """
+        :param wait: whether to wait for a connection to clamd when they are all in use, see ClamdPool.connection
+        :return: the version of clamd and of its signatures, e.g. "ClamAV 1.0.5/27301/Mon Jun 10 08:25:41 2024"
+        """
+        return self.pool.run(lambda connection: connection.command("VERSION"), wait=wait)
+
+    def ping(self) -> bool:
+        return self.pool.run(lambda connection: connection.command("PING")) == "PONG"
+
+    @staticmethod
+    def _parse(reply: str) -> ScanResult:
+        # "stream: OK" or "stream: <signature> FOUND"
+        if reply.endswith(" FOUND"):
+            return ScanResult(infected=True, signature=reply.removeprefix("stream: ").removesuffix(" FOUND"))
+        if reply == "stream: OK":
+            return ScanResult(infected=False)
+        raise ClamdError(f"Unexpected reply from clamd: {reply}")
+
+
+class ScanStream:
+    """
+    A file streamed to clamd a chunk at a time, see ClamdScanner.stream
+    """
+
+    def __init__(self, scanner: ClamdScanner, connection: ClamdConnection):
+        self.scanner = scanner
+        self.connection = connection
+        self.size = 0
+        self.finished = False
+        self._start = time.perf_counter()
+        connection.start_instream()
+
+    def write(self, data: bytes):
+        for offset in range(0, len(data), self.scanner.chunk_size):
+            self.connection.send_chunk(data[offset : offset + self.scanner.chunk_size])
+        self.size += len(data)
+
+    def result(self) -> ScanResult:
+        """
+        Finish the stream
+
+        :return: the result of the scan of the data written
+        :raises ClamdError: if clamd could not scan the data
+        """
+        result = None
+        try:
+            reply = self.connection.end_instream()
+            self.finished = True
+            result = self.scanner._parse(reply)
+            return result
+        finally:
+            self.scanner._record_scan(self.connection.address, time.perf_counter() - self._start, self.size, result)
+
+
+class _AbandonedStream(Exception):
+    pass
+
+
+class _CountingReader:
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        self.size = 0
+
+    def read(self, size: int) -> bytes:
+        data = self.file.read(size)
+        self.size += len(data)
+        return data
+
+
+_scanner: ClamdScanner | None = None
+_scanner_lock = threading.Lock()
+
+
+def clamd_hosts() -> list[tuple[str, int]]:
+    """
+    :return: the clamd hosts of settings.CLAMD_HOSTS, or the host of settings.CLAMD_TCP_ADDR
+    """
+    if not settings.CLAMD_HOSTS:
+        return [(settings.CLAMD_TCP_ADDR, settings.CLAMD_TCP_SOCKET)]
+    hosts = []
+    for host in settings.CLAMD_HOSTS:
+        name, _, port = host.rpartition(":")
+        hosts.append((name, int(port)) if name else (port, settings.CLAMD_TCP_SOCKET))
+    return hosts
+
+
+def get_scanner() -> ClamdScanner:
+    """
+    :return: the scanner of the process, configured by the CLAMD_ settings
+    """
+    global _scanner
+    if _scanner is None:
+        with _scanner_lock:
+            if _scanner is None:
+                cluster = ClamdCluster(
+                    [
+                        ClamdPool(
+                            address,
+                            size=settings.CLAMD_POOL_SIZE,
+                            connect_timeout=settings.CLAMD_CONNECT_TIMEOUT,
+                            timeout=settings.CLAMD_TIMEOUT,
+                            max_idle=settings.CLAMD_MAX_IDLE,
+                        )
+                        for address in clamd_hosts()
+                    ],
+                    failure_threshold=settings.CLAMD_FAILURE_THRESHOLD,
+                    reset_timeout=settings.CLAMD_EJECT_SECONDS,
+                    health_check_interval=settings.CLAMD_HEALTH_CHECK_INTERVAL,
+                )
+                _scanner = ClamdScanner(
+                    cluster,
+                    chunk_size=settings.CLAMD_CHUNK_SIZE,
+                    verdict_cache=(
+                        ScanVerdictCache(settings.CLAMD_VERDICT_CACHE_TIMEOUT)
+                        if settings.CLAMD_VERDICT_CACHE_TIMEOUT
+                        else None
+                    ),
+                    version_check_interval=settings.CLAMD_VERSION_CHECK_INTERVAL,
+                )
+    return _scanner
+
+
+def reset_scanner():
+    """
+    Close the connections of the scanner of the process, and configure a new one from the settings on next use
+    """
+    global _scanner
+    with _scanner_lock:
+        if _scanner is not None:
+            _scanner.pool.clear()
+        _scanner = None
+
+
+def _after_fork():
+    global _scanner_lock
+    _scanner_lock = threading.Lock()
+    if _scanner is not None:
+        _scanner.pool.after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork)
@@ -13,12 +13,12 @@ from request_a_govuk_domain.request.models import (
     Application,
     Registrant,
     RegistrantPerson,
-    Registrar,
     RegistrarPerson,
     RegistryPublishedPerson,
     Review,
 )
 
+from .caches import get_registrar, registrar_id_from_choice
 from .models.storage_util import select_storage
 from .utils import get_registration_data, is_valid_session_data, route_number
 
@@ -115,7 +115,7 @@ def save_data_in_database(reference, request):
 
     try:
         with transaction.atomic():
-            registrar_org = Registrar.objects.get(id=int(registration_data["registrar_organisation"].split("-")[1]))
+            registrar_org = get_registrar(registrar_id_from_choice(registration_data["registrar_organisation"]))
             registrar_person, _ = RegistrarPerson.objects.get_or_create(
                 registrar=registrar_org,
                 name=registration_data["registrar_name"],
@@ -140,8 +140,6 @@ def save_data_in_database(reference, request):
                 type=registration_data["registrant_type"],
             )
 
-            registrar_org = Registrar.objects.get(id=int(registration_data["registrar_organisation"].split("-")[1]))
-
             application = Application.objects.create(
                 reference=reference,
                 domain_name=registration_data["domain_name"],
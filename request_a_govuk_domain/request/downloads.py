@@ -0,0 +1,109 @@
+"""
+Responses for the downloads of the evidence files.
+
+Files on S3 are downloaded from S3 directly: the view checks the user may read the file, then
+redirects to a presigned URL of the file, valid for settings.FILE_DOWNLOAD_URL_EXPIRY seconds. The
+worker is not tied up for the transfer, and S3 serves range requests.
+
+Files on the file system can be handed over to the web server in front of the app, with
+settings.FILE_DOWNLOAD_SENDFILE: the view checks the user may read the file, then returns an empty
+response with an X-Accel-Redirect (nginx) or X-Sendfile (Apache, lighttpd) header naming the file,
+which the web server sends itself, handling ranges and ETags. With nginx, the files must be served by
+an internal location at settings.FILE_DOWNLOAD_SENDFILE_URL, e.g.
+
+    location /protected-media/ {
+        internal;
+        alias /path/to/MEDIA_ROOT/;
+    }
+
+Other storages, and the "proxy" settings.FILE_DOWNLOAD_MODE, stream the file through the worker.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage, Storage
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect
+from django.utils.http import content_disposition_header
+from storages.backends.s3boto3 import S3Boto3Storage
+
+logger = logging.getLogger(__name__)
+
+# Presigned URLs are cached until this many seconds before they expire, so a cached URL is always
+# valid long enough for the browser to follow the redirect
+URL_EXPIRY_MARGIN = 60
+
+# Values of settings.FILE_DOWNLOAD_SENDFILE
+X_ACCEL_REDIRECT = "x-accel-redirect"
+X_SENDFILE = "x-sendfile"
+
+
+def presigned_url(storage: S3Boto3Storage, name: str, filename: str) -> str:
+    """
+    A presigned URL of a file, cached in the default cache for most of its validity
+
+    :param storage: the storage of the file
+    :param name: name of the file in the storage
+    :param filename: file name given to the browser
+    :return: the URL
+    """
+    digest = hashlib.sha256(f"{storage.bucket_name}\0{storage.location}\0{name}\0{filename}".encode())
+    key = f"presigned-url:{digest.hexdigest()}"
+    url = cache.get(key)
+    if url is None:
+        expiry = settings.FILE_DOWNLOAD_URL_EXPIRY
+        content_type, _ = mimetypes.guess_type(filename)
+        url = storage.url(
+            name,
+            parameters={
+                "ResponseContentDisposition": content_disposition_header(False, filename),
+                "ResponseContentType": content_type or "application/octet-stream",
+            },
+            expire=expiry,
+        )
+        cache.set(key, url, max(expiry - URL_EXPIRY_MARGIN, 0))
+    return url
+
+
+def file_download_response(storage: Storage, name: str, filename: str | None = None) -> HttpResponse:
+    """
+    Response downloading a file, to return once the user is known to be allowed to read it
+
+    :param storage: the storage of the file
+    :param name: name of the file in the storage
+    :param filename: file name given to the browser, the base name of the file by default
+    :return: a redirect to S3, or a response streaming the file
+    """
+    filename = filename or os.path.basename(name)
+    if isinstance(storage, S3Boto3Storage) and settings.FILE_DOWNLOAD_MODE == "redirect":
+        return HttpResponseRedirect(presigned_url(storage, name, filename))
+    if isinstance(storage, FileSystemStorage) and settings.FILE_DOWNLOAD_SENDFILE:
+        return sendfile_response(storage, name, filename)
+    return FileResponse(storage.open(name, "rb"), filename=filename)
+
+
+def sendfile_response(storage: FileSystemStorage, name: str, filename: str) -> HttpResponse:
+    """
+    Empty response asking the web server to send a file, see settings.FILE_DOWNLOAD_SENDFILE
+
+    :param storage: the storage of the file
+    :param name: name of the file in the storage
+    :param filename: file name given to the browser
+    :return: the response
+    """
+    # Raises SuspiciousFileOperation if the name is outside the storage
+    path = storage.path(name)
+    content_type, _ = mimetypes.guess_type(filename)
+    response = HttpResponse(content_type=content_type or "application/octet-stream")
+    response["Content-Disposition"] = content_disposition_header(False, filename)
+    if settings.FILE_DOWNLOAD_SENDFILE == X_ACCEL_REDIRECT:
+        relative_path = os.path.relpath(path, storage.location).replace(os.sep, "/")
+        response["X-Accel-Redirect"] = quote(settings.FILE_DOWNLOAD_SENDFILE_URL + relative_path)
+    else:
+        response["X-Sendfile"] = path
+    return response
@@ -0,0 +1,140 @@
+"""
+A stand-in for clamd, for tests and load tests of the scanner without ClamAV.
+
+It speaks enough of the clamd protocol for the scanner: PING, VERSION, INSTREAM, and sessions with
+IDSESSION and END, with commands terminated by a NUL ("z" prefix) or a newline ("n" prefix). A stream
+is infected if it contains the EICAR test signature. Latency and failures can be injected while it runs.
+"""
+
+import socketserver
+import struct
+import threading
+import time
+
+EICAR_SIGNATURE = b"EICAR-STANDARD-ANTIVIRUS-TEST-FILE"
+FAKE_CLAMD_VERSION = "ClamAV 1.0.0/27000/Thu Jan  1 00:00:00 2026"
+
+
+class FakeClamdHandler(socketserver.BaseRequestHandler):
+    server: "FakeClamd"
+
+    def handle(self):
+        self.server.record("connections")
+        reader = self.request.makefile("rb")
+        session_id = None
+        while True:
+            command = self.read_command(reader)
+            if command is None:
+                return
+            name, terminator = command
+            if name == "IDSESSION":
+                session_id = 0
+                continue
+            if name == "END":
+                return
+            if self.server.drop_connections:
+                self.server.record("dropped")
+                return
+            if name == "INSTREAM":
+                reply = self.instream(reader)
+                if reply is None:
+                    return
+            elif name == "PING":
+                reply = "PONG"
+            elif name == "VERSION":
+                reply = self.server.version
+            else:
+                reply = "UNKNOWN COMMAND"
+            self.server.record("commands")
+            time.sleep(self.server.latency)
+            if session_id is not None:
+                session_id += 1
+                reply = f"{session_id}: {reply}"
+            self.request.sendall(reply.encode() + terminator)
+            if session_id is None or reply.endswith("ERROR"):
+                return
+
+    @staticmethod
+    def read_command(reader) -> tuple[str, bytes] | None:
+        prefix = reader.read(1)
+        if not prefix:
+            return None
+        terminator = b"\0" if prefix == b"z" else b"\n"
+        command = b"" if prefix in b"zn" else prefix
+        while (byte := reader.read(1)) not in (terminator, b""):
+            command += byte
+        return command.decode(), terminator
+
+    def instream(self, reader) -> str | None:
+        stream = b""
+        while True:
+            header = reader.read(4)
+            if len(header) < 4:
+                # The client closed the connection, abandoning the stream
+                return None
+            (length,) = struct.unpack("!L", header)
+            if not length:
+                break
+            stream += reader.read(length)
+            if len(stream) > self.server.max_stream_length:
+                return "INSTREAM size limit exceeded. ERROR"
+        self.server.record("scans")
+        return "stream: Eicar-Test-Signature FOUND" if EICAR_SIGNATURE in stream else "stream: OK"
+
+
+class FakeClamd(socketserver.ThreadingTCPServer):
+    """
+    A fake clamd server, listening on localhost once created
+
+    :param port: port to listen to, any free port by default, see address
+    :param latency: seconds waited before each reply
+    :param version: reply to VERSION
+    :param max_stream_length: largest stream accepted by INSTREAM
+    :param drop_connections: whether to close connections on commands rather than reply, as a failing clamd
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        version: str = FAKE_CLAMD_VERSION,
+        max_stream_length: int = 25 * 1024 * 1024,
+        drop_connections: bool = False,
+    ):
+        super().__init__(("127.0.0.1", port), FakeClamdHandler)
+        self.latency = latency
+        self.version = version
+        self.max_stream_length = max_stream_length
+        self.drop_connections = drop_connections
+        self._lock = threading.Lock()
+        self.counts = {"connections": 0, "commands": 0, "scans": 0, "dropped": 0}
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.server_address[:2]
+
+    def record(self, counter: str):
+        with self._lock:
+            self.counts[counter] += 1
+
+    def start(self) -> "FakeClamd":
+        """
+        Serve in a background thread
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeClamd":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
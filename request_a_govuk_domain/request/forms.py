@@ -10,7 +10,8 @@ from django.core.validators import EmailValidator
 from django.template.defaultfilters import filesizeformat
 
 from ..layout.content import DomainsHTML
-from .models.organisation import RegistrantTypeChoices, Registrar
+from .caches import active_registrar_choices
+from .models.organisation import RegistrantTypeChoices
 from .utils import validate_file_infection
 from .validators import PhoneNumberValidator
 
@@ -64,11 +65,7 @@ class RegistrarDetailsForm(forms.Form):
         self.change = kwargs.pop("change", None)
         super().__init__(*args, **kwargs)
 
-        registrar_organisations = [("", "")] + list(
-            (f"registrar-{registrar.id}", registrar.name) for registrar in Registrar.objects.filter(active=True)
-        )
-
-        self.fields["registrar_organisation"].choices = registrar_organisations
+        self.fields["registrar_organisation"].choices = [("", "")] + list(active_registrar_choices())
 
         self.helper = FormHelper()
         self.helper.label_size = Size.SMALL
@@ -372,6 +369,9 @@ class UploadForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if settings.CLAMD_SCAN_ASYNC:
+            # The file is scanned once stored, see scanning
+            self.fields["file"].validators = []
         self.helper = FormHelper()
         self.helper.layout = Layout(
             Fieldset(
@@ -0,0 +1,144 @@
+"""
+Calendar of England and Wales bank holidays, used to count business days.
+
+The holidays are stored in the BankHoliday table, which is refreshed from gov.uk by a Celery
+beat task. Reading the calendar never calls gov.uk: each process keeps a snapshot of the table,
+and if the table has not been populated yet the dataset bundled with the app is used instead.
+A refresh reaches the web processes straight away with a shared cache, and otherwise within
+settings.LOCAL_REFERENCE_CACHE_TIMEOUT seconds, see caches.
+"""
+
+import datetime
+import functools
+import json
+import logging
+import os
+from typing import Sequence
+
+import numpy as np
+import requests
+from django.db import transaction
+
+from .caches import VersionedCache
+from .models.bank_holiday import BankHoliday
+
+logger = logging.getLogger(__name__)
+
+BANK_HOLIDAYS_URL = "https://www.gov.uk/bank-holidays.json"
+BANK_HOLIDAYS_DIVISION = "england-and-wales"
+BANK_HOLIDAYS_FETCH_TIMEOUT = 10
+
+SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
+FALLBACK_BANK_HOLIDAYS_PATH = os.path.join(SCRIPT_PATH, "bank_holidays", f"{BANK_HOLIDAYS_DIVISION}.json")
+
+
+def parse_bank_holidays(data: dict) -> dict[datetime.date, str]:
+    """
+    Extract the England and Wales bank holidays from data in the format of
+    https://www.gov.uk/bank-holidays.json
+
+    :param data: the decoded json
+    :return: the title of each bank holiday, keyed by date
+    """
+    return {
+        datetime.date.fromisoformat(event["date"]): event["title"] for event in data[BANK_HOLIDAYS_DIVISION]["events"]
+    }
+
+
+def fallback_bank_holidays() -> dict[datetime.date, str]:
+    """
+    The bank holidays bundled with the app, used until the table has been populated
+    """
+    with open(FALLBACK_BANK_HOLIDAYS_PATH, "r") as file:
+        return parse_bank_holidays(json.load(file))
+
+
+def fetch_bank_holidays() -> dict[datetime.date, str]:
+    """
+    Fetch the current list of bank holidays from gov.uk
+
+    :raises requests.RequestException: if gov.uk could not be reached
+    """
+    response = requests.get(BANK_HOLIDAYS_URL, timeout=BANK_HOLIDAYS_FETCH_TIMEOUT)
+    response.raise_for_status()
+    return parse_bank_holidays(response.json())
+
+
+def _load_bank_holidays() -> tuple[datetime.date, ...]:
+    dates = tuple(BankHoliday.objects.order_by("date").values_list("date", flat=True))
+    if not dates:
+        logger.info("No bank holidays stored yet, using the bundled list")
+        dates = tuple(sorted(fallback_bank_holidays()))
+    return dates
+
+
+bank_holiday_cache = VersionedCache("bank_holidays", _load_bank_holidays)
+
+
+def bank_holidays() -> tuple[datetime.date, ...]:
+    """
+    The dates of the England and Wales bank holidays, in ascending order
+    """
+    return bank_holiday_cache.get()
+
+
+@functools.lru_cache(maxsize=1)
+def _business_day_calendar(holidays: tuple[datetime.date, ...]) -> np.busdaycalendar:
+    return np.busdaycalendar(weekmask="1111100", holidays=np.array(holidays, dtype="datetime64[D]"))
+
+
+def business_days_between(
+    starts: Sequence[datetime.datetime | None], ends: Sequence[datetime.datetime | None]
+) -> list[int]:
+    """
+    Count the business days between pairs of timestamps, not counting the start day.
+
+    Weekends and bank holidays are not business days. The count is 0 when either timestamp is
+    missing, when they are equal, or when the end is before the start.
+
+    :param starts: start of each period, e.g. the submission times of a page of applications
+    :param ends: end of each period, in the same order as starts
+    :return: number of business days in each period
+    """
+    if len(starts) != len(ends):
+        raise ValueError("starts and ends must be the same length")
+    counts = np.zeros(len(starts), dtype=np.int64)
+    valid = np.array([s is not None and e is not None and s != e for s, e in zip(starts, ends)], dtype=bool)
+    if valid.any():
+        start_days = np.array([s.date() for s, v in zip(starts, valid) if v], dtype="datetime64[D]")
+        end_days = np.array([e.date() for e, v in zip(ends, valid) if v], dtype="datetime64[D]")
+        # Counting up to and including the end day, then not counting the start day
+        counted = np.busday_count(start_days, end_days + 1, busdaycal=_business_day_calendar(bank_holidays())) - 1
+        counts[valid] = np.maximum(counted, 0)
+    return counts.tolist()
+
+
+def save_bank_holidays(holidays: dict[datetime.date, str]) -> None:
+    """
+    Replace the stored bank holidays
+
+    :param holidays: the title of each bank holiday, keyed by date
+    """
+    with transaction.atomic():
+        BankHoliday.objects.all().delete()
+        BankHoliday.objects.bulk_create(BankHoliday(date=date, title=title) for date, title in holidays.items())
+        bank_holiday_cache.invalidate()
+
+
+def refresh_bank_holidays() -> None:
+    """
+    Update the stored bank holidays from gov.uk.
+
+    If gov.uk can't be reached the stored holidays are kept, so business days are still counted
+    with the last known calendar.
+    """
+    try:
+        holidays = fetch_bank_holidays()
+    except (requests.RequestException, ValueError, KeyError) as e:
+        logger.error("Error fetching bank holidays from %s, keeping the stored list: %s", BANK_HOLIDAYS_URL, e)
+        return
+    if not holidays:
+        logger.error("No bank holidays returned by %s, keeping the stored list", BANK_HOLIDAYS_URL)
+        return
+    save_bank_holidays(holidays)
+    logger.info("Stored %d bank holidays", len(holidays))
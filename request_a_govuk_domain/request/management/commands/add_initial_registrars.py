@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 
 from request_a_govuk_domain.request import models
+from request_a_govuk_domain.request.caches import registrar_cache
 
 REGISTRAR_NAMES = [
     "1 Click Services Limited",
@@ -150,5 +151,6 @@ class Command(BaseCommand):
         if not models.Registrar.objects.first():
             for name in REGISTRAR_NAMES:
                 models.Registrar.objects.create(name=name)
+            registrar_cache.invalidate()
         else:
             print("Not adding initial Registrars as the table is already populated")
@@ -0,0 +1,94 @@
+import io
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from request_a_govuk_domain.request.clamav import (
+    ClamdCluster,
+    ClamdPool,
+    ClamdScanner,
+    get_scanner,
+)
+from request_a_govuk_domain.request.fake_clamd import FakeClamd
+
+
+class Command(BaseCommand):
+    help = "Scan files concurrently with the clamd configured by the CLAMD_ settings, or a fake clamd, and report the latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scans", type=int, default=200, help="Number of files scanned")
+        parser.add_argument("--concurrency", type=int, default=8, help="Number of files scanned at once")
+        parser.add_argument("--size", type=int, default=1024 * 1024, help="Size of the files in bytes")
+        parser.add_argument(
+            "--distinct",
+            type=int,
+            help="Number of distinct files, repeated to make up the scans, every file is distinct by default",
+        )
+        parser.add_argument(
+            "--fake", type=float, metavar="LATENCY", help="Scan with local fake clamd replying after LATENCY seconds"
+        )
+        parser.add_argument("--fake-hosts", type=int, default=1, help="Number of fake clamd hosts")
+
+    def handle(self, *args, **options):
+        scanner = get_scanner()
+        servers = []
+        if options["fake"] is not None:
+            servers = [FakeClamd(latency=options["fake"]).start() for _ in range(options["fake_hosts"])]
+            cluster = scanner.pool
+            pool = cluster.hosts[0].pool
+            scanner = ClamdScanner(
+                ClamdCluster(
+                    [
+                        ClamdPool(server.address, pool.size, pool.connect_timeout, pool.timeout, pool.max_idle)
+                        for server in servers
+                    ],
+                    cluster.hosts[0].breaker.failure_threshold,
+                    cluster.hosts[0].breaker.reset_timeout,
+                    cluster.health_check_interval,
+                ),
+                scanner.chunk_size,
+                scanner.verdict_cache,
+                scanner.version_check_interval,
+            )
+        content = b"x" * options["size"]
+        distinct = options["distinct"] or options["scans"]
+        # Files are numbered, after a prefix unique to the run so the files of previous runs are not in the cache
+        run = uuid.uuid4().hex.encode()
+
+        def scan(index: int):
+            scanner.scan(io.BytesIO(run + str(index % distinct).encode().rjust(20) + content))
+
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(options["concurrency"]) as executor:
+                list(executor.map(scan, range(options["scans"])))
+            elapsed = time.perf_counter() - start
+        finally:
+            scanner.pool.clear()
+            for server in servers:
+                server.stop()
+
+        metrics = scanner.pool.snapshot()
+        files = options["scans"]
+        self.stdout.write(f"{files} files in {elapsed:.2f}s: {files / elapsed:.1f} files/s, {metrics['scans']} scanned")
+        if metrics["scans"]:
+            self.stdout.write(
+                f"Latency: mean {metrics['latency_mean_ms']:.1f} ms, p50 <= {metrics['latency_p50_ms']} ms, "
+                f"p95 <= {metrics['latency_p95_ms']} ms, max {metrics['latency_max_ms']:.1f} ms"
+            )
+        self.stdout.write(
+            f"Connections: {metrics['connections_opened']} opened, {metrics['connections_reused']} reused, "
+            f"{metrics['errors']} errors"
+        )
+        if metrics["cache_hit_rate"] is not None:
+            self.stdout.write(
+                f"Verdict cache: {metrics['cache_hits']} hits, {metrics['cache_misses']} misses, "
+                f"hit rate {metrics['cache_hit_rate']:.0%}"
+            )
+        for name, host in metrics["hosts"].items():
+            self.stdout.write(
+                f"{name} ({host['state']}): {host['scans']} scans, mean {host['latency_mean_ms'] or 0:.1f} ms, "
+                f"p95 <= {host['latency_p95_ms']} ms, {host['errors']} errors"
+            )
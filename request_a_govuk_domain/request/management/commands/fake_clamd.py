@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from request_a_govuk_domain.request.fake_clamd import FakeClamd
+
+
+class Command(BaseCommand):
+    help = "Run a fake clamd server on localhost, to run the app or load tests without ClamAV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--port", type=int, default=3310, help="Port to listen to")
+        parser.add_argument("--latency", type=float, default=0.0, help="Seconds waited before each reply")
+
+    def handle(self, *args, **options):
+        server = FakeClamd(port=options["port"], latency=options["latency"])
+        self.stdout.write(f"Fake clamd listening on {server.address[0]}:{server.address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from request_a_govuk_domain.request.partitioning import manage_history_partitions
+
+
+class Command(BaseCommand):
+    help = "Create the upcoming monthly partitions of the historical tables, and detach the expired ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only show the partitions that would change")
+
+    def handle(self, *args, **options):
+        plan = manage_history_partitions(dry_run=options["dry_run"])
+        for model_plan in plan.model_plans:
+            table = model_plan.config.model._meta.db_table
+            for partition in model_plan.creations:
+                self.stdout.write(f"+ {table}_{partition.name()}")
+            for partition in model_plan.deletions:
+                self.stdout.write(f"- {table}_{partition.name()} (detached)")
+        self.stdout.write(f"{len(plan.creations)} partitions created, {len(plan.deletions)} partitions detached")
@@ -0,0 +1,39 @@
+import time
+from typing import Callable
+
+from django.core.management.base import BaseCommand
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from request_a_govuk_domain.request.models.storage_util import (
+    s3_client_config,
+    s3_root_storage,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the cost per call of getting the S3 storage, and its client, from the storage registry or from a new "
+        "storage built on every call, without any request to S3"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calls", type=int, default=200, help="Number of calls measured, after a warm-up call")
+
+    def handle(self, *args, **options):
+        calls = options["calls"]
+
+        def new_storage():
+            return S3Boto3Storage(client_config=s3_client_config())
+
+        def measure(name: str, call: Callable):
+            call()
+            start = time.perf_counter()
+            for _ in range(calls):
+                call()
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"{name:<40} {elapsed / calls * 1_000_000:>12.1f} us per call")
+
+        measure("Shared storage", s3_root_storage)
+        measure("Shared storage client", lambda: s3_root_storage().connection.meta.client)
+        measure("New storage", new_storage)
+        measure("New storage client", lambda: new_storage().connection.meta.client)
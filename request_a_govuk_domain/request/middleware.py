@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.urls import reverse
+from simple_history.middleware import HistoryRequestMiddleware
+
+from .models.history import buffered_history
+
+
+def admin_history_request_middleware(get_response):
+    """
+    simple_history's HistoryRequestMiddleware, for the admin only.
+
+    The history records only need the request to find the user making the change, and the users of
+    the public journey are never logged in, so the other requests skip it.
+
+    With settings.HISTORY_BUFFERED_WRITES, each admin request runs in a transaction, and the history
+    records created in it are written at its end, in the same transaction, with one insert per
+    historical table, see models.history.buffered_history.
+    """
+    history_middleware = HistoryRequestMiddleware(get_response)
+
+    def middleware(request):
+        if not request.path.startswith(reverse("admin:index")):
+            return get_response(request)
+        if not settings.HISTORY_BUFFERED_WRITES:
+            return history_middleware(request)
+        with buffered_history():
+            return history_middleware(request)
+
+    return middleware
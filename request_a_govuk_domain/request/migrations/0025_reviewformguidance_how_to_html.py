@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:51
+
+import markdown
+from django.db import migrations, models
+
+
+def render_guidance_html(apps, schema_editor):
+    ReviewFormGuidance = apps.get_model("request", "ReviewFormGuidance")
+    for guidance in ReviewFormGuidance.objects.all():
+        guidance.how_to_html = markdown.markdown(guidance.how_to)
+        guidance.save(update_fields=["how_to_html"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("request", "0024_application_approval_or_rejection_comment_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reviewformguidance",
+            name="how_to_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(render_guidance_html, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("request", "0025_reviewformguidance_how_to_html"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BankHoliday",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("date", models.DateField(unique=True)),
+                ("title", models.CharField()),
+            ],
+            options={
+                "ordering": ["date"],
+            },
+        ),
+    ]
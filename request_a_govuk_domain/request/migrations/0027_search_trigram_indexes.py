@@ -0,0 +1,67 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:03
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("request", "0026_bankholiday"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="application",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("reference"), name="gin_trgm_ops"
+                ),
+                name="application_reference_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("domain_name"), name="gin_trgm_ops"
+                ),
+                name="application_domain_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("status"), name="gin_trgm_ops"
+                ),
+                name="application_status_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="registrant",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="registrant_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="registrar",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="registrar_name_trgm",
+            ),
+        ),
+        # The admin search also matches the application owner's username
+        migrations.RunSQL(
+            'CREATE INDEX "auth_user_username_trgm" ON "auth_user" USING gin ((UPPER("username"::text)) gin_trgm_ops)',
+            'DROP INDEX IF EXISTS "auth_user_username_trgm"',
+        ),
+    ]
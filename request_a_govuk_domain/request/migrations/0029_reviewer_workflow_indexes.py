@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("request", "0028_application_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(fields=["status", "time_submitted", "id"], name="application_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(fields=["owner", "time_submitted", "id"], name="application_owner_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(fields=["last_updated_by", "time_submitted", "id"], name="application_updated_by_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                condition=models.Q(("status__in", ("new", "in_progress", "more_information", "ready_2i", "with_nac"))),
+                fields=["owner", "status", "time_submitted", "id"],
+                name="application_open_owner_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historicalapplication",
+            index=models.Index(fields=["id", "history_date", "history_id"], name="request_his_id_83634f_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="historicalreview",
+            index=models.Index(fields=["id", "history_date", "history_id"], name="request_his_id_14d4be_idx"),
+        ),
+        # Replaced by the composite indexes starting with the same field
+        migrations.AlterField(
+            model_name="application",
+            name="last_updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="last_updated_applications",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="application",
+            name="owner",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="owner_applications",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
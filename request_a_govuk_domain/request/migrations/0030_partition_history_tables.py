@@ -0,0 +1,150 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:28
+
+from datetime import datetime, timezone
+
+import psqlextra.manager.manager
+from django.db import migrations
+from psqlextra.partitioning.constants import AUTO_PARTITIONED_COMMENT
+from psqlextra.partitioning.time_partition import PostgresTimePartition
+from psqlextra.partitioning.time_partition_size import PostgresTimePartitionSize
+
+HISTORY_TABLES = (
+    "request_historicalapplication",
+    "request_historicalregistrant",
+    "request_historicalregistrantperson",
+    "request_historicalregistrar",
+    "request_historicalregistrarperson",
+    "request_historicalregistrypublishedperson",
+    "request_historicalreview",
+)
+
+# Monthly partitions created ahead by the migration, the partition_history command keeps creating them afterwards
+MONTHS_AHEAD = 3
+
+
+def partition_history_table(cursor, table: str, first_month: datetime):
+    """
+    Turn a historical table into a table partitioned by range of history_date.
+
+    The existing table is kept, with its rows and indexes, as the partition of everything before
+    first_month, so the rows are not copied. Monthly partitions follow it, and a default partition
+    takes rows outside of the partitions, e.g. if the partitions were not created in time.
+    """
+    legacy = f"{table}_legacy"
+    cursor.execute(
+        "SELECT i.relname, pg_get_indexdef(i.oid) FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid "
+        "WHERE x.indrelid = %s::regclass AND NOT x.indisprimary",
+        [table],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+    cursor.execute(f'SELECT COALESCE(MAX(history_id), 0) + 1 FROM "{table}"')
+    (next_history_id,) = cursor.fetchone()
+
+    cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+    # Replaced by the (history_id, history_date) primary key of the partitioned table when the table is attached
+    cursor.execute(f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{table}_pkey"')
+    cursor.execute(f'ALTER TABLE "{legacy}" ALTER COLUMN history_id DROP IDENTITY IF EXISTS')
+    for number, (index_name, _) in enumerate(indexes):
+        cursor.execute(f'ALTER INDEX "{index_name}" RENAME TO "{legacy}_{number}_idx"')
+
+    cursor.execute(
+        f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE) '
+        "PARTITION BY RANGE (history_date)"
+    )
+    # The partition key has to be part of the primary key
+    cursor.execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY (history_id, history_date)')
+    cursor.execute(f'CREATE SEQUENCE "{table}_history_id_seq" AS integer OWNED BY "{table}".history_id')
+    cursor.execute("SELECT setval(%s, %s, false)", [f"{table}_history_id_seq", next_history_id])
+    cursor.execute(
+        f'ALTER TABLE "{table}" ALTER COLUMN history_id SET DEFAULT nextval(%s::regclass)', [f"{table}_history_id_seq"]
+    )
+    # Same definitions as the indexes of the legacy table, which are attached to them rather than rebuilt
+    for _, index_definition in indexes:
+        cursor.execute(index_definition)
+    for constraint_name, constraint_definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{constraint_name}" {constraint_definition}')
+
+    cursor.execute(
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{legacy}" FOR VALUES FROM (MINVALUE) TO (%s)',
+        [first_month.strftime("%Y-%m-%d")],
+    )
+    size = PostgresTimePartitionSize(months=1)
+    start = first_month
+    for _ in range(MONTHS_AHEAD):
+        partition = PostgresTimePartition(size=size, start_datetime=start)
+        partition_table = f"{table}_{partition.name()}"
+        cursor.execute(
+            f'CREATE TABLE "{partition_table}" PARTITION OF "{table}" FOR VALUES FROM (%s) TO (%s)',
+            [partition.from_values, partition.to_values],
+        )
+        cursor.execute(f'COMMENT ON TABLE "{partition_table}" IS %s', [AUTO_PARTITIONED_COMMENT])
+        start = partition.end_datetime
+    cursor.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+
+def partition_history_tables(apps, schema_editor):
+    size = PostgresTimePartitionSize(months=1)
+    first_month = size.start(datetime.now(timezone.utc)) + size.as_delta()
+    with schema_editor.connection.cursor() as cursor:
+        for table in HISTORY_TABLES:
+            cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [table])
+            if cursor.fetchone() is None:
+                partition_history_table(cursor, table, first_month)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("request", "0029_reviewer_workflow_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="historicalapplication",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="historicalregistrant",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="historicalregistrantperson",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="historicalregistrar",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="historicalregistrarperson",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="historicalregistrypublishedperson",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="historicalreview",
+            managers=[
+                ("objects", psqlextra.manager.manager.PostgresManager()),
+            ],
+        ),
+        # Irreversible: the partitioned tables are not turned back into plain tables
+        migrations.RunPython(partition_history_tables),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:46
+
+import datetime
+from itertools import groupby
+from operator import itemgetter
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+# The fields of the review history stored as deltas
+REVIEW_DELTA_FIELDS = (
+    "registrar_details",
+    "registrar_details_notes",
+    "domain_name_availability",
+    "domain_name_availability_notes",
+    "registrant_org",
+    "registrant_org_notes",
+    "registrant_person",
+    "registrant_person_notes",
+    "registrant_permission",
+    "registrant_permission_notes",
+    "policy_exemption",
+    "policy_exemption_notes",
+    "domain_name_rules",
+    "domain_name_rules_notes",
+    "registrant_senior_support",
+    "registrant_senior_support_notes",
+    "registry_details",
+    "registry_details_notes",
+    "reason",
+)
+
+
+# A copy of request.models.history.convert_history as of this migration, so later changes to the app code
+# don't change what the migration does
+
+
+def history_month(history_date):
+    return history_date.astimezone(datetime.timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def fold_history(history_model, attnames, rows):
+    values = dict.fromkeys(attnames)
+    for history_id, delta, *columns in rows:
+        if delta is None:
+            values = dict(zip(attnames, columns))
+        else:
+            decoded = {
+                attname: history_model._meta.get_field(attname).to_python(value) for attname, value in delta.items()
+            }
+            values = decoded if set(attnames).issubset(delta) else {**values, **decoded}
+        yield history_id, values
+
+
+def convert_history(history_model, attnames, to_deltas, batch_size=500):
+    manager = history_model._default_manager
+    object_ids = list(manager.order_by("id").values_list("id", flat=True).distinct())
+    for start in range(0, len(object_ids), batch_size):
+        rows = (
+            manager.filter(id__in=object_ids[start : start + batch_size])
+            .order_by("id", "history_date", "history_id")
+            .values_list("id", "history_date", "history_id", "history_delta", *attnames)
+        )
+        records = []
+        for _, object_rows in groupby(rows, key=itemgetter(0)):
+            object_rows = list(object_rows)
+            snapshots = fold_history(history_model, attnames, (row[2:] for row in object_rows))
+            previous, previous_month = None, None
+            for (_, history_date, *_), (history_id, values) in zip(object_rows, snapshots):
+                month = history_month(history_date)
+                if not to_deltas:
+                    record = history_model(history_id=history_id, history_delta=None, **values)
+                else:
+                    delta = {
+                        attname: value
+                        for attname, value in values.items()
+                        if month != previous_month or previous[attname] != value
+                    }
+                    record = history_model(history_id=history_id, history_delta=delta, **dict.fromkeys(attnames))
+                records.append(record)
+                previous, previous_month = values, month
+        manager.bulk_update(records, ["history_delta", *attnames])
+
+
+def review_history_to_deltas(apps, schema_editor):
+    convert_history(apps.get_model("request", "HistoricalReview"), REVIEW_DELTA_FIELDS, to_deltas=True)
+
+
+def review_history_to_rows(apps, schema_editor):
+    convert_history(apps.get_model("request", "HistoricalReview"), REVIEW_DELTA_FIELDS, to_deltas=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("request", "0030_partition_history_tables"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalreview",
+            name="history_delta",
+            field=models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True),
+        ),
+        migrations.RunPython(review_history_to_deltas, review_history_to_rows),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("request", "0031_review_history_delta"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="application",
+            name="evidence_promotion",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="historicalapplication",
+            name="evidence_promotion",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
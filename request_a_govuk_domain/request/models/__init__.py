@@ -1,4 +1,5 @@
-from .application import Application, ApplicationStatus
+from .application import Application, ApplicationStatus, EvidencePromotion
+from .bank_holiday import BankHoliday
 from .notification_response_id import NotificationResponseID
 from .organisation import Registrant, RegistrantTypeChoices, Registrar
 from .person import Person, RegistrantPerson, RegistrarPerson, RegistryPublishedPerson
@@ -7,6 +8,8 @@ from .review import Review, ReviewFormGuidance
 __all__ = [
     "Application",
     "ApplicationStatus",
+    "BankHoliday",
+    "EvidencePromotion",
     "NotificationResponseID",
     "Organisation",
     "Registrant",
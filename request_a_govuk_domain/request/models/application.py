@@ -1,15 +1,20 @@
 import datetime
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
 from ...settings import S3_STORAGE_ENABLED
+from .dirty_fields import DirtyFieldsMixin
+from .history import IndexedHistoricalRecords
 from .organisation import Registrant, Registrar
 from .person import RegistrantPerson, RegistrarPerson, RegistryPublishedPerson
 from .storage_util import TEMP_STORAGE_ROOT, select_storage
@@ -17,6 +22,10 @@ from .storage_util import TEMP_STORAGE_ROOT, select_storage
 REF_NUM_LENGTH = 17
 logger = logging.getLogger(__name__)
 
+EVIDENCE_FIELDS = ("policy_exemption_evidence", "ministerial_request_evidence", "written_permission_evidence")
+# Folder of the evidence files of the applications, which are uploaded to TEMP_STORAGE_ROOT first
+APPLICATIONS_STORAGE_ROOT = "applications/"
+
 
 class ApplicationStatus(models.TextChoices):
     # We're likely to have to add to this with (at least) an
@@ -72,7 +81,27 @@ class ApplicationStatus(models.TextChoices):
     OTHER = "other", _("Other")
 
 
-class Application(models.Model):
+class EvidencePromotion(models.TextChoices):
+    """
+    State of an evidence file of an application, see Application.promote_evidence
+    """
+
+    # In TEMP_STORAGE_ROOT, waiting to be moved to the application folder
+    PENDING = "pending", _("Pending")
+    PROMOTED = "promoted", _("Promoted")
+
+
+# Statuses of the applications the reviewers are working on, listed on the admin dashboard
+OPEN_STATUSES = (
+    ApplicationStatus.NEW,
+    ApplicationStatus.IN_PROGRESS,
+    ApplicationStatus.MORE_INFORMATION,
+    ApplicationStatus.READY_2I,
+    ApplicationStatus.CURRENTLY_WITH_NAC,
+)
+
+
+class Application(DirtyFieldsMixin, models.Model):
     """
     The core model for the service, to which all other models in some way
     relate. An Application instance is created at the conclusion of the
@@ -88,6 +117,8 @@ class Application(models.Model):
         null=True,
         blank=True,
         related_name="owner_applications",
+        # Indexed by the (owner, time_submitted, id) index
+        db_index=False,
     )
     time_submitted = models.DateTimeField(auto_now_add=True)
     time_decided = models.DateTimeField(null=True)
@@ -98,6 +129,8 @@ class Application(models.Model):
         null=True,
         blank=True,
         related_name="last_updated_applications",
+        # Indexed by the (last_updated_by, time_submitted, id) index
+        db_index=False,
     )
     status = models.CharField(
         choices=ApplicationStatus.choices,
@@ -146,61 +179,165 @@ class Application(models.Model):
         storage=select_storage,
         max_length=255,
     )
+    # EvidencePromotion state of each evidence field with a file, only tracked when S3 storage is enabled
+    evidence_promotion = models.JSONField(default=dict, blank=True, editable=False)
 
     # maintain history
-    history = HistoricalRecords()
+    history = IndexedHistoricalRecords()
+
+    class Meta:
+        indexes = [
+            # Trigram indexes used by the admin search, which matches on UPPER(field) LIKE '%term%'
+            GinIndex(OpClass(Upper("reference"), name="gin_trgm_ops"), name="application_reference_trgm"),
+            GinIndex(OpClass(Upper("domain_name"), name="gin_trgm_ops"), name="application_domain_name_trgm"),
+            GinIndex(OpClass(Upper("status"), name="gin_trgm_ops"), name="application_status_trgm"),
+            # Keyset pagination of the admin changelists, newest first
+            models.Index(fields=["-time_submitted", "-id"], name="application_submitted_id_idx"),
+            # Admin changelists filtered on a status, owner or last updated by, and the new applications
+            # on the dashboard. Each index also serves the plain lookups on its first field.
+            models.Index(fields=["status", "time_submitted", "id"], name="application_status_idx"),
+            models.Index(fields=["owner", "time_submitted", "id"], name="application_owner_idx"),
+            models.Index(fields=["last_updated_by", "time_submitted", "id"], name="application_updated_by_idx"),
+            # Dashboard counts, and the lists of the open applications owned by the user, split on
+            # time_submitted into late and on schedule. Most applications are decided, so only the
+            # open ones are indexed.
+            models.Index(
+                fields=["owner", "status", "time_submitted", "id"],
+                name="application_open_owner_idx",
+                condition=models.Q(status__in=OPEN_STATUSES),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.reference} - {self.domain_name}"
 
     def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
         """
-        When the application is saved, move the temporary files to the applications directory
+        When the application is saved with new evidence files, upload the ones held in memory to the
+        temporary folder, and queue the promotion of the files to the application folder for when the
+        transaction commits, see promote_evidence
         :param force_insert:
         :param force_update:
         :param using:
         :param update_fields:
         :return:
         """
-        if S3_STORAGE_ENABLED:
-            storage = select_storage()
-            # Move any temporary files in to the application specific folder
-            # We have to do this custom moving because we store the initially uploaded
-            # files in the temp location.
-            for file_field in [
-                self.policy_exemption_evidence,
-                self.ministerial_request_evidence,
-                self.written_permission_evidence,
-            ]:
-                if file_field and not file_field.name.startswith("applications"):
-                    from_path = TEMP_STORAGE_ROOT + file_field.name
-                    if file_field.file and isinstance(file_field.file, InMemoryUploadedFile):
-                        """
-                        Sometimes the file is stored in the memory instead of the S3 bucket (i.e when uploaded
-                        directly through the admin screens). Then
-                        we have to move it in to S3 explicitly before continue with the usual S3 copy
-                        """
-                        storage.connection.meta.client.put_object(
-                            Bucket=storage.bucket_name,
-                            Key=from_path,
-                            Body=file_field.file.read(),
-                        )
-
-                    to_path = f"applications/{self.reference}/" + re.sub(r"[^A-Za-z0-9.]+", "_", file_field.name)
-                    logger.info(
-                        "Copying temporary file %s to application folder %s",
-                        from_path,
-                        to_path,
-                    )
-                    storage.connection.meta.client.copy_object(
-                        Bucket=storage.bucket_name,
-                        CopySource=storage.bucket_name + "/" + from_path,
-                        Key=to_path,
-                    )
-                    storage.delete(from_path)
-                    file_field.name = to_path
+        staged_fields = self.stage_evidence() if S3_STORAGE_ENABLED else []
+        if staged_fields and update_fields is not None:
+            update_fields = [*update_fields, *staged_fields, "evidence_promotion"]
         logger.info(f"Saving application for reference {self.reference}")
         super().save(force_insert, force_update, using, update_fields)
+        if staged_fields:
+            from ..tasks import promote_evidence
+
+            transaction.on_commit(partial(promote_evidence.delay, self.id), using=using)
+
+    def stage_evidence(self) -> list[str]:
+        """
+        Mark the new evidence files as pending promotion. Files uploaded through the admin screens are
+        held in memory rather than in the temporary folder on S3, so they are uploaded there first.
+
+        :return: names of the evidence fields with a new file
+        """
+        staged_fields = []
+        for field_name in EVIDENCE_FIELDS:
+            file_field = getattr(self, field_name)
+            if not file_field or file_field.name.startswith(APPLICATIONS_STORAGE_ROOT):
+                continue
+            if file_field._committed and self.evidence_promotion.get(field_name) == EvidencePromotion.PENDING:
+                # Already queued
+                continue
+            if not file_field._committed and isinstance(file_field.file, InMemoryUploadedFile):
+                storage = select_storage()
+                storage.connection.meta.client.put_object(
+                    Bucket=storage.bucket_name,
+                    Key=TEMP_STORAGE_ROOT + file_field.name,
+                    Body=file_field.file.read(),
+                )
+                file_field._committed = True
+            staged_fields.append(field_name)
+        if staged_fields:
+            self.evidence_promotion = {
+                **self.evidence_promotion,
+                **dict.fromkeys(staged_fields, EvidencePromotion.PENDING),
+            }
+        return staged_fields
+
+    @classmethod
+    def promote_evidence(cls, application_id: int) -> list[str]:
+        """
+        Move the evidence files of an application pending promotion from the temporary folder to the
+        application folder. The files are copied on S3 concurrently, without locking the application as
+        copies can be made again. The application is then locked to update the fields still pending with
+        the same file, and the temporary files of these fields are deleted with one request. Files already
+        promoted are skipped, so this can be run again after a failure.
+
+        :param application_id: id of the application
+        :return: names of the evidence fields promoted
+        """
+        storage = select_storage()
+        application = cls.objects.get(id=application_id)
+        moves = {
+            field_name: (
+                getattr(application, field_name).name,
+                f"{APPLICATIONS_STORAGE_ROOT}{application.reference}/"
+                + re.sub(r"[^A-Za-z0-9.]+", "_", getattr(application, field_name).name),
+            )
+            for field_name in EVIDENCE_FIELDS
+            if application.evidence_promotion.get(field_name) == EvidencePromotion.PENDING
+        }
+        if not moves:
+            return []
+
+        # boto3 clients can be shared by threads, unlike the storage connections which are per thread
+        client = storage.connection.meta.client
+
+        def copy(name: str, to_path: str):
+            from_path = TEMP_STORAGE_ROOT + name
+            logger.info("Copying temporary file %s to application folder %s", from_path, to_path)
+            client.copy_object(
+                Bucket=storage.bucket_name,
+                CopySource=storage.bucket_name + "/" + from_path,
+                Key=to_path,
+            )
+
+        with ThreadPoolExecutor(max_workers=len(moves)) as executor:
+            # list() raises the first failure, leaving every file pending
+            list(executor.map(copy, *zip(*moves.values())))
+
+        with transaction.atomic():
+            application = cls.objects.select_for_update().get(id=application_id)
+            # Fields given another file, or promoted by another run, since they were copied are left as they are
+            promoted = {
+                field_name: (name, to_path)
+                for field_name, (name, to_path) in moves.items()
+                if application.evidence_promotion.get(field_name) == EvidencePromotion.PENDING
+                and getattr(application, field_name).name == name
+            }
+            if not promoted:
+                return []
+            for field_name, (name, to_path) in promoted.items():
+                getattr(application, field_name).name = to_path
+            application.evidence_promotion = {
+                **application.evidence_promotion,
+                **dict.fromkeys(promoted, EvidencePromotion.PROMOTED),
+            }
+            application.save(update_fields=[*promoted, "evidence_promotion"])
+        client.delete_objects(
+            Bucket=storage.bucket_name,
+            Delete={"Objects": [{"Key": TEMP_STORAGE_ROOT + name} for name, to_path in promoted.values()]},
+        )
+        return list(promoted)
+
+    def evidence_path(self, field_name: str) -> str:
+        """
+        :param field_name: name of an evidence field with a file
+        :return: path of the file from the root of the storage, in the temporary folder until it is promoted
+        """
+        name = getattr(self, field_name).name
+        if self.evidence_promotion.get(field_name) == EvidencePromotion.PENDING:
+            return TEMP_STORAGE_ROOT + name
+        return name
 
     def time_elapsed(self) -> datetime.timedelta:
         """
@@ -208,10 +345,29 @@ class Application(models.Model):
         received and when it was closed (approved or rejected). For other
         applications, return the time passed since it was received
         """
-        if self.status in [ApplicationStatus.APPROVED, ApplicationStatus.REJECTED]:
-            if self.time_decided:
-                return self.time_decided - self.time_submitted
+        return self.calculate_time_elapsed(self.id, self.status, self.time_submitted, self.time_decided)
+
+    @staticmethod
+    def calculate_time_elapsed(
+        application_id: int,
+        status: str,
+        time_submitted: datetime.datetime,
+        time_decided: datetime.datetime | None,
+        now: datetime.datetime | None = None,
+    ) -> datetime.timedelta:
+        """
+        time_elapsed for an application read as values rather than as a model instance
+
+        :param application_id: id of the application, for the error message
+        :param status: status of the application
+        :param time_submitted: time the application was submitted
+        :param time_decided: time the application was approved or rejected
+        :param now: the current time, defaults to timezone.now()
+        """
+        if status in [ApplicationStatus.APPROVED, ApplicationStatus.REJECTED]:
+            if time_decided:
+                return time_decided - time_submitted
             else:
-                raise Exception(f"Application f{self.id} is closed but has no time_decided")
+                raise Exception(f"Application f{application_id} is closed but has no time_decided")
         else:
-            return timezone.now() - self.time_submitted
+            return (now or timezone.now()) - time_submitted
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class BankHoliday(models.Model):
+    """
+    A bank holiday in England and Wales, as published by gov.uk.
+
+    Used to work out the number of business days taken to process an application. The table is
+    refreshed periodically from https://www.gov.uk/bank-holidays.json
+    """
+
+    date = models.DateField(unique=True)
+    title = models.CharField()
+
+    class Meta:
+        ordering = ["date"]
+
+    def __str__(self):
+        return f"{self.title} ({self.date})"
@@ -0,0 +1,74 @@
+import logging
+
+from django.db.models.fields.files import FieldFile
+
+logger = logging.getLogger(__name__)
+
+
+class DirtyFieldsMixin:
+    """
+    Model mixin keeping track of the fields changed since the object was read or saved.
+
+    Saving an object only updates the fields which changed, and does nothing at all when no field
+    changed. This matters for the models with a history: every save writes a full copy of the row
+    to the historical table, even when it changes nothing.
+
+    Objects which have not been saved yet, and saves given update_fields or force_insert, are saved
+    as usual.
+    """
+
+    _saved_values: dict | None = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_saved_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using, fields)
+        self._remember_saved_values(fields)
+
+    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        if update_fields is None and not force_insert and not self._state.adding and self._saved_values is not None:
+            dirty_fields = self.get_dirty_fields()
+            if not dirty_fields:
+                logger.debug("Nothing changed on %s %s, not saving it", self._meta.model_name, self.pk)
+                return
+            # auto_now fields are only set when they are saved
+            update_fields = dirty_fields + [
+                field.name for field in self._meta.concrete_fields if getattr(field, "auto_now", False)
+            ]
+        super().save(force_insert, force_update, using, update_fields)
+        self._remember_saved_values(update_fields)
+
+    def get_dirty_fields(self) -> list[str]:
+        """
+        :return: names of the fields changed since the object was read or saved, in the order of the model
+        """
+        saved_values = self._saved_values or {}
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname in saved_values and self._field_value(field) != saved_values[field.attname]
+        ]
+
+    def _field_value(self, field):
+        value = getattr(self, field.attname)
+        # A file is saved as its name, the name of the FieldFile changes when a new file is assigned to it
+        return value.name if isinstance(value, FieldFile) else value
+
+    def _remember_saved_values(self, fields=None):
+        """
+        Remember the current value of the given fields, or of all the loaded fields, as their saved value
+
+        :param fields: names of the fields, None for all the loaded fields
+        """
+        if self._saved_values is None:
+            self._saved_values = {}
+        deferred_fields = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred_fields:
+                continue
+            if fields is None or field.name in fields or field.attname in fields:
+                self._saved_values[field.attname] = self._field_value(field)
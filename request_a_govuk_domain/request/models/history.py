@@ -0,0 +1,507 @@
+import datetime
+import logging
+import threading
+from contextlib import contextmanager
+from itertools import count, groupby
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, models, router, transaction
+from psqlextra.models import PostgresPartitionedModel
+from psqlextra.types import PostgresPartitioningMethod
+from simple_history.manager import HistoricalQuerySet, HistoryDescriptor, HistoryManager
+from simple_history.models import HistoricalRecords
+
+logger = logging.getLogger(__name__)
+
+_buffers = threading.local()
+
+# Transaction-local Postgres setting listing the savepoint segments of the history buffers whose
+# records are kept, see HistoryBuffer
+SEGMENTS_SETTING = "history_buffer.segments"
+_segment_ids = count(1)
+
+
+class HistoryBuffer:
+    """
+    History records created in a transaction, written at the end of the block buffering them, in the
+    same transaction, with one bulk_create per historical model. See buffered_history.
+
+    The records created in a savepoint of the block are kept apart, in a segment of the buffer. The
+    id of each segment is added to a transaction-local setting when its first record is buffered,
+    and Postgres reverts the change if the savepoint is rolled back, so only the records of the
+    segments still listed when the buffer is written are kept.
+
+    :param using: alias of the database of the transaction
+    """
+
+    def __init__(self, using: str):
+        self.using = using
+        self.savepoints = tuple(connections[using].savepoint_ids)
+        self.records: list[tuple[models.Model, int | None]] = []
+        self.segments: dict[tuple, int] = {}
+
+    def add(self, record: models.Model) -> None:
+        savepoints = tuple(connections[self.using].savepoint_ids)
+        segment = None
+        if savepoints != self.savepoints:
+            segment = self.segments.get(savepoints)
+            if segment is None:
+                segment = self.segments[savepoints] = next(_segment_ids)
+                with connections[self.using].cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config(%s, concat(current_setting(%s, true), %s), true)",
+                        [SEGMENTS_SETTING, SEGMENTS_SETTING, f"{segment},"],
+                    )
+        self.records.append((record, segment))
+
+    def kept_segments(self) -> set[int]:
+        """
+        :return: the ids of the segments whose savepoints were not rolled back
+        """
+        if not self.segments:
+            return set()
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT current_setting(%s, true)", [SEGMENTS_SETTING])
+            (value,) = cursor.fetchone()
+        return {int(segment) for segment in (value or "").split(",") if segment}
+
+    def flush(self) -> int:
+        """
+        Write the buffered records, except those created in savepoints which were rolled back
+
+        :return: the number of records written
+        """
+        kept = self.kept_segments()
+        by_model: dict[type, list] = {}
+        for record, segment in self.records:
+            if segment is None or segment in kept:
+                by_model.setdefault(type(record), []).append(record)
+        self.records = []
+        self.segments = {}
+        for model, records in by_model.items():
+            model.insert_history(records, self.using)
+        written = sum(len(records) for records in by_model.values())
+        logger.debug("Wrote %s buffered history records", written)
+        return written
+
+
+def current_history_buffer(using: str) -> HistoryBuffer | None:
+    """
+    :return: the history buffer of the thread if it buffers the records of the given database
+    """
+    buffer = getattr(_buffers, "buffer", None)
+    return buffer if buffer is not None and buffer.using == using else None
+
+
+@contextmanager
+def buffered_history(using: str = DEFAULT_DB_ALIAS) -> Iterator[HistoryBuffer]:
+    """
+    Run a block in a transaction, buffering the history records created in it and writing them at
+    the end of the block, in the same transaction, with one insert per historical model.
+
+    The records are only written if the block completes, and the changes and their history are
+    committed together: an exception rolls back the transaction and discards them, and a failure to
+    write the records rolls back the changes. Records created in a savepoint which is rolled back are
+    discarded too. Within the block, the records are not in the database yet, and their history_id
+    is only set once they are written. A block nested in another one buffers to the outer block.
+
+    :param using: alias of the database
+    """
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is not None:
+        yield buffer
+        return
+    with transaction.atomic(using=using):
+        buffer = _buffers.buffer = HistoryBuffer(using)
+        try:
+            yield buffer
+            if not transaction.get_rollback(using=using):
+                buffer.flush()
+        finally:
+            _buffers.buffer = None
+
+
+class BufferedHistoricalModel:
+    """
+    Base of the historical models, adding new records to the history buffer of the thread when there
+    is one, see buffered_history
+    """
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            buffer = current_history_buffer(kwargs.get("using") or router.db_for_write(type(self), instance=self))
+            if buffer is not None:
+                buffer.add(self)
+                return
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def insert_history(cls, records: list, using: str) -> None:
+        """
+        Insert new records of this model at once
+
+        :param records: the records, oldest first
+        :param using: alias of the database
+        """
+        cls._default_manager.db_manager(using).bulk_create(records)
+
+
+class PartitionedHistoricalRecords(HistoricalRecords):
+    """
+    Historical records stored in a table partitioned by month of history_date.
+
+    Every save of a tracked model writes a full copy of the row, so the historical tables grow
+    faster than any other. Partitioning them lets old months be detached without rewriting the
+    table, and lets queries bounded on history_date skip the partitions outside the bound. The
+    partitions are managed by request.partitioning.
+    """
+
+    def __init__(self, *args, bases=(BufferedHistoricalModel, PostgresPartitionedModel), **kwargs):
+        super().__init__(*args, bases=bases, **kwargs)
+
+    def get_extra_fields(self, model, fields):
+        extra_fields = super().get_extra_fields(model, fields)
+        extra_fields["PartitioningMeta"] = type(
+            "PartitioningMeta", (), {"method": PostgresPartitioningMethod.RANGE, "key": ["history_date"]}
+        )
+        return extra_fields
+
+
+class IndexedHistoricalRecords(PartitionedHistoricalRecords):
+    """
+    Historical records with an index on the history of each object.
+
+    The history of an object is read by filtering on its id and ordering by date, e.g. in the admin
+    history view and when comparing a record with the previous one, so the historical model gets a
+    (id, history_date, history_id) index. simple_history only indexes history_date on its own.
+    """
+
+    def get_meta_options(self, model):
+        meta_fields = super().get_meta_options(model)
+        meta_fields["indexes"] = (
+            *meta_fields.get("indexes", ()),
+            models.Index(fields=(model._meta.pk.attname, "history_date", "history_id")),
+        )
+        return meta_fields
+
+
+HISTORY_DELTA_FIELD = "history_delta"
+
+
+def history_month(history_date: datetime.datetime) -> datetime.datetime:
+    """
+    :return: the start of the month of a history date, i.e. of its partition
+    """
+    return history_date.astimezone(datetime.timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _decode_delta(history_model, delta: dict) -> dict:
+    return {attname: history_model._meta.get_field(attname).to_python(value) for attname, value in delta.items()}
+
+
+def _fold_history(history_model, attnames: tuple[str, ...], rows) -> Iterator[tuple[int, dict]]:
+    """
+    Rebuild the values of the delta fields of the history records of one object.
+
+    :param history_model: the historical model
+    :param attnames: the delta fields
+    :param rows: (history_id, history_delta, *delta field values) of the records, oldest first
+    :return: (history_id, values of the delta fields) of each record
+    """
+    values = dict.fromkeys(attnames)
+    for history_id, delta, *columns in rows:
+        if delta is None:
+            # Stored as a full row
+            values = dict(zip(attnames, columns))
+        elif set(attnames).issubset(delta):
+            values = _decode_delta(history_model, delta)
+        else:
+            values = {**values, **_decode_delta(history_model, delta)}
+        yield history_id, values
+
+
+def apply_history_deltas(records) -> None:
+    """
+    Set the values of the delta fields on history records stored as deltas, reading the records
+    they depend on in one query.
+
+    :param records: history records of a model using DeltaHistoricalRecords
+    """
+    pending = [
+        record
+        for record in records
+        if record.__dict__.get(HISTORY_DELTA_FIELD) is not None and record.get_deferred_fields()
+    ]
+    if not pending:
+        return
+    history_model = type(pending[0])
+    pk_attname = history_model.instance_type._meta.pk.attname
+    attnames = history_model._history_delta_fields
+    rows = (
+        history_model._default_manager.filter(
+            **{f"{pk_attname}__in": {getattr(record, pk_attname) for record in pending}},
+            history_date__gte=min(history_month(record.history_date) for record in pending),
+            history_date__lte=max(record.history_date for record in pending),
+        )
+        .order_by(pk_attname, "history_date", "history_id")
+        .values_list(pk_attname, "history_id", HISTORY_DELTA_FIELD, *attnames)
+    )
+    snapshots = {}
+    for _, object_rows in groupby(rows, key=itemgetter(0)):
+        snapshots.update(_fold_history(history_model, attnames, (row[1:] for row in object_rows)))
+    for record in pending:
+        record.__dict__.update(snapshots.get(record.history_id, dict.fromkeys(attnames)))
+
+
+def convert_history(history_model, attnames: Iterable[str], to_deltas: bool, batch_size: int = 500) -> int:
+    """
+    Convert the stored history of a model between full rows and deltas, e.g. in the migration
+    switching a model to DeltaHistoricalRecords, or back. Records already in the requested form are
+    written again unchanged, so the conversion can be run again after an interruption.
+
+    :param history_model: the historical model, which may be the one of a migration
+    :param attnames: the delta fields
+    :param to_deltas: store the records as deltas if True, as full rows otherwise
+    :param batch_size: number of objects converted at a time
+    :return: the number of records converted
+    """
+    attnames = tuple(attnames)
+    manager = history_model._default_manager
+    pk_attname = history_model._meta.get_field("id").attname
+    object_ids = list(manager.order_by(pk_attname).values_list(pk_attname, flat=True).distinct())
+    converted = 0
+    for start in range(0, len(object_ids), batch_size):
+        rows = (
+            manager.filter(**{f"{pk_attname}__in": object_ids[start : start + batch_size]})
+            .order_by(pk_attname, "history_date", "history_id")
+            .values_list(pk_attname, "history_date", "history_id", HISTORY_DELTA_FIELD, *attnames)
+        )
+        records = []
+        for _, object_rows in groupby(rows, key=itemgetter(0)):
+            object_rows = list(object_rows)
+            snapshots = _fold_history(history_model, attnames, (row[2:] for row in object_rows))
+            previous, previous_month = None, None
+            for (_, history_date, *_), (history_id, values) in zip(object_rows, snapshots):
+                month = history_month(history_date)
+                if not to_deltas:
+                    record = history_model(history_id=history_id, **{HISTORY_DELTA_FIELD: None}, **values)
+                else:
+                    delta = {
+                        attname: value
+                        for attname, value in values.items()
+                        if month != previous_month or previous[attname] != value
+                    }
+                    record = history_model(
+                        history_id=history_id, **{HISTORY_DELTA_FIELD: delta}, **dict.fromkeys(attnames)
+                    )
+                records.append(record)
+                previous, previous_month = values, month
+        manager.bulk_update(records, [HISTORY_DELTA_FIELD, *attnames])
+        converted += len(records)
+    return converted
+
+
+class DeltaHistoricalModel(BufferedHistoricalModel):
+    """
+    Base of the historical models storing the delta fields as a delta, see DeltaHistoricalRecords
+    """
+
+    _history_delta_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        record = super().from_db(db, field_names, values)
+        if record.__dict__.get(HISTORY_DELTA_FIELD) is not None:
+            # Left unloaded, so they are rebuilt from the deltas when they are read
+            for attname in cls._history_delta_fields:
+                record.__dict__.pop(attname, None)
+        return record
+
+    def refresh_from_db(self, using=None, fields=None):
+        if fields is not None and self.__dict__.get(HISTORY_DELTA_FIELD) is not None:
+            delta_fields = set(fields).intersection(self._history_delta_fields)
+            if delta_fields:
+                apply_history_deltas([self])
+                fields = [field for field in fields if field not in delta_fields]
+                if not fields:
+                    return
+        super().refresh_from_db(using, fields)
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        if not self._state.adding or self.history_delta is not None or current_history_buffer(using) is not None:
+            # Buffered records are stored as deltas when the buffer is written
+            return super().save(*args, **kwargs)
+        with self.stored_as_deltas([self], using):
+            return super().save(*args, **kwargs)
+
+    @classmethod
+    def insert_history(cls, records: list, using: str) -> None:
+        with cls.stored_as_deltas(records, using):
+            super().insert_history(records, using)
+
+    @classmethod
+    @contextmanager
+    def stored_as_deltas(cls, records: list, using: str) -> Iterator[None]:
+        """
+        Store new records as deltas in a block: history_delta is set to the delta fields changed since
+        the previous record of the object, which may be one of the given records, and the columns of
+        the delta fields are cleared. Their values are put back at the end of the block.
+
+        The block runs in a transaction holding a lock on the history of each object, so that records
+        of the same object stored at the same time are not computed against the same previous record.
+
+        :param records: new records without a history_delta, oldest first
+        :param using: alias of the database the records are inserted in
+        """
+        pk_attname = cls.instance_type._meta.pk.attname
+        records = [record for record in records if record.history_delta is None]
+        with transaction.atomic(using=using):
+            cls.lock_history({getattr(record, pk_attname) for record in records}, using)
+            latest_values = {}
+            stale = set()
+            full_values = []
+            for record in records:
+                values = {attname: getattr(record, attname) for attname in cls._history_delta_fields}
+                key = (getattr(record, pk_attname), history_month(record.history_date))
+                if key in latest_values:
+                    previous = None if key in stale else latest_values[key]
+                else:
+                    previous, later = record.previous_delta_values(using)
+                    if later:
+                        # The next records of the object may come after the stored later record
+                        stale.add(key)
+                record.history_delta = {
+                    attname: value
+                    for attname, value in values.items()
+                    if previous is None or previous[attname] != value
+                }
+                record.__dict__.update(dict.fromkeys(values))
+                latest_values[key] = values
+                full_values.append((record, values))
+            try:
+                yield
+            finally:
+                for record, values in full_values:
+                    record.__dict__.update(values)
+
+    @classmethod
+    def lock_history(cls, object_ids: Iterable, using: str) -> None:
+        """
+        Take a lock on the history of objects until the end of the transaction
+
+        :param object_ids: primary keys of the objects
+        :param using: alias of the database
+        """
+        with connections[using].cursor() as cursor:
+            for object_id in sorted(object_ids):
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))", [f"{cls._meta.db_table}:{object_id}"]
+                )
+
+    def previous_delta_values(self, using: str) -> tuple[dict | None, bool]:
+        """
+        Values of the delta fields in the previous record of the object, if it is in the same month.
+        The first record of an object in a month stores all the fields, so the records of a month can
+        be rebuilt without the months before, which may have been detached.
+
+        A record dated after this one may already be stored, if it was created later but committed
+        first. Its delta doesn't take this record into account, so it is rewritten with all the fields,
+        and this record is stored with all the fields too.
+
+        :param using: alias of the database
+        :return: the values, or None if this record is to be stored with all the fields, and whether
+            a later record is stored
+        """
+        pk_attname = self.instance_type._meta.pk.attname
+        attnames = self._history_delta_fields
+        month = history_month(self.history_date)
+        manager = type(self)._default_manager.db_manager(using)
+        rows = list(
+            manager.filter(
+                **{pk_attname: getattr(self, pk_attname)},
+                history_date__gte=month,
+                history_date__lt=(month + datetime.timedelta(days=32)).replace(day=1),
+            )
+            .order_by("history_date", "history_id")
+            .values_list("history_date", "history_id", HISTORY_DELTA_FIELD, *attnames)
+        )
+        earlier = [row for row in rows if row[0] <= self.history_date]
+        if len(earlier) < len(rows):
+            history_date, history_id, delta, *_ = rows[len(earlier)]
+            if delta is not None and not set(attnames).issubset(delta):
+                *_, (_, values) = _fold_history(type(self), attnames, (row[1:] for row in rows[: len(earlier) + 1]))
+                manager.filter(history_date=history_date, history_id=history_id).update(**{HISTORY_DELTA_FIELD: values})
+            return None, True
+        if not rows:
+            return None, False
+        *_, (_, values) = _fold_history(type(self), attnames, (row[1:] for row in rows))
+        return values, False
+
+
+class DeltaHistoricalQuerySet(HistoricalQuerySet):
+    """
+    Historical queryset rebuilding the delta fields of all the records it fetches at once
+    """
+
+    def _instanceize(self):
+        # Called after every fetch, before the records are turned into instances
+        if self._result_cache and isinstance(self._result_cache[0], DeltaHistoricalModel):
+            apply_history_deltas(self._result_cache)
+        super()._instanceize()
+
+
+class DeltaHistoryDescriptor(HistoryDescriptor):
+    def __get__(self, instance, owner):
+        return HistoryManager.from_queryset(DeltaHistoricalQuerySet)(self.model, instance)
+
+
+class DeltaHistoricalRecords(IndexedHistoricalRecords):
+    """
+    Historical records storing the changed values of the delta fields only.
+
+    A full copy of the row is written to the history on every save, so a model with long text
+    fields repeats them in every record, whichever field changed. The delta fields are instead
+    stored in the history_delta JSON object, holding the fields changed since the previous record,
+    and their columns are left NULL. The first record of an object in each month holds all the
+    fields, so every month can be read on its own.
+
+    Records read through the history manager, the admin or one by one get their delta fields
+    rebuilt, and can be used as usual, e.g. with diff_against or instance. values() and raw SQL
+    see the stored form. Records without a history_delta, e.g. written by bulk_history_create, are
+    full rows.
+    """
+
+    def __init__(self, *args, delta_fields: Iterable[str] | None = None, **kwargs):
+        """
+        :param delta_fields: names of the fields stored as deltas, by default all the nullable fields
+            which are not relations
+        """
+        super().__init__(*args, bases=(DeltaHistoricalModel, PostgresPartitionedModel), **kwargs)
+        self.delta_fields = None if delta_fields is None else tuple(delta_fields)
+
+    def get_extra_fields(self, model, fields):
+        extra_fields = super().get_extra_fields(model, fields)
+        if self.delta_fields is None:
+            delta_fields = tuple(
+                name
+                for name, field in fields.items()
+                if field.null and not field.is_relation and name != model._meta.pk.name
+            )
+        else:
+            delta_fields = self.delta_fields
+            for name in delta_fields:
+                if name not in fields or not fields[name].null or fields[name].is_relation:
+                    raise ImproperlyConfigured(f"{model.__name__}.{name} can't be stored as a delta")
+        extra_fields[HISTORY_DELTA_FIELD] = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+        extra_fields["_history_delta_fields"] = delta_fields
+        return extra_fields
+
+    def finalize(self, sender, **kwargs):
+        super().finalize(sender, **kwargs)
+        if sender is self.cls:
+            history_model = getattr(sender, self.manager_name).model
+            setattr(sender, self.manager_name, DeltaHistoryDescriptor(history_model))
@@ -1,6 +1,9 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
+
+from .history import PartitionedHistoricalRecords
 
 
 class RegistrantTypeChoices(models.TextChoices):
@@ -43,10 +46,14 @@ class Registrant(models.Model):
     type = models.CharField(choices=RegistrantTypeChoices.choices, max_length=100)
 
     # maintain history
-    history = HistoricalRecords()
+    history = PartitionedHistoricalRecords()
 
     class Meta:
         unique_together = ("name", "type")
+        indexes = [
+            # Trigram index used by the admin search on the registrant organisation name
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="registrant_name_trgm"),
+        ]
 
     def __str__(self):
         return self.name
@@ -65,7 +72,13 @@ class Registrar(models.Model):
     active = models.BooleanField(default=True)
 
     # maintain history
-    history = HistoricalRecords()
+    history = PartitionedHistoricalRecords()
+
+    class Meta:
+        indexes = [
+            # Trigram index used by the admin search on the registrar organisation name
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="registrar_name_trgm"),
+        ]
 
     def __str__(self):
         return self.name
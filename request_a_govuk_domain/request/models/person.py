@@ -1,6 +1,7 @@
 from django.db import models
 from phonenumber_field.modelfields import PhoneNumberField
-from simple_history.models import HistoricalRecords
+
+from .history import PartitionedHistoricalRecords
 
 
 class Person(models.Model):
@@ -14,7 +15,7 @@ class Person(models.Model):
     phone_number = PhoneNumberField(blank=True)
 
     # maintain history
-    history = HistoricalRecords(inherit=True)
+    history = PartitionedHistoricalRecords(inherit=True)
 
     def __str__(self):
         return self.name
@@ -1,6 +1,6 @@
+import markdown
 from django.core.validators import MinLengthValidator
 from django.db import models
-from simple_history.models import HistoricalRecords
 
 from request_a_govuk_domain.request.models.review_choices import (
     DomainNameAvailabilityReviewChoices,
@@ -15,6 +15,8 @@ from request_a_govuk_domain.request.models.review_choices import (
 )
 
 from .application import Application
+from .dirty_fields import DirtyFieldsMixin
+from .history import DeltaHistoricalRecords
 
 NOTES_MAX_LENGTH = 5000
 NOTES_MIN_LENGTH = 1
@@ -22,7 +24,7 @@ NOTES_MIN_LENGTH = 1
 
 # We've added simple-history to the dependencies but need to implement it,
 # principally for this class.
-class Review(models.Model):
+class Review(DirtyFieldsMixin, models.Model):
     """
     An extension of the Application class (has a one-to-one) relationship
     to hold details of the review carried out by the reviewing team. Each
@@ -116,7 +118,7 @@ class Review(models.Model):
     )
 
     # maintain history
-    history = HistoricalRecords()
+    history = DeltaHistoricalRecords()
 
     def is_approvable(self) -> bool:
         if (
@@ -156,3 +158,12 @@ class Review(models.Model):
 class ReviewFormGuidance(models.Model):
     name = models.CharField()
     how_to = models.CharField()
+    # how_to rendered from markdown, so the review form doesn't have to render it on every request
+    how_to_html = models.TextField(blank=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        self.how_to_html = markdown.markdown(self.how_to)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "how_to" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "how_to_html"}
+        super().save(*args, **kwargs)
@@ -1,10 +1,87 @@
+import os
+import threading
+from typing import Callable
+
+from botocore.config import Config
+from django.apps import apps
 from django.conf import settings
-from django.core.files.storage import FileSystemStorage
+from django.core.files.storage import FileSystemStorage, Storage
+from django.db import models
 from storages.backends.s3boto3 import S3Boto3Storage
 
 TEMP_STORAGE_ROOT = "temp_files/"
 
 
+class StorageRegistry:
+    """
+    Process-wide storage instances, created on first use.
+
+    Creating an S3Boto3Storage is cheap, but each instance creates its own boto3 session, client and
+    connection pool for every thread using it, so a storage created per call never reuses a connection.
+    The storages of the registry are shared by every thread of the process: S3Boto3Storage keeps a
+    connection per thread, which a thread reuses for as long as it lives.
+
+    Connections are not shared across a fork, e.g. with Celery prefork or gunicorn preload: the child
+    process replaces the storages inherited from the parent with new ones, see after_fork.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._storages: dict[str, Storage] = {}
+        self._factories: dict[str, Callable[[], Storage]] = {}
+
+    def get(self, key: str, factory: Callable[[], Storage]) -> Storage:
+        """
+        :param key: name of the storage
+        :param factory: creates the storage the first time it is used
+        :return: the storage of the process with that name
+        """
+        storage = self._storages.get(key)
+        if storage is None:
+            with self._lock:
+                storage = self._storages.get(key)
+                if storage is None:
+                    storage = self._storages[key] = factory()
+                    self._factories[key] = factory
+        return storage
+
+    def after_fork(self):
+        """
+        Replace the storages inherited from the parent process, and the connections they hold, with new
+        ones. The FileFields got their storage when the models were defined, so the fields using one of
+        the replaced storages are given the new one.
+        """
+        self._lock = threading.Lock()
+        replaced = {}
+        for key, storage in list(self._storages.items()):
+            self._storages[key] = self._factories[key]()
+            replaced[id(storage)] = self._storages[key]
+        if not replaced or not apps.models_ready:
+            return
+        for model in apps.get_models():
+            for field in model._meta.fields:
+                if isinstance(field, models.FileField) and id(field.storage) in replaced:
+                    field.storage = replaced[id(field.storage)]
+
+    def clear(self):
+        with self._lock:
+            self._storages.clear()
+            self._factories.clear()
+
+
+storage_registry = StorageRegistry()
+os.register_at_fork(after_in_child=storage_registry.after_fork)
+
+
+def s3_client_config() -> Config:
+    """
+    Client configuration of the S3 storages: a connection pool large enough for the threads sharing a
+    client, e.g. when copying evidence files concurrently, and TCP keep-alive so idle connections in the
+    pool are not silently dropped
+    """
+    return Config(max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS, tcp_keepalive=True)
+
+
 def select_storage():
     """
     Utility method to select the storage type based on where the application is run.
@@ -12,7 +89,11 @@ def select_storage():
     with the same name.
     :return:
     """
-    return S3Boto3Storage(location=TEMP_STORAGE_ROOT) if settings.S3_STORAGE_ENABLED else FileSystemStorage()
+    if settings.S3_STORAGE_ENABLED:
+        return storage_registry.get(
+            "temp", lambda: S3Boto3Storage(location=TEMP_STORAGE_ROOT, client_config=s3_client_config())
+        )
+    return storage_registry.get("filesystem", FileSystemStorage)
 
 
 def s3_root_storage():
@@ -20,4 +101,13 @@ def s3_root_storage():
     Storage instance that allows access from the root level on S3
     :return:
     """
-    return S3Boto3Storage()
+    return storage_registry.get("root", lambda: S3Boto3Storage(client_config=s3_client_config()))
+
+
+def root_storage():
+    """
+    Storage instance giving access to the evidence files from the root level: the root of the bucket
+    on S3, MEDIA_ROOT otherwise
+    :return:
+    """
+    return s3_root_storage() if settings.S3_STORAGE_ENABLED else select_storage()
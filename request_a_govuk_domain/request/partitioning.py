@@ -0,0 +1,196 @@
+"""
+Monthly partitions of the historical tables.
+
+The historical models are partitioned by range of history_date (see models.history). Partitions
+are created a few months ahead, and partitions older than the retention period are detached from
+their historical table rather than dropped: the rows leave the history shown in the admin and stop
+slowing down its queries, but stay in the database until they are archived or dropped by hand.
+
+The rows written before a table was partitioned are in its legacy partition, from MINVALUE to the
+first monthly partition, see migration 0030. It is detached like the monthly partitions once its
+upper bound is older than the retention period.
+
+This is run daily by a Celery beat task, and can be run with the partition_history command.
+"""
+
+import logging
+import re
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connections
+from psqlextra.models import PostgresPartitionedModel
+from psqlextra.partitioning import (
+    PostgresCurrentTimePartitioningStrategy,
+    PostgresModelPartitioningPlan,
+    PostgresPartition,
+    PostgresPartitioningConfig,
+    PostgresPartitioningManager,
+    PostgresPartitioningPlan,
+    PostgresTimePartition,
+    PostgresTimePartitionSize,
+)
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PARTITION_SIZE = PostgresTimePartitionSize(months=1)
+# Name of the partition of the rows written before the table was partitioned, see migration 0030
+LEGACY_PARTITION_NAME = "legacy"
+
+
+def detach_partition(model, schema_editor, name: str):
+    schema_editor.execute(
+        "ALTER TABLE %s DETACH PARTITION %s"
+        % (
+            schema_editor.quote_name(model._meta.db_table),
+            schema_editor.quote_name(schema_editor.create_partition_table_name(model, name)),
+        )
+    )
+
+
+class DetachedTimePartition(PostgresTimePartition):
+    """
+    Time partition which is detached from its table when it is deleted, instead of being dropped
+    """
+
+    def delete(self, model, schema_editor) -> None:
+        detach_partition(model, schema_editor, self.name())
+
+
+class LegacyPartition(PostgresPartition):
+    """
+    The legacy partition of a historical table, which is only ever detached
+
+    :param end_datetime: upper bound of the partition
+    """
+
+    def __init__(self, end_datetime: datetime):
+        self.end_datetime = end_datetime
+
+    def name(self) -> str:
+        return LEGACY_PARTITION_NAME
+
+    def create(self, model, schema_editor, comment=None) -> None:
+        raise NotImplementedError("The legacy partitions are created by migration 0030")
+
+    def delete(self, model, schema_editor) -> None:
+        detach_partition(model, schema_editor, self.name())
+
+    def deconstruct(self) -> dict:
+        return {**super().deconstruct(), "end_datetime": self.end_datetime}
+
+
+class HistoryPartitioningStrategy(PostgresCurrentTimePartitioningStrategy):
+    """
+    Monthly partitions created ahead of the current month, detached once older than max_age.
+
+    Only the months after the current one are created: the partition of the current month was created
+    ahead, or the month is covered by the legacy partition when the tables have just been partitioned.
+    """
+
+    def to_create(self):
+        start_datetime = self.size.start(self.get_start_datetime())
+        for _ in range(self.count):
+            start_datetime += self.size.as_delta()
+            yield PostgresTimePartition(size=self.size, start_datetime=start_datetime, name_format=self.name_format)
+
+    def to_delete(self):
+        for partition in super().to_delete():
+            yield DetachedTimePartition(
+                size=partition.size, start_datetime=partition.start_datetime, name_format=partition.name_format
+            )
+
+    def legacy_to_delete(self, model, using: str | None = None) -> LegacyPartition | None:
+        """
+        :param model: the historical model
+        :param using: alias of the database
+        :return: the legacy partition of the table if it is attached and its upper bound is older than max_age
+        """
+        if not self.max_age:
+            return None
+        table = model._meta.db_table
+        with connections[using or "default"].cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = %s::regclass AND c.relname = %s",
+                [table, f"{table}_{LEGACY_PARTITION_NAME}"],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        # e.g. FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00+00')
+        end_datetime = datetime.fromisoformat(re.search(r"TO \('([^']+)'\)", row[0])[1])
+        if end_datetime > self.get_start_datetime() - self.max_age:
+            return None
+        return LegacyPartition(end_datetime)
+
+
+class HistoryPartitioningManager(PostgresPartitioningManager):
+    """
+    Also plans the detaching of the expired legacy partitions, see HistoryPartitioningStrategy.legacy_to_delete.
+    psqlextra only deletes the partitions it created, going back from the last expired one to the first one
+    missing, so it never gets to the legacy partitions.
+    """
+
+    def _plan_for_config(self, config, skip_create=False, skip_delete=False, using=None):
+        model_plan = super()._plan_for_config(config, skip_create, skip_delete, using)
+        legacy = None if skip_delete else config.strategy.legacy_to_delete(config.model, using)
+        if legacy is None:
+            return model_plan
+        model_plan = model_plan or PostgresModelPartitioningPlan(config)
+        model_plan.deletions.append(legacy)
+        return model_plan
+
+
+def history_models() -> list[type[PostgresPartitionedModel]]:
+    """
+    :return: the partitioned historical models of the request app
+    """
+    return [
+        model for model in apps.get_app_config("request").get_models() if issubclass(model, PostgresPartitionedModel)
+    ]
+
+
+def history_partitioning_manager() -> HistoryPartitioningManager:
+    max_age = relativedelta(months=settings.HISTORY_RETENTION_MONTHS) if settings.HISTORY_RETENTION_MONTHS else None
+    return HistoryPartitioningManager(
+        [
+            PostgresPartitioningConfig(
+                model=model,
+                strategy=HistoryPartitioningStrategy(
+                    size=HISTORY_PARTITION_SIZE, count=settings.HISTORY_PARTITION_MONTHS_AHEAD, max_age=max_age
+                ),
+            )
+            for model in history_models()
+        ]
+    )
+
+
+def manage_history_partitions(dry_run: bool = False) -> PostgresPartitioningPlan:
+    """
+    Create the upcoming partitions of the historical tables, and detach the expired ones.
+
+    Each table is changed in its own transaction, so a failure on one table, e.g. a new partition
+    overlapping rows already in the default partition, is logged and does not stop the others.
+    :param dry_run: only plan the changes
+    :return: the plan of the partitions created and detached, without the tables which failed
+    """
+    plan = history_partitioning_manager().plan()
+    if dry_run:
+        return plan
+    applied = []
+    for model_plan in plan.model_plans:
+        table = model_plan.config.model._meta.db_table
+        try:
+            model_plan.apply(using=None)
+        except DatabaseError:
+            logger.exception("Could not update the partitions of %s", table)
+            continue
+        applied.append(model_plan)
+        for partition in model_plan.creations:
+            logger.info("Created partition %s of %s", partition.name(), table)
+        for partition in model_plan.deletions:
+            logger.info("Detached partition %s of %s", partition.name(), table)
+    return PostgresPartitioningPlan(applied)
@@ -0,0 +1,129 @@
+"""
+Asynchronous virus scanning of the evidence files.
+
+By default uploads are scanned by the upload form, and the user waits for clamd. With
+settings.CLAMD_SCAN_ASYNC, an upload is stored in temp_files/ straight away and scanned by a Celery task.
+The upload confirmation page shows the status of the scan, refreshing itself while it is pending, and
+the application cannot be submitted until every evidence file is clean. An infected file is deleted by
+the task.
+
+The statuses are kept in the shared cache, by name of the stored file, for as long as a session lasts.
+A file whose status is lost, e.g. evicted from the cache, is scanned again. The cache must be shared by
+the web and Celery processes, see check_settings. A file the task could not scan, even after its
+retries, is marked as failed, and the user is asked to upload it again.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+from .caches import is_shared_cache
+from .clamav import get_scanner
+from .models.storage_util import select_storage
+
+logger = logging.getLogger(__name__)
+
+# Types of evidence files, prefix of their fields in the registration data
+EVIDENCE_PAGE_TYPES = ("exemption", "minister", "written_permission")
+
+
+class ScanStatus(models.TextChoices):
+    PENDING = "pending", "Scanning"
+    CLEAN = "clean", "Uploaded"
+    INFECTED = "infected", "Infected"
+    FAILED = "failed", "Not scanned"
+
+
+def check_settings() -> None:
+    """
+    Raise ImproperlyConfigured if the statuses can't be shared with the Celery worker
+    """
+    if settings.CLAMD_SCAN_ASYNC and not is_shared_cache(DEFAULT_CACHE_ALIAS):
+        raise ImproperlyConfigured(
+            "CLAMD_SCAN_ASYNC needs a cache shared by the web and Celery processes, e.g. set REDIS_CACHE_URL"
+        )
+
+
+def status_key(name: str) -> str:
+    return f"scan-status:{name}"
+
+
+def queue_scan(name: str) -> None:
+    """
+    Scan a stored file in a Celery task
+
+    :param name: name of the file in the temporary storage
+    """
+    from .tasks import scan_evidence
+
+    cache.set(status_key(name), ScanStatus.PENDING.value, settings.SESSION_COOKIE_AGE)
+    scan_evidence.delay(name)
+
+
+def scan_status(name: str) -> ScanStatus:
+    """
+    :param name: name of the file in the temporary storage
+    :return: the status of the scan of the file. Files are clean once stored unless scanned asynchronously.
+    """
+    if not settings.CLAMD_SCAN_ASYNC:
+        return ScanStatus.CLEAN
+    status = cache.get(status_key(name))
+    if status is None:
+        logger.info("Scan status of %s not found, scanning it again", name)
+        queue_scan(name)
+        return ScanStatus.PENDING
+    return ScanStatus(status)
+
+
+def forget_scan_status(name: str) -> None:
+    cache.delete(status_key(name))
+
+
+def scan_stored_file(name: str) -> ScanStatus | None:
+    """
+    Scan a stored file, and record the status of the scan. An infected file is deleted.
+
+    :param name: name of the file in the temporary storage
+    :return: the status of the scan, None if the file no longer exists
+    """
+    storage = select_storage()
+    if not storage.exists(name):
+        forget_scan_status(name)
+        return None
+    if settings.IS_SCANNING_ENABLED:
+        with storage.open(name, "rb") as file:
+            result = get_scanner().scan(file)
+        status = ScanStatus.INFECTED if result.infected else ScanStatus.CLEAN
+    else:
+        logger.warning("Clam is not enabled on AWS")
+        status = ScanStatus.CLEAN
+    if status == ScanStatus.INFECTED:
+        logger.warning("Uploaded file %s is infected with %s, deleting it", name, result.signature)
+        storage.delete(name)
+    cache.set(status_key(name), status.value, settings.SESSION_COOKIE_AGE)
+    return status
+
+
+def record_scan_failure(name: str) -> None:
+    """
+    Record that a stored file could not be scanned, once the task gives up
+
+    :param name: name of the file in the temporary storage
+    """
+    logger.error("Could not scan %s, giving up", name)
+    cache.set(status_key(name), ScanStatus.FAILED.value, settings.SESSION_COOKIE_AGE)
+
+
+def evidence_scan_statuses(registration_data: dict) -> dict[str, ScanStatus]:
+    """
+    :param registration_data: registration data of a session
+    :return: the status of the scan of each evidence file uploaded, by page type
+    """
+    return {
+        page_type: scan_status(name)
+        for page_type in EVIDENCE_PAGE_TYPES
+        if (name := registration_data.get(f"{page_type}_file_uploaded_filename"))
+    }
@@ -0,0 +1,20 @@
+"""
+Signal handlers keeping the reference data caches in step with the database
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caches import guidance_cache, registrar_cache
+from .models.organisation import Registrar
+from .models.review import ReviewFormGuidance
+
+
+@receiver([post_save, post_delete], sender=Registrar, dispatch_uid="invalidate_registrar_cache")
+def invalidate_registrar_cache(sender, **kwargs):
+    registrar_cache.invalidate()
+
+
+@receiver([post_save, post_delete], sender=ReviewFormGuidance, dispatch_uid="invalidate_guidance_cache")
+def invalidate_guidance_cache(sender, **kwargs):
+    guidance_cache.invalidate()
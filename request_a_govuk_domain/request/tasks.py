@@ -1,12 +1,15 @@
 import logging
 import re
 
-from celery import shared_task
+from botocore.exceptions import BotoCoreError, ClientError
+from celery import Task, shared_task
 from django.db import transaction
 from dotenv import load_dotenv
 from notifications_python_client import NotificationsAPIClient
 from notifications_python_client.errors import HTTPError
 
+from request_a_govuk_domain.request import holidays, partitioning, scanning
+from request_a_govuk_domain.request.clamav import ClamdError
 from request_a_govuk_domain.request.constants import NOTIFY_TEMPLATE_ID_MAP
 from request_a_govuk_domain.request.models import (
     Application,
@@ -147,3 +150,47 @@ def check_email_failure_and_notify() -> None:
                     # Delete the notification response id, as the necessary action after email failure email has been
                     # taken, so no need to track anymore
                     notification_response_id.delete()
+
+
+@shared_task
+def refresh_bank_holidays() -> None:
+    """
+    Updates the stored bank holidays from gov.uk, used to count the business days taken to process applications
+    """
+    holidays.refresh_bank_holidays()
+
+
+@shared_task
+def manage_history_partitions() -> None:
+    """
+    Creates the upcoming monthly partitions of the historical tables, and detaches the expired ones
+    """
+    partitioning.manage_history_partitions()
+
+
+@shared_task(autoretry_for=(BotoCoreError, ClientError), retry_backoff=True, max_retries=5)
+def promote_evidence(application_id: int) -> None:
+    """
+    Moves the evidence files of an application from the temporary folder to the application folder,
+    queued when an application is saved with new evidence files
+    """
+    Application.promote_evidence(application_id)
+
+
+class ScanEvidenceTask(Task):
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        # Out of retries, or failed for good: the upload confirmation page must stop waiting
+        scanning.record_scan_failure(*args, **kwargs)
+
+
+@shared_task(
+    base=ScanEvidenceTask,
+    autoretry_for=(ClamdError, OSError, BotoCoreError, ClientError),
+    retry_backoff=True,
+    max_retries=5,
+)
+def scan_evidence(name: str) -> None:
+    """
+    Scans an uploaded evidence file for viruses, queued on upload when settings.CLAMD_SCAN_ASYNC is set
+    """
+    scanning.scan_stored_file(name)
@@ -4,27 +4,16 @@ from zoneinfo import ZoneInfo
 from django import template
 from django.contrib.auth.models import User
 
+from request_a_govuk_domain.request.admin.history import (
+    history_page,
+    since_submission,
+    status_change_page,
+)
 from request_a_govuk_domain.request.models import Application
 
 register = template.Library()
 
 
-@register.filter(is_safe=True)
-def changed_fields(obj):
-    """
-    Function to derive the changed fields from an object.
-    If none of the fields are changed and still, there is a history object, then it suggests
-    that the application was saved while updating the review.
-    :param obj:
-    :return:
-    """
-    if obj.prev_record:
-        delta = obj.diff_against(obj.prev_record)
-        changes = list(filter(lambda x: x != "last_updated_by", delta.changed_fields))
-        return ", ".join(changes) if changes else "No Changes"
-    return "Initial Data"
-
-
 @register.filter
 def application_admin_url(value, arg):
     return "admin:%s_%s_%s" % ("request", "application", arg)
@@ -32,12 +21,23 @@ def application_admin_url(value, arg):
 
 @register.inclusion_tag("simple_history/_review_object_history_list.html", takes_context=True)
 def display_review_list(context):
-    context["application_history"] = Application.history.filter(id=context["object"].application.id).order_by("-pk")
+    request = context["request"]
+    application = context["object"].application
+    context["application_history"] = status_change_page(
+        since_submission(Application.history.filter(id=application.id), application), request.GET.get("status_page")
+    )
+    context["action_list"] = history_page(
+        since_submission(context["action_list"], application), request.GET.get("page")
+    )
     return context
 
 
 @register.inclusion_tag("simple_history/_application_object_history_list.html", takes_context=True)
 def display_application_list(context):
+    action_list = since_submission(context["action_list"], context["object"])
+    context["action_list"] = history_page(
+        action_list.select_related("last_updated_by"), context["request"].GET.get("page")
+    )
     return context
 
 
@@ -53,33 +53,6 @@ def owner_filter(application):
     )
 
 
-@register.simple_tag
-def history_type(action, **kwargs):
-    return str(action[0].instance_type.__name__)
-
-
-@register.simple_tag
-def should_display(action, **kwargs):
-    """
-    Check the given history object should be displayed.
-    Returns true if this is the last record in the history or if there is a difference in the following
-    fields.
-     # status
-     # last_updated_by
-     # owner
-    :param action:
-    :param kwargs:
-    :return:
-    """
-
-    return (
-        not action.next_record
-        or action.next_record.status != action.status
-        or action.next_record.last_updated_by != action.last_updated_by
-        or action.next_record.owner != action.owner
-    )
-
-
 @register.filter(is_safe=True)
 def format_date(date):
     return date.astimezone(ZoneInfo("Europe/London")).strftime("%d %b %Y %H:%M:%S %p") if date else "-"
@@ -116,3 +89,13 @@ def format_username_or_me(user: User, logged_in_username: str) -> str:
         return "me"
     else:
         return format_username(user)
+
+
+@register.simple_tag(takes_context=True)
+def page_url(context, page_parameter: str, page_number: int) -> str:
+    """
+    Query string for the current page with the given page parameter changed, keeping any other parameters
+    """
+    query = context["request"].GET.copy()
+    query[page_parameter] = page_number
+    return f"?{query.urlencode()}"
@@ -0,0 +1,443 @@
+"""
+Single pass handling of the evidence uploads.
+
+Django's default upload handlers buffer an upload in memory or in a temporary file, which is then read
+again to be scanned, and again to be stored. EvidenceUploadHandler handles the chunks of the upload as
+they are received instead:
+
+- the file type is sniffed from the magic bytes of the first chunk, rather than trusted from the browser
+- the CSRF token is checked from the fields read before the file, before anything is stored or scanned:
+  the upload of a forged request is dropped, and the view rejects the request
+- the upload is refused if it is not of an allowed type, or once larger than settings.MAX_UPLOAD_SIZE,
+  or straight away if the Content-Length of the request is too large for the file to fit: nothing more
+  is stored or scanned, and UploadForm reports the error with the fields read before the file, e.g. the
+  CSRF token. The rest of the request is read and dropped, as a server closing the connection on unread
+  data makes the browser show a "connection reset" page rather than the error. Only requests larger
+  than DRAINED_REQUEST_LIMIT are cut short, for their connection to be reset.
+- chunks are streamed to clamd with INSTREAM, unless scanning is asynchronous, see scanning, or no
+  connection to clamd is free: the handler does not wait for one, and UploadForm scans the stored file
+- the SHA-256 of the file is computed: once the file is received, a verdict of the scan verdict cache
+  for it is used, and the clamd stream is abandoned without waiting for the reply of clamd
+- chunks are written to the storage: an S3 multipart upload, or the file in MEDIA_ROOT
+
+Memory use is bounded by the S3 part size. The handler gives an EvidenceUploadedFile, already stored
+and scanned. An infected file is deleted once scanned.
+"""
+
+import copy
+import hashlib
+import logging
+import mimetypes
+import os
+import tempfile
+import uuid
+from contextlib import ExitStack
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, Storage
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    StopFutureHandlers,
+    StopUpload,
+)
+from django.http.multipartparser import MultiPartParser
+from django.middleware.csrf import CsrfViewMiddleware
+from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+from .clamav import ClamdBusyError, ClamdError, ScanResult, ScanStream, get_scanner
+from .models.storage_util import select_storage
+
+logger = logging.getLogger(__name__)
+
+# Magic bytes starting the files of each allowed type, see settings.CONTENT_TYPES
+MAGIC_BYTES = {
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"%PDF-": "application/pdf",
+}
+UNKNOWN_CONTENT_TYPE = "application/octet-stream"
+# Allowance for the other fields of an upload form and the multipart framing, on top of the file itself
+MULTIPART_ALLOWANCE = 64 * 1024
+# Largest request whose rest is read and dropped once its upload is refused, so the browser gets the error
+DRAINED_REQUEST_LIMIT = 50 * 1024 * 1024
+
+
+def sniff_content_type(header: bytes) -> str:
+    """
+    :param header: the first bytes of a file
+    :return: the content type of the file, application/octet-stream if it is not an allowed type
+    """
+    return next(
+        (content_type for magic, content_type in MAGIC_BYTES.items() if header.startswith(magic)),
+        UNKNOWN_CONTENT_TYPE,
+    )
+
+
+class StorageUpload:
+    """
+    A file written to a storage a chunk at a time
+
+    :param storage: the storage
+    :param name: name of the file in the storage
+    """
+
+    def __init__(self, storage: Storage, name: str):
+        self.storage = storage
+        self.name = name
+
+    def write(self, data: bytes):
+        raise NotImplementedError
+
+    def complete(self) -> str:
+        """
+        :return: the name of the file stored
+        """
+        raise NotImplementedError
+
+    def abort(self):
+        """
+        Drop the data written
+        """
+        raise NotImplementedError
+
+
+class S3MultipartUpload(StorageUpload):
+    """
+    A file written to S3 in a multipart upload, a part every PART_SIZE bytes
+    """
+
+    # The smallest part size allowed by S3, except for the last part
+    PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(self, storage: S3Boto3Storage, name: str):
+        super().__init__(storage, name)
+        self.client = storage.connection.meta.client
+        self.key = storage._normalize_name(clean_name(name))
+        content_type, _ = mimetypes.guess_type(name)
+        self.upload_id = self.client.create_multipart_upload(
+            Bucket=storage.bucket_name,
+            Key=self.key,
+            ContentType=content_type or UNKNOWN_CONTENT_TYPE,
+            **storage.get_object_parameters(name),
+        )["UploadId"]
+        self.buffer = bytearray()
+        self.parts = []
+
+    def write(self, data: bytes):
+        self.buffer += data
+        if len(self.buffer) >= self.PART_SIZE:
+            self._upload_part()
+
+    def _upload_part(self):
+        number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=number,
+            Body=bytes(self.buffer),
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": number})
+        self.buffer.clear()
+
+    def complete(self) -> str:
+        if self.buffer or not self.parts:
+            self._upload_part()
+        self.client.complete_multipart_upload(
+            Bucket=self.storage.bucket_name,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
+        return self.name
+
+    def abort(self):
+        self.buffer.clear()
+        try:
+            self.client.abort_multipart_upload(Bucket=self.storage.bucket_name, Key=self.key, UploadId=self.upload_id)
+        except (BotoCoreError, ClientError):
+            logger.exception("Could not abort the upload of %s", self.key)
+
+
+class FileSystemUpload(StorageUpload):
+    """
+    A file written straight to its place on the file system
+    """
+
+    def __init__(self, storage: FileSystemStorage, name: str):
+        super().__init__(storage, name)
+        self.path = storage.path(name)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, "xb")
+
+    def write(self, data: bytes):
+        self.file.write(data)
+
+    def complete(self) -> str:
+        self.file.close()
+        if self.storage.file_permissions_mode is not None:
+            os.chmod(self.path, self.storage.file_permissions_mode)
+        return self.name
+
+    def abort(self):
+        self.file.close()
+        os.remove(self.path)
+
+
+class BufferedStorageUpload(StorageUpload):
+    """
+    A file written to a temporary file, then saved in any other storage
+    """
+
+    def __init__(self, storage: Storage, name: str):
+        super().__init__(storage, name)
+        self.file = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+
+    def write(self, data: bytes):
+        self.file.write(data)
+
+    def complete(self) -> str:
+        with self.file:
+            self.file.seek(0)
+            return self.storage.save(self.name, File(self.file))
+
+    def abort(self):
+        self.file.close()
+
+
+def open_storage_upload(storage: Storage, name: str) -> StorageUpload:
+    if isinstance(storage, S3Boto3Storage):
+        return S3MultipartUpload(storage, name)
+    if isinstance(storage, FileSystemStorage):
+        return FileSystemUpload(storage, name)
+    return BufferedStorageUpload(storage, name)
+
+
+class EvidenceMultiPartParser(MultiPartParser):
+    """
+    A multipart parser giving the fields parsed so far, for EvidenceUploadHandler to check the CSRF token
+    once it reaches the file
+    """
+
+    @property
+    def fields(self):
+        return self._post
+
+
+class EvidenceUploadedFile(UploadedFile):
+    """
+    A file uploaded through EvidenceUploadHandler, already stored. Its content is read from the storage.
+
+    :param stored_name: name of the file in the temporary storage, None if it was refused or is infected
+    :param sha256: hex digest of the file
+    :param scan_result: result of the scan of the file, None if it was not scanned as it was uploaded
+    :param refused: whether the file was dropped as too large or not of an allowed type
+    """
+
+    def __init__(
+        self,
+        name: str,
+        content_type: str,
+        size: int,
+        charset: str | None,
+        stored_name: str | None,
+        sha256: str,
+        scan_result: ScanResult | None,
+        refused: bool,
+        content_type_extra=None,
+    ):
+        self.stored_name = stored_name
+        self.sha256 = sha256
+        self.scan_result = scan_result
+        self.refused = refused
+        self._file = None
+        super().__init__(None, name, content_type, size, charset, content_type_extra)
+
+    @property
+    def file(self):
+        if self._file is None and self.stored_name is not None:
+            self._file = select_storage().open(self.stored_name, "rb")
+        return self._file
+
+    @file.setter
+    def file(self, file):
+        self._file = file
+
+
+class EvidenceUploadHandler(FileUploadHandler):
+    """
+    Handles the evidence uploads in a single pass, see the module documentation. It must be the only
+    upload handler of the request.
+
+    A refused upload stops the parsing of the request, so the file is not in request.FILES: it is given
+    by refused_file instead. The rest of the request is dropped, see the module documentation.
+
+    Files are stored before the view checks the request, so the view must delete the ones it does not
+    keep, see delete_stored_files.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.request_content_length = 0
+        self.parser: EvidenceMultiPartParser | None = None
+        self.refused_file: EvidenceUploadedFile | None = None
+        self.stored_names: list[str] = []
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        self.request_content_length = content_length
+        if self.parser is None:
+            # Parsed by a parser whose fields can be read before the end of the request, see new_file
+            self.parser = EvidenceMultiPartParser(META, input_data, [self], encoding)
+            return self.parser.parse()
+        return None
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+        self.sniffed_content_type = None
+        self.refused = False
+        self.storage_upload: StorageUpload | None = None
+        self.resources = ExitStack()
+        self.scan: ScanStream | None = None
+        self.signature_version = None
+
+        if not self.csrf_token_valid():
+            # Nothing stored or scanned for a forged request, which the view rejects
+            logger.warning(f"Dropping upload of {file_name}: the CSRF token is missing or incorrect")
+            raise StopUpload(connection_reset=self.request_content_length > DRAINED_REQUEST_LIMIT)
+
+        if self.request_content_length > int(settings.MAX_UPLOAD_SIZE) + MULTIPART_ALLOWANCE:
+            # Too large whatever the other fields, refused before reading any of the file
+            self.size = self.request_content_length
+            self.refuse()
+
+        _, extension = os.path.splitext(file_name)
+        name = f"{self.request.session.session_key}/{uuid.uuid4()}{extension.lower()}"
+        logger.info(f"Saving {file_name} in to {name}")
+        self.storage_upload = open_storage_upload(select_storage(), name)
+        if settings.IS_SCANNING_ENABLED and not settings.CLAMD_SCAN_ASYNC:
+            scanner = get_scanner()
+            try:
+                # Without a free connection, scanned from the storage by the upload form rather than waiting
+                self.scan = self.resources.enter_context(scanner.stream(wait=False))
+                if scanner.verdict_cache is not None:
+                    self.signature_version = scanner.signature_version(wait=False)
+            except ClamdBusyError:
+                logger.info("No connection to clamd free to scan %s as it is uploaded", file_name)
+            except (OSError, ClamdError):
+                # Scanned from the storage by the upload form instead
+                logger.exception("Could not scan %s as it is uploaded", file_name)
+        raise StopFutureHandlers()
+
+    def csrf_token_valid(self) -> bool:
+        """
+        :return: whether the CSRF token of the request, from the fields read before the file or the header, is valid
+        """
+        checked = copy.copy(self.request)
+        checked.POST = self.parser.fields if self.parser is not None else {}
+        return CsrfViewMiddleware(lambda request: None).process_view(checked, None, (), {}) is None
+
+    def receive_data_chunk(self, raw_data, start):
+        self.size += len(raw_data)
+        if start == 0:
+            self.sniffed_content_type = sniff_content_type(raw_data[:16])
+        if self.size > int(settings.MAX_UPLOAD_SIZE) or self.sniffed_content_type == UNKNOWN_CONTENT_TYPE:
+            self.refuse()
+        self.sha256.update(raw_data)
+        self.storage_upload.write(raw_data)
+        if self.scan is not None:
+            try:
+                self.scan.write(raw_data)
+            except (OSError, ClamdError):
+                logger.exception("Could not scan %s as it is uploaded", self.file_name)
+                self.scan = None
+        return None
+
+    def refuse(self):
+        """
+        Drop the upload and stop parsing the request. UploadForm reports the error from the size and content
+        type of refused_file.
+        """
+        logger.info(f"Refusing upload of {self.file_name}: {self.size} bytes of {self.sniffed_content_type}")
+        self.refused = True
+        if self.storage_upload is not None:
+            self.storage_upload.abort()
+        self.resources.close()
+        self.refused_file = self._uploaded_file(stored_name=None, scan_result=None)
+        raise StopUpload(connection_reset=self.request_content_length > DRAINED_REQUEST_LIMIT)
+
+    def file_complete(self, file_size):
+        scan_result = None
+        scanned = False
+        try:
+            if self.scan is not None:
+                scan_result = self.cached_verdict()
+                if scan_result is None:
+                    scan_result = self.scan.result()
+                    scanned = True
+        except (OSError, ClamdError):
+            logger.exception("Could not scan %s as it is uploaded", self.file_name)
+        finally:
+            # Abandons the stream when the verdict was cached
+            self.resources.close()
+        stored_name = self.storage_upload.complete()
+        if scan_result is not None:
+            if scanned and self.signature_version is not None:
+                get_scanner().verdict_cache.set(self.sha256.hexdigest(), self.signature_version, scan_result)
+            if scan_result.infected:
+                logger.warning("Uploaded file %s is infected with %s, deleting it", stored_name, scan_result.signature)
+                select_storage().delete(stored_name)
+                stored_name = None
+        if stored_name is not None:
+            self.stored_names.append(stored_name)
+        return self._uploaded_file(stored_name, scan_result)
+
+    def cached_verdict(self) -> ScanResult | None:
+        """
+        :return: the verdict of the scan verdict cache for the file, None if it is not cached
+        """
+        if self.signature_version is None:
+            return None
+        scanner = get_scanner()
+        scan_result = scanner.verdict_cache.get(self.sha256.hexdigest(), self.signature_version)
+        scanner.metrics.record_cache(hit=scan_result is not None)
+        if scan_result is not None:
+            logger.info("Scan verdict of %s found in the cache, not waiting for clamd", self.file_name)
+        return scan_result
+
+    def delete_stored_files(self, keep: str | None = None):
+        """
+        Delete the files stored for the request
+
+        :param keep: name of a file to keep, the one saved in the session
+        """
+        storage = select_storage()
+        for name in self.stored_names:
+            if name != keep:
+                logger.info(f"Deleting unused upload {name}")
+                storage.delete(name)
+        self.stored_names = [name for name in self.stored_names if name == keep]
+
+    def _uploaded_file(self, stored_name: str | None, scan_result: ScanResult | None) -> EvidenceUploadedFile:
+        return EvidenceUploadedFile(
+            name=self.file_name,
+            # Only the declared type is known when refused before any data is read
+            content_type=self.sniffed_content_type or self.content_type or UNKNOWN_CONTENT_TYPE,
+            size=self.size,
+            charset=self.charset,
+            stored_name=stored_name,
+            sha256=self.sha256.hexdigest(),
+            scan_result=scan_result,
+            refused=self.refused,
+            content_type_extra=self.content_type_extra,
+        )
+
+    def upload_interrupted(self):
+        if not self.refused:
+            self.storage_upload.abort()
+            self.resources.close()
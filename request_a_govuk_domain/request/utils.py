@@ -2,17 +2,18 @@ import logging
 import os
 import uuid
 
-import clamd
 from django.conf import settings
 from django.core.exceptions import BadRequest, ValidationError
 from django.core.files.uploadedfile import UploadedFile
 from notifications_python_client import NotificationsAPIClient
 
+from request_a_govuk_domain.request.clamav import get_scanner
 from request_a_govuk_domain.request.models import RegistrantTypeChoices
 from request_a_govuk_domain.request.models.notification_response_id import (
     NotificationResponseID,
 )
 from request_a_govuk_domain.request.models.storage_util import select_storage
+from request_a_govuk_domain.request.scanning import ScanStatus, evidence_scan_statuses
 
 logger = logging.getLogger(__name__)
 
@@ -41,30 +42,34 @@ def handle_uploaded_file(file: UploadedFile, session_id: str | None) -> str | No
     """
     if file.name is None:
         return None
+    # Stored as it was uploaded, see EvidenceUploadHandler
+    if stored_name := getattr(file, "stored_name", None):
+        return stored_name
 
     _, file_extension = os.path.splitext(file.name)
 
     saved_filename = f"{session_id}/{uuid.uuid4()}{file_extension}"
-    storage = select_storage()
-    if not settings.S3_STORAGE_ENABLED:
-        file_path = os.path.join(settings.MEDIA_ROOT, saved_filename)
-    else:
-        file_path = saved_filename
-    logger.info(f"Saving {file.name} in to {file_path}")
-    storage.save(file_path, file)
-    return saved_filename
+    logger.info(f"Saving {file.name} in to {saved_filename}")
+    # The name is relative to the storage, i.e. to MEDIA_ROOT on the file system
+    return select_storage().save(saved_filename, file)
 
 
 def validate_file_infection(file):
     """
-    Incoming file is sent to clamd for scanning.
+    Incoming file is sent to clamd for scanning, over a pooled connection.
     Raises a ValidationError
     """
     if settings.IS_SCANNING_ENABLED:
-        cd = clamd.ClamdNetworkSocket(settings.CLAMD_TCP_ADDR, settings.CLAMD_TCP_SOCKET)
-        result = cd.instream(file)
-
-        if result and result["stream"][0] == "FOUND":
+        # Files of EvidenceUploadHandler are scanned as they are uploaded, unless clamd failed, and refused
+        # files are reported by UploadForm.clean_file
+        result = getattr(file, "scan_result", None)
+        if result is None and not getattr(file, "refused", False):
+            result = get_scanner().scan(file)
+        if result is not None and result.infected:
+            if stored_name := getattr(file, "stored_name", None):
+                logger.warning(f"Uploaded file {stored_name} is infected with {result.signature}, deleting it")
+                file.close()
+                select_storage().delete(stored_name)
             raise ValidationError("File is infected with malware.", code="infected")
     else:
         logger.warning("Clam is not enabled on AWS")
@@ -170,7 +175,9 @@ def is_valid_session_data(rd: dict) -> bool:
             or not_str("written_permission_file_uploaded_url")
         ):
             return False
-    return True
+
+    # Evidence files scanned asynchronously must have been found clean
+    return all(status == ScanStatus.CLEAN for status in evidence_scan_statuses(rd).values())
 
 
 def get_registration_data(request) -> dict:
@@ -195,18 +202,35 @@ def add_to_session(form, request, field_names: list[str]) -> dict:
 
     :return: A tuple of cleaned field value and registration data
     """
-    registration_data = request.session.get("registration_data", {})
-    for field_name in field_names:
-        field_value = form.cleaned_data[field_name]
-        registration_data[field_name] = field_value
-    request.session["registration_data"] = registration_data
-    return registration_data
+    return update_registration_data(request, {field_name: form.cleaned_data[field_name] for field_name in field_names})
 
 
 def add_value_to_session(request, field_name: str, field_value) -> None:
+    update_registration_data(request, {field_name: field_value})
+
+
+def update_registration_data(request, values: dict) -> dict:
+    """
+    Merge the given values in to the registration data held in the session.
+
+    The session is only marked as modified, and so only written back to the session store, when one of
+    the values is new or different from what is already there. Going back and forth through the journey
+    without changing an answer therefore doesn't cost a session write.
+
+    :param request: request object
+    :param values: dictionary of field names and values to be saved in the session
+    :return: the registration data
+    """
     registration_data = request.session.get("registration_data", {})
-    registration_data[field_name] = field_value
-    request.session["registration_data"] = registration_data
+    changed_values = {
+        field_name: field_value
+        for field_name, field_value in values.items()
+        if field_name not in registration_data or registration_data[field_name] != field_value
+    }
+    if changed_values or "registration_data" not in request.session:
+        registration_data.update(changed_values)
+        request.session["registration_data"] = registration_data
+    return registration_data
 
 
 def get_env_variable(key: str, default=None) -> str:
@@ -3,10 +3,10 @@ import random
 import string
 from datetime import datetime
 
+from django.conf import settings
 from django.core.exceptions import BadRequest
 from django.db import transaction
 from django.http import (
-    FileResponse,
     HttpRequest,
     HttpResponse,
     HttpResponseBadRequest,
@@ -14,12 +14,16 @@ from django.http import (
 )
 from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from django.views.generic import RedirectView, TemplateView
 from django.views.generic.edit import FormView
 
+from .caches import get_registrar, registrar_id_from_choice
 from .constants import NOTIFY_TEMPLATE_ID_MAP
 from .db import save_data_in_database
+from .downloads import file_download_response
 from .forms import (
     ConfirmationForm,
     DomainConfirmationForm,
@@ -34,8 +38,16 @@ from .forms import (
     UploadForm,
     WrittenPermissionForm,
 )
-from .models.organisation import RegistrantTypeChoices, Registrar
+from .models.organisation import RegistrantTypeChoices
 from .models.storage_util import select_storage
+from .scanning import (
+    ScanStatus,
+    evidence_scan_statuses,
+    forget_scan_status,
+    queue_scan,
+    scan_status,
+)
+from .uploads import EvidenceUploadHandler
 from .utils import (
     add_to_session,
     get_registration_data,
@@ -358,6 +370,7 @@ class UploadRemoveView(RedirectView):
             storage = select_storage()
             if storage.exists(path_to_delete):
                 storage.delete(path_to_delete)
+            forget_scan_status(path_to_delete)
 
         # delete the session data
         del self.request.session[REGISTRATION_DATA][self.page_type + "_file_uploaded_filename"]
@@ -393,6 +406,11 @@ class ConfirmView(FormView):
         :param request:
         :return:
         """
+        # Evidence files scanned asynchronously must be clean before the application is submitted
+        for page_type, status in evidence_scan_statuses(request.session.get(REGISTRATION_DATA, {})).items():
+            if status != ScanStatus.CLEAN:
+                logger.info(f"Evidence {page_type} of {request.session.session_key} is {status}, not submitting")
+                return redirect(f"{page_type}_upload_confirm")
         reference_ = request.session.get(APPLICATION_REFERENCE)
         self.save_application_to_database_and_send_confirmation_email(reference_, request)
         return redirect("success")
@@ -441,8 +459,8 @@ class ConfirmView(FormView):
         context[REGISTRATION_DATA] = registration_data
 
         # Registrar organisation name: need to look up real name
-        registrar_id = int(registration_data["registrar_organisation"].split("registrar-", 1)[1])
-        context["registrar_name"] = Registrar.objects.get(id=registrar_id).name
+        registrar_id = registrar_id_from_choice(registration_data["registrar_organisation"])
+        context["registrar_name"] = get_registrar(registrar_id).name
 
         # Registrant type human-readable name
         registrant_types = {code: label for code, label in RegistrantTypeChoices.choices}
@@ -556,10 +574,11 @@ def download_file(request, file_type):
     except KeyError:
         return HttpResponseNotFound("Not Found")
     if storage.exists(file_name):
-        return FileResponse(storage.open(file_name, "rb"))
+        return file_download_response(storage, file_name, registration_data.get(f"{file_type}_file_original_filename"))
     return HttpResponseNotFound("Not Found")
 
 
+@method_decorator(csrf_exempt, name="dispatch")
 class UploadView(FormView):
     page_type = ""
     template_name = ""
@@ -571,13 +590,43 @@ class UploadView(FormView):
         self.template_name = f"{self.page_type}_upload.html"
         return super().__init__()
 
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        # Uploads are stored and scanned as they are received, once the handler has checked the CSRF token.
+        # The CSRF check of the view, which reads the POST data, is done by checked_post once the handler is set.
+        self.upload_handler = EvidenceUploadHandler(request)
+        request.upload_handlers = [self.upload_handler]
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        # A refused upload stops the parsing of the request, so the form reports the error
+        if self.request.method == "POST" and self.upload_handler.refused_file is not None:
+            kwargs["files"] = {"file": self.upload_handler.refused_file}
+        return kwargs
+
+    def post(self, request, *args, **kwargs):
+        self.saved_filename = None
+        try:
+            return self.checked_post(request, *args, **kwargs)
+        finally:
+            # Files are stored as they are uploaded: only the one kept by form_valid is left, not the ones of
+            # a request failing the CSRF check or the form
+            self.upload_handler.delete_stored_files(keep=self.saved_filename)
+
+    @method_decorator(csrf_protect)
+    def checked_post(self, request, *args, **kwargs):
+        return super().post(request, *args, **kwargs)
+
     def form_valid(self, form):
         saved_filename = handle_uploaded_file(self.request.FILES["file"], self.request.session.session_key)
+        self.saved_filename = saved_filename
         registration_data = self.request.session.get(REGISTRATION_DATA, {})
         registration_data[f"{self.page_type}_file_uploaded_filename"] = saved_filename
         registration_data[f"{self.page_type}_file_uploaded_url"] = select_storage().url(saved_filename)
         registration_data[f"{self.page_type}_file_original_filename"] = self.request.FILES["file"].name
         self.request.session[REGISTRATION_DATA] = registration_data
+        if settings.CLAMD_SCAN_ASYNC:
+            queue_scan(saved_filename)
         if "back_to_answers" in self.request.POST.keys():
             self.success_url = reverse_lazy("confirm")
         return super().form_valid(form)
@@ -590,7 +639,13 @@ class UploadConfirmView(TemplateView):
     def get_context_data(self, **kwargs):
         self.template_name = f"{self.page_type}_upload_confirm.html"
         context = super().get_context_data(**kwargs)
-        context[REGISTRATION_DATA] = self.request.session.get(REGISTRATION_DATA, {})
+        registration_data = self.request.session.get(REGISTRATION_DATA, {})
+        context[REGISTRATION_DATA] = registration_data
+        if name := registration_data.get(f"{self.page_type}_file_uploaded_filename"):
+            context["scan_status"] = scan_status(name)
+            if context["scan_status"] == ScanStatus.PENDING:
+                # Reload the page until the scan is done
+                context["refresh_after"] = settings.CLAMD_SCAN_STATUS_REFRESH
         return context
 
 
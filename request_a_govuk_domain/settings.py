@@ -87,7 +87,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "simple_history.middleware.HistoryRequestMiddleware",
+    "request_a_govuk_domain.request.middleware.admin_history_request_middleware",
 ]
 
 X_FRAME_OPTIONS = "SAMEORIGIN"
@@ -242,6 +242,32 @@ MAX_UPLOAD_SIZE = "10485760"
 
 CLAMD_TCP_ADDR = env.str("CLAMD_TCP_ADDR", default="clamav.internal-domains-registry-cluster")
 CLAMD_TCP_SOCKET = 3310
+# clamd hosts sharing the scans, as host:port, instead of CLAMD_TCP_ADDR
+CLAMD_HOSTS = env.list("CLAMD_HOSTS", default=[])
+# Consecutive failures after which a clamd host is ejected, and seconds after which it is tried again
+CLAMD_FAILURE_THRESHOLD = env.int("CLAMD_FAILURE_THRESHOLD", default=3)
+CLAMD_EJECT_SECONDS = env.int("CLAMD_EJECT_SECONDS", default=30)
+# Seconds between the PING health checks of the clamd hosts, 0 for none
+CLAMD_HEALTH_CHECK_INTERVAL = env.int("CLAMD_HEALTH_CHECK_INTERVAL", default=10)
+# Maximum number of connections to clamd per process, kept open between scans
+CLAMD_POOL_SIZE = env.int("CLAMD_POOL_SIZE", default=4)
+# Seconds allowed to connect to clamd
+CLAMD_CONNECT_TIMEOUT = env.int("CLAMD_CONNECT_TIMEOUT", default=5)
+# Seconds allowed for each read and write to clamd, and to wait for a free connection
+CLAMD_TIMEOUT = env.int("CLAMD_TIMEOUT", default=60)
+# Bytes of a file sent to clamd at a time
+CLAMD_CHUNK_SIZE = env.int("CLAMD_CHUNK_SIZE", default=65536)
+# Seconds after which an idle connection to clamd is closed rather than reused, below the IdleTimeout of clamd
+CLAMD_MAX_IDLE = env.int("CLAMD_MAX_IDLE", default=20)
+# Scan uploaded files in a Celery task rather than while the user waits, see request/scanning.py. Needs a shared
+# cache, i.e. REDIS_CACHE_URL
+CLAMD_SCAN_ASYNC = env.bool("CLAMD_SCAN_ASYNC", default=False)
+# Seconds after which the upload confirmation page is reloaded while the file is being scanned
+CLAMD_SCAN_STATUS_REFRESH = env.int("CLAMD_SCAN_STATUS_REFRESH", default=2)
+# Seconds the verdicts of clamd are cached for, by content of the file and version of the signatures. 0 to disable
+CLAMD_VERDICT_CACHE_TIMEOUT = env.int("CLAMD_VERDICT_CACHE_TIMEOUT", default=7 * 24 * 3600)
+# Seconds the version of the clamd signatures is cached for in each process
+CLAMD_VERSION_CHECK_INTERVAL = env.int("CLAMD_VERSION_CHECK_INTERVAL", default=60)
 
 # Cross-site request forgery protection
 # What: https://owasp.org/www-community/attacks/csrf
@@ -253,9 +279,71 @@ if not DEBUG:
     CSRF_FAILURE_VIEW = "request_a_govuk_domain.request.views.csrf_failure_view"
     SESSION_COOKIE_SECURE = True
 
+# The historical tables are partitioned by month, see request/partitioning.py. Partitions are created this many
+# months ahead, and detached from the historical tables once they are older than the retention period.
+HISTORY_PARTITION_MONTHS_AHEAD = 3
+HISTORY_RETENTION_MONTHS = env.int("HISTORY_RETENTION_MONTHS", default=24)
+# Write the history records of each admin request at its end, in the same transaction and in one insert per
+# historical table, instead of one insert per change, see request/middleware.py
+HISTORY_BUFFERED_WRITES = env.bool("HISTORY_BUFFERED_WRITES", default=False)
+
 # Set session (end-user or admin) to expire in 24 hours
 SESSION_COOKIE_AGE = 24 * 60 * 60
 
+# Caching
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# When REDIS_CACHE_URL is set (e.g. redis://redis:6379/1) Redis is used as the shared cache and as the session
+# store, so the registration journey no longer writes to the django_session table on every page.
+# Without Redis we fall back to a per-process cache and keep the sessions in the database, as a per-process
+# cache can't be shared between the gunicorn workers.
+REDIS_CACHE_URL = env.str("REDIS_CACHE_URL", default=None)
+if REDIS_CACHE_URL:
+    REDIS_CACHE_OPTIONS = {
+        "SOCKET_TIMEOUT": env.float("REDIS_CACHE_SOCKET_TIMEOUT", default=2.0),
+        "SOCKET_CONNECT_TIMEOUT": env.float("REDIS_CACHE_SOCKET_CONNECT_TIMEOUT", default=2.0),
+    }
+    CACHES = {
+        "default": {
+            "BACKEND": "redis_cache.RedisCache",
+            "LOCATION": REDIS_CACHE_URL,
+            "OPTIONS": REDIS_CACHE_OPTIONS,
+        },
+        # Session data is plain JSON (the registration answers), so store it as compressed JSON
+        # rather than as a pickle.
+        "sessions": {
+            "BACKEND": "redis_cache.RedisCache",
+            "LOCATION": REDIS_CACHE_URL,
+            "KEY_PREFIX": "session",
+            "TIMEOUT": SESSION_COOKIE_AGE,
+            "OPTIONS": {
+                **REDIS_CACHE_OPTIONS,
+                "SERIALIZER_CLASS": "redis_cache.serializers.JSONSerializer",
+                "COMPRESSOR_CLASS": "redis_cache.compressors.ZLibCompressor",
+            },
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "sessions": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "sessions",
+            "TIMEOUT": SESSION_COOKIE_AGE,
+        },
+    }
+
+# Seconds each process keeps the reference data (registrars, guidance, bank holidays) when the default cache is
+# local to the process, as changes made by other processes can't reach it then. See request/caches.py
+LOCAL_REFERENCE_CACHE_TIMEOUT = env.int("LOCAL_REFERENCE_CACHE_TIMEOUT", default=60)
+
+SESSION_ENGINE = env.str(
+    "SESSION_ENGINE",
+    default=("django.contrib.sessions.backends.cache" if REDIS_CACHE_URL else "django.contrib.sessions.backends.db"),
+)
+SESSION_CACHE_ALIAS = "sessions"
+
 # Content Security Policy: only allow images, stylesheets and scripts from the
 # same origin as the HTML
 CSP_IMG_SRC = "'self' data:"
@@ -316,6 +404,17 @@ if SENTRY_DSN is not None:
 
 # Only enable S3 storage if it is explicitly enabled or on AWS
 S3_STORAGE_ENABLED = env.bool("S3_STORAGE_ENABLED", default=IS_AWS)
+# Connections kept open to S3 by each client, see request/models/storage_util.py
+AWS_S3_MAX_POOL_CONNECTIONS = env.int("AWS_S3_MAX_POOL_CONNECTIONS", default=20)
+# Evidence files on S3 are downloaded through a redirect to a presigned URL valid for FILE_DOWNLOAD_URL_EXPIRY
+# seconds ("redirect"), or streamed through the app ("proxy"), see request/downloads.py
+FILE_DOWNLOAD_MODE = env.str("FILE_DOWNLOAD_MODE", default="redirect")
+FILE_DOWNLOAD_URL_EXPIRY = env.int("FILE_DOWNLOAD_URL_EXPIRY", default=300)
+# Without S3, evidence files can be sent by the web server in front of the app rather than by the app: set
+# FILE_DOWNLOAD_SENDFILE to "x-accel-redirect" for nginx, with an internal location at FILE_DOWNLOAD_SENDFILE_URL
+# serving MEDIA_ROOT, or to "x-sendfile" for Apache or lighttpd
+FILE_DOWNLOAD_SENDFILE = env.str("FILE_DOWNLOAD_SENDFILE", default="")
+FILE_DOWNLOAD_SENDFILE_URL = env.str("FILE_DOWNLOAD_SENDFILE_URL", default="/protected-media/")
 
 CELERY_BROKER_URL = env.str("CELERY_BROKER_URL", "redis://localhost/0")
 CELERY_RESULT_BACKEND = "django-db"
@@ -8,6 +8,7 @@ from django.urls import reverse
 
 from request_a_govuk_domain.request import db
 from request_a_govuk_domain.request.admin.model_admins import ApplicationAdmin
+from request_a_govuk_domain.request.holidays import bank_holidays
 from request_a_govuk_domain.request.models import Application, Registrar
 
 
@@ -43,8 +44,11 @@ class ModelAdminActionsTestCase(TestCase):
         c = Client()
         c.login(username="superuser", password="secret")  # pragma: allowlist secret
 
-        # Patch get_business_days_to_complete to return a value
-        with patch.object(ApplicationAdmin, "get_business_days_to_complete", return_value=5):
+        # Patch the business days calculation to return a value
+        with patch(
+            "request_a_govuk_domain.request.admin.model_admins.business_days_between",
+            side_effect=lambda starts, ends: [5] * len(starts),
+        ):
             response = c.post(
                 reverse(
                     "admin:request_application_changelist",
@@ -61,11 +65,32 @@ class ModelAdminActionsTestCase(TestCase):
                 f"attachment; filename=request.application_{datetime.today().strftime('%Y-%m-%d')}_data_backup.csv",
             )
 
-            self.assertContains(response, "reference")
-            self.assertContains(response, "ABCDEFGHIJK")
+            content = b"".join(response.streaming_content).decode()
+            self.assertIn("reference", content)
+            self.assertIn("ABCDEFGHIJK", content)
             # Check if the business days to complete is included in the export
-            self.assertContains(response, "Business days to complete")
-            self.assertContains(response, "5")
+            self.assertIn("Business days to complete", content)
+            self.assertIn("5", content)
+
+    def test_export_query_count_does_not_depend_on_row_count(self):
+        request = Mock()
+        for reference in ["ABCDEFGHIJK", "BCDEFGHIJKL", "CDEFGHIJKLM"]:
+            request.session = SessionDict({"registration_data": dict(self.registration_data)})
+            db.save_data_in_database(reference, request)
+        Application.objects.update(last_updated_by=User.objects.get(username="superuser"))
+        admin = ApplicationAdmin(Application, None)
+        bank_holidays()
+
+        with self.assertNumQueries(1):
+            rows = list(admin.generate_csv(Application.objects.order_by("reference"), admin.get_field_names()))
+
+        self.assertEqual(4, len(rows))
+        self.assertEqual(admin.get_field_names(), rows[0].strip().split(","))
+        columns = rows[1].strip().split(",")
+        self.assertEqual("ABCDEFGHIJK", columns[0])
+        self.assertEqual("dummy registrar", columns[2])
+        self.assertEqual("New", columns[5])
+        self.assertEqual("superuser", columns[10])
 
     @patch("requests.get", side_effect=requests.exceptions.ConnectionError)
     def test_get_holidays_data_fails(self, get_mock):
@@ -85,6 +110,8 @@ class ModelAdminActionsTestCase(TestCase):
         except requests.exceptions.ConnectionError:
             self.fail("ConnectionError should be handled gracefully by the admin action.")
         self.assertEqual(response.status_code, 200)
+        # Bank holidays are read from the database, gov.uk is not called when the page loads
+        get_mock.assert_not_called()
 
 
 class SessionDict(dict):
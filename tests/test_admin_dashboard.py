@@ -0,0 +1,73 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.admin.views import DASHBOARD_PAGE_SIZE
+from request_a_govuk_domain.request.models import Application, ApplicationStatus
+from tests.util import AdminScreenTestMixin, SessionDict
+
+
+class AdminDashboardTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        request = Mock()
+        for i in range(DASHBOARD_PAGE_SIZE + 3):
+            request.session = SessionDict({"registration_data": dict(self.registration_data)})
+            db.save_data_in_database(f"GOVUK{i:03}", request)
+        self.reviewer_user = User.objects.create_user(username="reviewer-user", is_staff=True)
+
+    def _set_status(self, status, owner, days_ago):
+        Application.objects.filter(reference__in=[f"GOVUK{i:03}" for i in range(5)]).update(
+            status=status,
+            owner=owner,
+            last_updated_by=owner,
+            time_submitted=timezone.now() - timedelta(days=days_ago),
+        )
+
+    def test_dashboard_makes_a_fixed_number_of_queries(self):
+        self._set_status(ApplicationStatus.MORE_INFORMATION, self.reviewer_user, 10)
+        self.client.force_login(self.reviewer_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin_dashboard"))
+        self.assertEqual(200, response.status_code)
+        # The counts aggregate, then a page of new applications and of late and on-schedule more information
+        # applications (this one is empty, so not queried)
+        application_queries = [q["sql"] for q in queries.captured_queries if '"request_application"' in q["sql"]]
+        self.assertEqual(3, len(application_queries))
+        self.assertIn("FILTER (WHERE", application_queries[0])
+        self.assertEqual(5, response.context["moreinfo_owner_total_count"])
+        self.assertEqual(DASHBOARD_PAGE_SIZE + 3 - 5, response.context["new_allusers_total_count"])
+        self.assertEqual(5, len(response.context["moreinfo_owner_late"]))
+
+    def test_dashboard_is_cached_per_user(self):
+        self.client.force_login(self.superuser)
+        self.client.get(reverse("admin_dashboard"))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin_dashboard"))
+        self.assertFalse([q for q in queries.captured_queries if '"request_application"' in q["sql"]])
+        self.assertEqual(0, response.context["ready2i_owner_total_count"])
+
+        self.client.force_login(self.reviewer_user)
+        response = self.client.get(reverse("admin_dashboard"))
+        self.assertTrue(response.context["user_is_reviewer"])
+
+    def test_lists_are_paginated(self):
+        self.client.force_login(self.reviewer_user)
+        response = self.client.get(reverse("admin_dashboard"))
+        self.assertEqual(DASHBOARD_PAGE_SIZE, len(response.context["new_allusers_total"]))
+        self.assertContains(response, "?new_page=2")
+
+        response = self.client.get(reverse("admin_dashboard"), {"new_page": 2})
+        self.assertEqual(
+            ["GOVUK010", "GOVUK011", "GOVUK012"], [a.reference for a in response.context["new_allusers_total"]]
+        )
+        self.assertContains(response, f"New ({DASHBOARD_PAGE_SIZE + 3})")
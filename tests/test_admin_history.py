@@ -1,9 +1,16 @@
 from time import sleep
 from unittest.mock import Mock, patch
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.admin.history import (
+    HISTORY_PAGE_SIZE,
+    history_page,
+    status_change_page,
+)
 from request_a_govuk_domain.request.models import Application, Review
 from request_a_govuk_domain.request.templatetags.admin_tags import format_date
 from tests.util import (
@@ -104,3 +111,81 @@ class SimpleHistoryTest(AdminScreenTestMixin, TestCase):
             content,
             msg_prefix=content,
         )
+
+
+class HistoryTimelineTest(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        self.application = Application.objects.get(reference="GOVUK00000000001")
+        self.review = self.application.review
+
+    def add_history(self, count: int):
+        """
+        Save the application count times, changing the owner on every other save
+        """
+        for i in range(count):
+            self.application.owner = self.reviewer if i % 2 else self.superuser
+            self.application.domain_purpose = f"purpose {i}"
+            self.application.save()
+
+    def count_history_queries(self, url: str, params: dict | None = None) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.admin_client.get(url, params)
+        self.assertEqual(200, response.status_code)
+        return len([q for q in queries.captured_queries if "historical" in q["sql"]])
+
+    def test_history_pages_use_a_constant_number_of_queries(self):
+        self.add_history(3)
+        review_queries = self.count_history_queries(get_admin_history_view_url(self.review))
+        application_queries = self.count_history_queries(get_admin_history_view_url(self.application))
+
+        self.add_history(2 * HISTORY_PAGE_SIZE)
+        self.assertEqual(review_queries, self.count_history_queries(get_admin_history_view_url(self.review)))
+        self.assertEqual(application_queries, self.count_history_queries(get_admin_history_view_url(self.application)))
+        self.assertEqual(
+            application_queries,
+            self.count_history_queries(get_admin_history_view_url(self.application), {"page": 2}),
+        )
+
+    def test_history_page_changes(self):
+        self.add_history(HISTORY_PAGE_SIZE + 1)
+        history = Application.history.filter(id=self.application.id)
+
+        page = history_page(history, 1)
+        self.assertEqual(HISTORY_PAGE_SIZE, len(page))
+        self.assertTrue(page.has_next())
+        self.assertEqual("owner, domain_purpose", page[0].changed_fields_summary)
+
+        page = history_page(history, 2)
+        self.assertEqual(2, len(page))
+        self.assertEqual("owner, domain_purpose", page[0].changed_fields_summary)
+        self.assertEqual("Initial Data", page[1].changed_fields_summary)
+
+    def test_status_change_page(self):
+        self.add_history(4)
+        self.application.domain_purpose = "another purpose"
+        self.application.save()
+        history = list(Application.history.filter(id=self.application.id).order_by("-history_date", "-history_id"))
+
+        page = status_change_page(Application.history.filter(id=self.application.id), 1)
+
+        # The last save changed neither the status nor the owner, so only the latest of the two records is shown
+        self.assertEqual([record.history_id for record in history[:1] + history[2:]], [r.history_id for r in page])
+
+    def test_status_change_page_reads_only_its_records(self):
+        self.add_history(HISTORY_PAGE_SIZE + 1)
+        history = Application.history.filter(id=self.application.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            page = status_change_page(history, 2)
+            records = list(page)
+        # The count of the records shown, then the page
+        self.assertEqual(2, len(queries.captured_queries))
+        self.assertEqual(
+            [record.history_id for record in history.order_by("-history_date", "-history_id")[HISTORY_PAGE_SIZE:]],
+            [record.history_id for record in records],
+        )
+        self.assertEqual(self.superuser, records[0].owner)
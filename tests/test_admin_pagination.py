@@ -0,0 +1,127 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.admin.model_admins import (
+    ApplicationAdmin,
+    ReviewAdmin,
+)
+from request_a_govuk_domain.request.admin.pagination import CURSOR_VAR
+from request_a_govuk_domain.request.models import Application, ApplicationStatus
+from tests.util import AdminScreenTestMixin, SessionDict
+
+
+class AdminKeysetPaginationTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        for i in range(1, 8):
+            db.save_data_in_database(f"GOVUK{i:011}", request)
+        submitted = timezone.now() - timedelta(days=10)
+        for application in Application.objects.all():
+            number = int(application.reference[5:])
+            # Applications 3 and 4 are submitted at the same time, so the id decides their order
+            application.time_submitted = submitted + timedelta(hours=min(number, 3))
+            application.status = ApplicationStatus.APPROVED if number % 2 else ApplicationStatus.NEW
+            application.save()
+        # Newest first, and the highest id first for the same time
+        self.expected = [f"GOVUK{i:011}" for i in (7, 6, 5, 4, 3, 2, 1)]
+
+    def get_page(self, changelist: str, params: dict):
+        response = self.admin_client.get(reverse(changelist), params)
+        self.assertEqual(200, response.status_code)
+        cl = response.context["cl"]
+        return [getattr(obj, "application", obj).reference for obj in cl.result_list], cl
+
+    def walk_pages(self, changelist: str, params: dict | None = None) -> tuple[list[list[str]], list[list[str]]]:
+        """
+        Follow the next links from the first page to the last one, then the previous links back
+        """
+        forward, backward = [], []
+        references, cl = self.get_page(changelist, params or {})
+        forward.append(references)
+        while cl.next_page_url:
+            references, cl = self.get_page(changelist, self.url_params(cl.next_page_url))
+            forward.append(references)
+        while cl.previous_page_url:
+            references, cl = self.get_page(changelist, self.url_params(cl.previous_page_url))
+            backward.append(references)
+        return forward, backward
+
+    def url_params(self, query_string: str) -> dict:
+        return {name: values[0] for name, values in parse_qs(query_string.lstrip("?")).items()}
+
+    @patch.object(ApplicationAdmin, "list_per_page", 3)
+    def test_application_pages(self):
+        forward, backward = self.walk_pages("admin:request_application_changelist")
+        self.assertEqual([self.expected[0:3], self.expected[3:6], self.expected[6:]], forward)
+        self.assertEqual([self.expected[3:6], self.expected[0:3]], backward)
+
+    @patch.object(ReviewAdmin, "list_per_page", 3)
+    def test_review_pages(self):
+        forward, backward = self.walk_pages("admin:request_review_changelist")
+        self.assertEqual([self.expected[0:3], self.expected[3:6], self.expected[6:]], forward)
+        self.assertEqual([self.expected[3:6], self.expected[0:3]], backward)
+
+    @patch.object(ApplicationAdmin, "list_per_page", 2)
+    def test_pages_keep_the_filter(self):
+        forward, backward = self.walk_pages("admin:request_application_changelist", {"status": "approved"})
+        approved = [self.expected[0], self.expected[2], self.expected[4], self.expected[6]]
+        self.assertEqual([approved[0:2], approved[2:4]], forward)
+        self.assertEqual([approved[0:2]], backward)
+
+        _, cl = self.get_page("admin:request_application_changelist", {"status": "approved"})
+        self.assertEqual(4, cl.result_count)
+        self.assertFalse(cl.result_count_is_estimate)
+        self.assertIn("status=approved", cl.next_page_url)
+
+    @patch.object(ReviewAdmin, "list_per_page", 2)
+    def test_review_pages_keep_the_filter(self):
+        forward, _ = self.walk_pages("admin:request_review_changelist", {"status": "new"})
+        self.assertEqual([self.expected[1:4:2], self.expected[5:6]], forward)
+
+    @patch.object(ApplicationAdmin, "list_per_page", 3)
+    def test_filter_links_go_back_to_the_first_page(self):
+        _, cl = self.get_page("admin:request_application_changelist", {})
+        references, cl = self.get_page("admin:request_application_changelist", self.url_params(cl.next_page_url))
+        self.assertEqual(self.expected[3:6], references)
+        self.assertNotIn(CURSOR_VAR, cl.get_query_string({"status": "new"}))
+
+    @patch.object(ApplicationAdmin, "list_per_page", 3)
+    def test_pages_are_not_fetched_with_offset(self):
+        _, cl = self.get_page("admin:request_application_changelist", {})
+        with CaptureQueriesContext(connection) as queries:
+            self.get_page("admin:request_application_changelist", self.url_params(cl.next_page_url))
+        application_queries = [q["sql"] for q in queries.captured_queries if 'FROM "request_application"' in q["sql"]]
+        self.assertTrue(application_queries)
+        self.assertFalse([sql for sql in application_queries if "OFFSET" in sql])
+
+    def test_sorting_on_a_column_uses_the_default_pagination(self):
+        references, cl = self.get_page("admin:request_application_changelist", {"o": "1"})
+        self.assertFalse(cl.keyset_pagination)
+        self.assertEqual(sorted(self.expected), references)
+
+    def test_invalid_cursor_shows_an_error(self):
+        response = self.admin_client.get(reverse("admin:request_application_changelist"), {CURSOR_VAR: "next,nope,1"})
+        self.assertEqual(302, response.status_code)
+        self.assertIn("e=1", response.url)
+
+    def test_unfiltered_count_uses_the_planner_estimate(self):
+        with patch("request_a_govuk_domain.request.admin.pagination.estimated_row_count", return_value=250000):
+            _, cl = self.get_page("admin:request_application_changelist", {})
+        self.assertEqual(250000, cl.result_count)
+        self.assertTrue(cl.result_count_is_estimate)
+
+        # Small tables are counted
+        with patch("request_a_govuk_domain.request.admin.pagination.estimated_row_count", return_value=7):
+            _, cl = self.get_page("admin:request_application_changelist", {})
+        self.assertEqual(7, cl.result_count)
+        self.assertFalse(cl.result_count_is_estimate)
@@ -0,0 +1,63 @@
+from unittest.mock import Mock, patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.urls import reverse
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.admin.model_admins import (
+    ApplicationAdmin,
+    ReviewAdmin,
+)
+from request_a_govuk_domain.request.models import Application, Registrar
+from tests.util import AdminScreenTestMixin, SessionDict
+
+
+class AdminSearchTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        other_registrar = Registrar.objects.create(name="Other Hosting Ltd")
+        request = Mock()
+        for reference, domain_name, registrar in [
+            ("GOVUK00000000001", "first.gov.uk", self.registrar),
+            ("GOVUK00000000002", "second.gov.uk", other_registrar),
+            ("GOVUK00000000003", "third.gov.uk", other_registrar),
+        ]:
+            registration_data = dict(
+                self.registration_data,
+                domain_name=domain_name,
+                registrar_organisation=f"registrar-{registrar.id}",
+            )
+            request.session = SessionDict({"registration_data": registration_data})
+            db.save_data_in_database(reference, request)
+        Application.objects.filter(reference="GOVUK00000000003").update(owner=self.reviewer)
+
+    def search(self, changelist: str, term: str) -> list[str]:
+        response = self.admin_client.get(reverse(changelist), {"q": term})
+        self.assertEqual(200, response.status_code)
+        results = response.context["cl"].result_list
+        return sorted(getattr(obj, "application", obj).reference for obj in results)
+
+    def test_search_applications(self):
+        changelist = "admin:request_application_changelist"
+        self.assertEqual(["GOVUK00000000002"], self.search(changelist, "00002"))
+        self.assertEqual(["GOVUK00000000001"], self.search(changelist, "FIRST.gov"))
+        self.assertEqual(["GOVUK00000000002", "GOVUK00000000003"], self.search(changelist, "other hosting"))
+        self.assertEqual(["GOVUK00000000003"], self.search(changelist, "other REVIEWER"))
+        self.assertEqual([], self.search(changelist, '"hosting other"'))
+
+    def test_search_reviews(self):
+        changelist = "admin:request_review_changelist"
+        self.assertEqual(["GOVUK00000000001"], self.search(changelist, "dummy registrar"))
+        self.assertEqual(["GOVUK00000000003"], self.search(changelist, "third"))
+        self.assertEqual(["GOVUK00000000001", "GOVUK00000000002", "GOVUK00000000003"], self.search(changelist, "new"))
+
+    def test_search_fields_are_searched(self):
+        with patch.object(ApplicationAdmin, "search_fields", ["reference", "owner__username"]):
+            self.assertEqual([], self.search("admin:request_application_changelist", "first.gov"))
+            self.assertEqual(["GOVUK00000000003"], self.search("admin:request_application_changelist", "reviewer"))
+        with patch.object(ReviewAdmin, "search_fields", ["application__domain_name"]):
+            self.assertEqual([], self.search("admin:request_review_changelist", "dummy registrar"))
+            self.assertEqual(["GOVUK00000000003"], self.search("admin:request_review_changelist", "third"))
+        with patch.object(ReviewAdmin, "search_fields", ["reason"]), self.assertRaises(ImproperlyConfigured):
+            self.search("admin:request_review_changelist", "third")
@@ -0,0 +1,147 @@
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from request_a_govuk_domain.request.clamav import ClamdError, reset_scanner
+from request_a_govuk_domain.request.fake_clamd import EICAR_SIGNATURE, FakeClamd
+from request_a_govuk_domain.request.models.storage_util import (
+    select_storage,
+    storage_registry,
+)
+from request_a_govuk_domain.request.scanning import (
+    ScanStatus,
+    check_settings,
+    scan_stored_file,
+    status_key,
+)
+from request_a_govuk_domain.request.tasks import scan_evidence
+from request_a_govuk_domain.request.utils import is_valid_session_data
+from tests.util import AdminScreenTestMixin
+
+PNG = b"\x89PNG\r\n\x1a\n"
+INFECTED = PNG + b"X5O!P%@AP[4\\PZX54(P^)7CC)7}$" + EICAR_SIGNATURE + b"!$H+H*"
+
+
+@override_settings(S3_STORAGE_ENABLED=False, IS_SCANNING_ENABLED=True, CLAMD_SCAN_ASYNC=True)
+class AsyncScanningTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        storage_registry.clear()
+        self.addCleanup(storage_registry.clear)
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.server = FakeClamd().start()
+        self.addCleanup(self.server.stop)
+        clamd_override = override_settings(
+            CLAMD_TCP_ADDR=self.server.address[0], CLAMD_TCP_SOCKET=self.server.address[1]
+        )
+        clamd_override.enable()
+        self.addCleanup(clamd_override.disable)
+        reset_scanner()
+        self.addCleanup(reset_scanner)
+
+        # Parish council applications need written permission
+        session = self.client.session
+        session["registration_data"] = self.registration_data | {"written_permission": "yes"}
+        session.save()
+
+    def upload(self, content: bytes) -> str:
+        with patch("request_a_govuk_domain.request.tasks.scan_evidence.delay") as mock_delay:
+            response = self.client.post(
+                reverse("written_permission_upload"),
+                {"file": SimpleUploadedFile("letter.png", content, content_type="image/png")},
+            )
+        self.assertRedirects(response, reverse("written_permission_upload_confirm"))
+        name = self.client.session["registration_data"]["written_permission_file_uploaded_filename"]
+        mock_delay.assert_called_once_with(name)
+        return name
+
+    def test_upload_is_scanned_in_a_task(self):
+        name = self.upload(PNG + b"letter")
+        # Stored, and not scanned yet
+        self.assertTrue(select_storage().exists(name))
+        self.assertEqual(0, self.server.counts["scans"])
+
+        response = self.client.get(reverse("written_permission_upload_confirm"))
+        self.assertContains(response, "Scanning")
+        self.assertContains(response, '<meta http-equiv="refresh" content="2">')
+        self.assertFalse(is_valid_session_data(self.client.session["registration_data"]))
+        response = self.client.post(reverse("confirm"))
+        self.assertRedirects(response, reverse("written_permission_upload_confirm"), fetch_redirect_response=False)
+
+        self.assertEqual(ScanStatus.CLEAN, scan_stored_file(name))
+        response = self.client.get(reverse("written_permission_upload_confirm"))
+        self.assertContains(response, "Uploaded")
+        self.assertNotContains(response, 'http-equiv="refresh"')
+        self.assertContains(response, 'id="button-continue"')
+        self.assertTrue(is_valid_session_data(self.client.session["registration_data"]))
+
+    def test_infected_upload_is_deleted(self):
+        name = self.upload(INFECTED)
+        self.assertEqual(ScanStatus.INFECTED, scan_stored_file(name))
+        self.assertFalse(select_storage().exists(name))
+
+        response = self.client.get(reverse("written_permission_upload_confirm"))
+        self.assertContains(response, "The selected file contains a virus")
+        self.assertNotContains(response, 'id="button-continue"')
+        self.assertFalse(is_valid_session_data(self.client.session["registration_data"]))
+        response = self.client.post(reverse("confirm"))
+        self.assertRedirects(response, reverse("written_permission_upload_confirm"), fetch_redirect_response=False)
+
+        # Removing the file forgets its status
+        self.client.get(reverse("written_permission_upload_remove"))
+        self.assertIsNone(cache.get(status_key(name)))
+
+    def test_lost_status_is_scanned_again(self):
+        name = self.upload(PNG + b"letter")
+        cache.clear()
+        with patch("request_a_govuk_domain.request.tasks.scan_evidence.delay") as mock_delay:
+            response = self.client.get(reverse("written_permission_upload_confirm"))
+        self.assertContains(response, "Scanning")
+        mock_delay.assert_called_once_with(name)
+
+    def test_failed_scan_is_reported(self):
+        name = self.upload(PNG + b"letter")
+        with patch(
+            "request_a_govuk_domain.request.scanning.scan_stored_file", side_effect=ClamdError("clamd is down")
+        ) as mock_scan:
+            scan_evidence.apply(args=[name])
+        self.assertEqual(6, mock_scan.call_count)
+        self.assertEqual(ScanStatus.FAILED, cache.get(status_key(name)))
+
+        response = self.client.get(reverse("written_permission_upload_confirm"))
+        self.assertContains(response, "The selected file could not be checked for viruses. Remove it and try again.")
+        self.assertNotContains(response, 'http-equiv="refresh"')
+        self.assertNotContains(response, 'id="button-continue"')
+        self.assertFalse(is_valid_session_data(self.client.session["registration_data"]))
+
+    def test_status_needs_a_shared_cache(self):
+        # The test settings use the local memory cache
+        with self.assertRaises(ImproperlyConfigured):
+            check_settings()
+        with override_settings(CLAMD_SCAN_ASYNC=False):
+            check_settings()
+        with patch("request_a_govuk_domain.request.scanning.is_shared_cache", return_value=True):
+            check_settings()
+
+    def test_pages_without_evidence_are_not_affected(self):
+        session = self.client.session
+        session["registration_data"] |= {"minister": "yes", "minister_file_uploaded_filename": "session/minister.png"}
+        session.save()
+        for scan_async in (True, False):
+            with self.subTest(scan_async=scan_async), override_settings(CLAMD_SCAN_ASYNC=scan_async):
+                for page in ("domain_confirmation", "minister"):
+                    response = self.client.get(reverse(page))
+                    self.assertEqual(200, response.status_code)
+                    self.assertNotContains(response, 'http-equiv="refresh"')
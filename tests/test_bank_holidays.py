@@ -0,0 +1,133 @@
+import datetime
+import time
+from unittest.mock import Mock, patch
+
+import requests
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from request_a_govuk_domain.request.admin.model_admins import ApplicationAdmin
+from request_a_govuk_domain.request.holidays import (
+    _business_day_calendar,
+    bank_holiday_cache,
+    bank_holidays,
+    business_days_between,
+    refresh_bank_holidays,
+    save_bank_holidays,
+)
+from request_a_govuk_domain.request.models import Application, BankHoliday
+
+GOV_UK_BANK_HOLIDAYS = {
+    "england-and-wales": {
+        "division": "england-and-wales",
+        "events": [
+            {"title": "Christmas Day", "date": "2024-12-25", "notes": "", "bunting": True},
+            {"title": "Boxing Day", "date": "2024-12-26", "notes": "", "bunting": True},
+        ],
+    },
+    "scotland": {
+        "division": "scotland",
+        "events": [{"title": "St Andrew’s Day", "date": "2024-12-02", "notes": "", "bunting": True}],
+    },
+}
+
+
+class BankHolidaysTestMixin:
+    def setUp(self):
+        # The calendar is kept by the process, across test cases
+        bank_holiday_cache.invalidate()
+        _business_day_calendar.cache_clear()
+
+
+class BankHolidaysTestCase(BankHolidaysTestMixin, TestCase):
+    def test_bundled_holidays_are_used_when_none_are_stored(self):
+        self.assertIn(datetime.date(2024, 12, 25), bank_holidays())
+        self.assertIn(datetime.date(2026, 12, 28), bank_holidays())
+
+    @patch("requests.get")
+    def test_refresh_stores_england_and_wales_holidays(self, get_mock):
+        get_mock.return_value = Mock(json=Mock(return_value=GOV_UK_BANK_HOLIDAYS))
+        refresh_bank_holidays()
+
+        self.assertEqual(
+            [(datetime.date(2024, 12, 25), "Christmas Day"), (datetime.date(2024, 12, 26), "Boxing Day")],
+            list(BankHoliday.objects.values_list("date", "title")),
+        )
+        self.assertEqual((datetime.date(2024, 12, 25), datetime.date(2024, 12, 26)), bank_holidays())
+
+    @patch("requests.get", side_effect=requests.exceptions.ConnectionError)
+    def test_refresh_failure_keeps_stored_holidays(self, get_mock):
+        save_bank_holidays({datetime.date(2024, 12, 25): "Christmas Day"})
+        refresh_bank_holidays()
+        self.assertEqual((datetime.date(2024, 12, 25),), bank_holidays())
+
+    @override_settings(LOCAL_REFERENCE_CACHE_TIMEOUT=60)
+    def test_refresh_by_another_process_is_seen_once_the_local_cache_expires(self):
+        save_bank_holidays({datetime.date(2024, 12, 25): "Christmas Day"})
+        self.assertEqual((datetime.date(2024, 12, 25),), bank_holidays())
+        # As saved by the Celery worker, whose invalidation doesn't reach this process's local memory cache
+        BankHoliday.objects.create(date=datetime.date(2024, 12, 26), title="Boxing Day")
+        self.assertEqual((datetime.date(2024, 12, 25),), bank_holidays())
+        with patch("time.time", return_value=time.time() + 61):
+            self.assertEqual((datetime.date(2024, 12, 25), datetime.date(2024, 12, 26)), bank_holidays())
+
+    def test_holidays_are_read_once_per_process(self):
+        bank_holidays()
+        with self.assertNumQueries(0):
+            bank_holidays()
+
+    @patch("requests.get", side_effect=requests.exceptions.ConnectionError)
+    def test_business_days_skip_bank_holidays(self, get_mock):
+        save_bank_holidays({datetime.date(2024, 12, 25): "Christmas Day", datetime.date(2024, 12, 26): "Boxing Day"})
+        application = Application(
+            time_submitted=datetime.datetime(2024, 12, 23, 10, tzinfo=datetime.timezone.utc),
+            time_decided=datetime.datetime(2024, 12, 30, 10, tzinfo=datetime.timezone.utc),
+        )
+        # Mon 23rd to Mon 30th: 24th, 27th and 30th are business days
+        self.assertEqual(3, ApplicationAdmin(Application, None).get_business_days_to_complete(application))
+        get_mock.assert_not_called()
+
+
+class BusinessDaysBetweenTestCase(BankHolidaysTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        save_bank_holidays({datetime.date(2024, 12, 25): "Christmas Day", datetime.date(2024, 12, 26): "Boxing Day"})
+
+    def test_matches_counting_the_business_day_range(self):
+        holidays = bank_holidays()
+        start = datetime.datetime(2024, 12, 1, 9, tzinfo=datetime.timezone.utc)
+        starts, ends, expected = [], [], []
+        for offset in range(0, 40, 3):
+            for length in range(0, 15):
+                submitted = start + datetime.timedelta(days=offset)
+                decided = submitted + datetime.timedelta(days=length, hours=2)
+                days = [
+                    submitted.date() + datetime.timedelta(days=n)
+                    for n in range((decided.date() - submitted.date()).days + 1)
+                ]
+                business_days = [day for day in days if day.weekday() < 5 and day not in holidays]
+                starts.append(submitted)
+                ends.append(decided)
+                expected.append(max(0, len(business_days) - 1))
+        self.assertEqual(expected, business_days_between(starts, ends))
+
+    def test_missing_equal_and_reversed_timestamps_count_zero(self):
+        submitted = datetime.datetime(2024, 12, 2, 9, tzinfo=datetime.timezone.utc)
+        decided = datetime.datetime(2024, 12, 6, 9, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            [0, 0, 0, 0, 4],
+            business_days_between(
+                [None, submitted, submitted, decided, submitted], [decided, None, submitted, submitted, decided]
+            ),
+        )
+
+    def test_changelist_counts_business_days_for_the_page_at_once(self):
+        user = User.objects.create_superuser(username="superuser", password="secret")  # pragma: allowlist secret
+        self.client.force_login(user)
+        with patch(
+            "request_a_govuk_domain.request.admin.model_admins.business_days_between", wraps=business_days_between
+        ) as batch_mock:
+            response = self.client.get(reverse("admin:request_application_changelist"))
+        self.assertEqual(200, response.status_code)
+        batch_mock.assert_called_once()
@@ -0,0 +1,240 @@
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, override_settings
+
+from request_a_govuk_domain.request.clamav import (
+    CircuitBreaker,
+    ClamdBusyError,
+    ClamdCluster,
+    ClamdConnectionError,
+    ClamdError,
+    ClamdPool,
+    ClamdScanner,
+    ScanResult,
+    ScanVerdictCache,
+    clamd_hosts,
+    get_scanner,
+    reset_scanner,
+)
+from request_a_govuk_domain.request.fake_clamd import EICAR_SIGNATURE, FakeClamd
+from request_a_govuk_domain.request.utils import validate_file_infection
+
+INFECTED = b"X5O!P%@AP[4\\PZX54(P^)7CC)7}$" + EICAR_SIGNATURE + b"!$H+H*"
+
+
+class ClamdScannerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.server = FakeClamd().start()
+        self.addCleanup(self.server.stop)
+        self.scanner = self.make_scanner()
+
+    def make_scanner(self, size=2, timeout=5.0, max_idle=20.0, chunk_size=1024, verdict_cache=None) -> ClamdScanner:
+        scanner = ClamdScanner(ClamdPool(self.server.address, size, 5.0, timeout, max_idle), chunk_size, verdict_cache)
+        self.addCleanup(scanner.pool.clear)
+        return scanner
+
+    def test_scan(self):
+        self.assertEqual(ScanResult(infected=False), self.scanner.scan(io.BytesIO(b"x" * 5000)))
+        file = io.BytesIO(b"y" * 3000 + INFECTED)
+        file.seek(100)
+        self.assertEqual(ScanResult(infected=True, signature="Eicar-Test-Signature"), self.scanner.scan(file))
+        # The whole file is scanned, and can be read again from its start
+        self.assertEqual(0, file.tell())
+        self.assertTrue(self.scanner.ping())
+        self.assertEqual(self.server.version, self.scanner.version())
+
+    def test_connections_are_reused(self):
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: self.scanner.scan(io.BytesIO(b"x" * 100_000)), range(40)))
+        self.assertEqual(40, self.server.counts["scans"])
+        self.assertLessEqual(self.server.counts["connections"], 2)
+
+        metrics = self.scanner.metrics.snapshot()
+        self.assertEqual(40, metrics["scans"])
+        self.assertEqual(4_000_000, metrics["bytes"])
+        self.assertEqual(40, metrics["connections_opened"] + metrics["connections_reused"])
+        self.assertEqual(self.server.counts["connections"], metrics["connections_opened"])
+        self.assertIsNotNone(metrics["latency_p95_ms"])
+
+    def test_idle_connections_are_not_reused(self):
+        scanner = self.make_scanner(max_idle=0.05)
+        scanner.scan(io.BytesIO(b"x"))
+        time.sleep(0.1)
+        scanner.scan(io.BytesIO(b"x"))
+        self.assertEqual(2, self.server.counts["connections"])
+
+    def test_failed_reused_connection_is_retried(self):
+        self.scanner.scan(io.BytesIO(b"x"))
+        # clamd closed the idle session
+        self.scanner.pool._idle[0].socket.close()
+        self.assertFalse(self.scanner.scan(io.BytesIO(b"x")).infected)
+        self.assertEqual(2, self.server.counts["connections"])
+
+    def test_busy_pool_is_not_waited_for(self):
+        scanner = self.make_scanner(size=1)
+        with scanner.stream():
+            start = time.monotonic()
+            with self.assertRaises(ClamdBusyError), scanner.stream(wait=False):
+                pass
+            with self.assertRaises(ClamdBusyError):
+                scanner.version(wait=False)
+            self.assertLess(time.monotonic() - start, 1)
+
+    def test_errors(self):
+        self.server.max_stream_length = 10
+        with self.assertRaisesRegex(ClamdError, "size limit exceeded"):
+            self.scanner.scan(io.BytesIO(b"x" * 100))
+        self.assertEqual(1, self.scanner.metrics.snapshot()["errors"])
+        # The connection closed by clamd is not put back in the pool
+        self.assertEqual(0, len(self.scanner.pool._idle))
+
+        self.server.max_stream_length = 1000
+        self.server.latency = 0.5
+        with self.assertRaises(OSError):
+            self.make_scanner(timeout=0.1).scan(io.BytesIO(b"x"))
+
+        address = self.server.address
+        self.server.stop()
+        scanner = ClamdScanner(ClamdPool(address, 1, 1.0, 1.0, 20.0), 1024)
+        with self.assertRaisesRegex(ClamdError, "Could not connect"):
+            scanner.scan(io.BytesIO(b"x"))
+
+    def test_verdicts_are_cached_by_content_and_signature_version(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        scanner = self.make_scanner(verdict_cache=ScanVerdictCache(60))
+        for content in (b"letter", INFECTED, b"letter", INFECTED, b"other letter"):
+            scanner.scan(io.BytesIO(content))
+        self.assertEqual(3, self.server.counts["scans"])
+        self.assertEqual(
+            ScanResult(infected=True, signature="Eicar-Test-Signature"), scanner.scan(io.BytesIO(INFECTED))
+        )
+        metrics = scanner.metrics.snapshot()
+        self.assertEqual((3, 3, 0.5), (metrics["cache_hits"], metrics["cache_misses"], metrics["cache_hit_rate"]))
+        self.assertEqual(3, metrics["scans"])
+        # The version of the signatures was asked once
+        self.assertEqual(4, self.server.counts["commands"])
+
+        # Files are scanned again with new signatures
+        self.server.version = "ClamAV 1.0.0/27001/Fri Jan  2 00:00:00 2026"
+        scanner._signature_version = None
+        scanner.scan(io.BytesIO(b"letter"))
+        self.assertEqual(4, self.server.counts["scans"])
+        self.assertEqual("27001", scanner.signature_version())
+
+    def test_validate_file_infection(self):
+        self.addCleanup(cache.clear)
+        self.addCleanup(reset_scanner)
+        with override_settings(
+            IS_SCANNING_ENABLED=True, CLAMD_TCP_ADDR=self.server.address[0], CLAMD_TCP_SOCKET=self.server.address[1]
+        ):
+            reset_scanner()
+            self.assertIsNone(validate_file_infection(io.BytesIO(b"test")))
+            with self.assertRaisesMessage(ValidationError, "File is infected with malware."):
+                validate_file_infection(io.BytesIO(INFECTED))
+            self.assertEqual(1, get_scanner().metrics.snapshot()["connections_opened"])
+
+
+class ClamdClusterTestCase(SimpleTestCase):
+    def setUp(self):
+        self.servers = [FakeClamd().start(), FakeClamd().start()]
+        for server in self.servers:
+            self.addCleanup(server.stop)
+
+    def make_scanner(self, reset_timeout=30.0, health_check_interval=0.0) -> ClamdScanner:
+        cluster = ClamdCluster(
+            [ClamdPool(server.address, 4, 1.0, 5.0, 20.0) for server in self.servers],
+            failure_threshold=2,
+            reset_timeout=reset_timeout,
+            health_check_interval=health_check_interval,
+        )
+        scanner = ClamdScanner(cluster, 1024)
+        self.addCleanup(cluster.clear)
+        return scanner
+
+    def test_scans_go_to_the_least_busy_host(self):
+        slow, fast = self.servers
+        slow.latency = 0.2
+        scanner = self.make_scanner()
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: scanner.scan(io.BytesIO(b"x")), range(40)))
+        self.assertEqual(40, slow.counts["scans"] + fast.counts["scans"])
+        self.assertGreater(fast.counts["scans"], 3 * slow.counts["scans"])
+
+        metrics = scanner.pool.snapshot()
+        self.assertEqual(40, metrics["scans"])
+        slow_metrics = metrics["hosts"]["%s:%s" % slow.address]
+        fast_metrics = metrics["hosts"]["%s:%s" % fast.address]
+        self.assertEqual(slow.counts["scans"], slow_metrics["scans"])
+        self.assertGreaterEqual(slow_metrics["latency_mean_ms"], 200)
+        self.assertLess(fast_metrics["latency_mean_ms"], 200)
+
+    def test_failing_host_is_ejected(self):
+        failing, healthy = self.servers
+        failing.drop_connections = True
+        scanner = self.make_scanner(reset_timeout=0.2)
+        for _ in range(6):
+            self.assertFalse(scanner.scan(io.BytesIO(b"x")).infected)
+        self.assertEqual(6, healthy.counts["scans"])
+        # Ejected after 2 failures
+        self.assertEqual(2, failing.counts["dropped"])
+        failing_host = scanner.pool.hosts[0]
+        self.assertEqual(CircuitBreaker.OPEN, failing_host.breaker.state)
+
+        # A single scan is sent to the host once the breaker is half-open, and it is ejected again
+        time.sleep(0.25)
+        self.assertEqual(CircuitBreaker.HALF_OPEN, failing_host.breaker.state)
+        for _ in range(4):
+            scanner.scan(io.BytesIO(b"x"))
+        self.assertEqual(3, failing.counts["dropped"])
+        self.assertEqual(CircuitBreaker.OPEN, failing_host.breaker.state)
+
+        # And is back once it succeeds
+        failing.drop_connections = False
+        time.sleep(0.25)
+        for _ in range(4):
+            scanner.scan(io.BytesIO(b"x"))
+        self.assertEqual(CircuitBreaker.CLOSED, failing_host.breaker.state)
+        self.assertGreater(failing.counts["scans"], 0)
+
+        # Scans fail when every host fails
+        for server in self.servers:
+            server.drop_connections = True
+        with self.assertRaises(ClamdConnectionError):
+            for _ in range(3):
+                scanner.scan(io.BytesIO(b"x"))
+
+    def test_health_checks(self):
+        failing, healthy = self.servers
+        scanner = self.make_scanner()
+        cluster = scanner.pool
+        failing.drop_connections = True
+        cluster.check_health()
+        cluster.check_health()
+        self.assertEqual(CircuitBreaker.OPEN, cluster.hosts[0].breaker.state)
+        self.assertIsNone(cluster.hosts[0].ping_ms)
+        self.assertEqual(CircuitBreaker.CLOSED, cluster.hosts[1].breaker.state)
+        self.assertIsNotNone(cluster.hosts[1].ping_ms)
+
+        failing.drop_connections = False
+        cluster.check_health()
+        self.assertEqual(CircuitBreaker.CLOSED, cluster.hosts[0].breaker.state)
+
+        # Run in the background once the cluster is used
+        commands = healthy.counts["commands"]
+        scanner = self.make_scanner(health_check_interval=0.05)
+        scanner.ping()
+        time.sleep(0.3)
+        self.assertGreaterEqual(healthy.counts["commands"] - commands, 3)
+        self.assertIsNotNone(scanner.pool.snapshot()["hosts"]["%s:%s" % healthy.address]["ping_ms"])
+
+    @override_settings(CLAMD_TCP_ADDR="clamav", CLAMD_TCP_SOCKET=3310)
+    def test_clamd_hosts(self):
+        with override_settings(CLAMD_HOSTS=[]):
+            self.assertEqual([("clamav", 3310)], clamd_hosts())
+        with override_settings(CLAMD_HOSTS=["clamav-1:3311", "clamav-2"]):
+            self.assertEqual([("clamav-1", 3311), ("clamav-2", 3310)], clamd_hosts())
@@ -0,0 +1,108 @@
+from unittest.mock import Mock, patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.models import Application, ApplicationStatus, Review
+from tests.util import AdminScreenTestMixin, SessionDict, get_admin_change_view_url
+
+REVIEW_FORM = {
+    "registrar_details": "approve",
+    "registrar_details_notes": "I approve",
+    "domain_name_availability": "approve",
+    "domain_name_availability_notes": "I approve",
+    "registrant_org": "approve",
+    "registrant_org_notes": "I approve",
+    "registrant_person": "approve",
+    "registrant_person_notes": "I approve",
+    "domain_name_rules": "approve",
+    "domain_name_rules_notes": "I approve",
+    "registry_details": "approve",
+    "registry_details_notes": "I approve",
+    "reason": "Looks good to me",
+}
+
+
+@patch.dict("os.environ", {"NOMINET_ROMSID": "test", "NOMINET_SECRET": "test"})  # pragma: allowlist secret
+class DirtyFieldsTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        self.application = Application.objects.get(reference="GOVUK00000000001")
+        self.review = Review.objects.get(application=self.application)
+
+    def history_counts(self) -> tuple[int, int]:
+        return (
+            Application.history.filter(id=self.application.id).count(),
+            Review.history.filter(id=self.review.id).count(),
+        )
+
+    def application_updates(self, queries) -> list[str]:
+        return [q["sql"] for q in queries.captured_queries if q["sql"].startswith('UPDATE "request_application"')]
+
+    def test_save_without_changes_is_skipped(self):
+        self.application.status = ApplicationStatus.NEW
+        with CaptureQueriesContext(connection) as queries:
+            self.application.save()
+            self.review.save()
+        self.assertEqual([], queries.captured_queries)
+        self.assertEqual((1, 1), self.history_counts())
+
+    def test_only_changed_fields_are_updated(self):
+        self.application.status = ApplicationStatus.IN_PROGRESS
+        with CaptureQueriesContext(connection) as queries:
+            self.application.save()
+        (update,) = self.application_updates(queries)
+        self.assertIn('"status"', update)
+        self.assertIn('"last_updated"', update)
+        self.assertNotIn('"domain_name"', update)
+        self.assertEqual([], self.application.get_dirty_fields())
+        self.assertEqual((2, 1), self.history_counts())
+
+        # Saved values are reset by the save, so saving again does nothing
+        self.application.save()
+        self.assertEqual((2, 1), self.history_counts())
+
+    def test_update_fields_are_saved_as_given(self):
+        self.application.save(update_fields=["domain_purpose"])
+        self.assertEqual((2, 1), self.history_counts())
+
+    def test_refresh_from_db_resets_the_saved_values(self):
+        Application.objects.filter(id=self.application.id).update(status=ApplicationStatus.READY_2I)
+        self.application.refresh_from_db(fields=["status"])
+        self.assertEqual([], self.application.get_dirty_fields())
+        self.application.status = ApplicationStatus.IN_PROGRESS
+        self.assertEqual(["status"], self.application.get_dirty_fields())
+
+    def test_review_admin_saves_without_changes_add_no_history(self):
+        self.admin_client.post(get_admin_change_view_url(self.review), REVIEW_FORM)
+        self.assertEqual((2, 2), self.history_counts())
+
+        # Saving the same review again changes neither the review nor the application
+        with CaptureQueriesContext(connection) as queries:
+            response = self.admin_client.post(get_admin_change_view_url(self.review), REVIEW_FORM)
+        self.assertEqual(302, response.status_code)
+        self.assertEqual([], self.application_updates(queries))
+        self.assertEqual((2, 2), self.history_counts())
+
+    def test_decision_is_saved_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.admin_client.post(
+                f"/admin/application_confirm/?obj_id={self.application.id}&action=approval",
+                {
+                    "_confirm": "Confirm",
+                    "action": "approval",
+                    "obj_id": self.application.id,
+                    "status": "approved",
+                    "ar_reason": "All <good>",
+                },
+            )
+        self.assertEqual(1, len(self.application_updates(queries)))
+        self.assertEqual((2, 1), self.history_counts())
+        self.application.refresh_from_db()
+        self.assertEqual(ApplicationStatus.APPROVED, self.application.status)
+        self.assertEqual("All &lt;good&gt;", self.application.approval_or_rejection_comment)
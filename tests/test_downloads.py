@@ -0,0 +1,151 @@
+import tempfile
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.models import Application, EvidencePromotion, Review
+from request_a_govuk_domain.request.utils import handle_uploaded_file
+from tests.util import AdminScreenTestMixin, SessionDict
+
+
+def s3_storage(**kwargs) -> S3Boto3Storage:
+    return S3Boto3Storage(
+        access_key="key",
+        secret_key="secret",  # pragma: allowlist secret
+        region_name="eu-west-2",
+        bucket_name="bucket",
+        **kwargs,
+    )
+
+
+@override_settings(FILE_DOWNLOAD_MODE="redirect", FILE_DOWNLOAD_URL_EXPIRY=300)
+class DownloadTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        Application.objects.filter(reference="GOVUK00000000001").update(
+            written_permission_evidence="permission letter.pdf",
+            evidence_promotion={"written_permission_evidence": EvidencePromotion.PENDING},
+        )
+        self.application = Application.objects.get(reference="GOVUK00000000001")
+        self.review = Review.objects.get(application=self.application)
+
+    def review_download_url(self) -> str:
+        return reverse("admin:review_download_file", args=[self.review.id, "written_permission_evidence"])
+
+    def test_admin_download_redirects_to_a_presigned_url(self):
+        storage = s3_storage()
+        with (
+            patch("request_a_govuk_domain.request.admin.model_admins.root_storage", return_value=storage),
+            patch.object(storage, "url", wraps=storage.url) as mock_url,
+        ):
+            response = self.admin_client.get(self.review_download_url())
+            self.assertEqual(302, response.status_code)
+            url = urlparse(response["Location"])
+            query = parse_qs(url.query)
+            # Still in the temporary folder, as it is pending promotion
+            self.assertEqual("/temp_files/permission%20letter.pdf", url.path)
+            self.assertEqual(["300"], query["X-Amz-Expires"])
+            self.assertEqual(['inline; filename="permission letter.pdf"'], query["response-content-disposition"])
+            self.assertEqual(["application/pdf"], query["response-content-type"])
+
+            # The URL is cached
+            application_download_url = reverse(
+                "admin:application_download_file", args=[self.application.id, "written_permission_evidence"]
+            )
+            self.assertEqual(response["Location"], self.admin_client.get(application_download_url)["Location"])
+            self.assertEqual(1, mock_url.call_count)
+
+    def test_admin_download_checks_the_permissions(self):
+        User.objects.create_user(username="staff", password="secret", is_staff=True)  # pragma: allowlist secret
+        self.client.login(username="staff", password="secret")  # pragma: allowlist secret
+        with patch("request_a_govuk_domain.request.admin.model_admins.root_storage", return_value=s3_storage()):
+            self.assertEqual(403, self.client.get(self.review_download_url()).status_code)
+            missing = reverse("admin:review_download_file", args=[0, "written_permission_evidence"])
+            self.assertEqual(404, self.admin_client.get(missing).status_code)
+
+    @override_settings(FILE_DOWNLOAD_MODE="proxy")
+    def test_proxy_mode_streams_the_file(self):
+        storage = Mock(spec=S3Boto3Storage)
+        storage.open.return_value = ContentFile(b"evidence", name="permission letter.pdf")
+        with patch("request_a_govuk_domain.request.admin.model_admins.root_storage", return_value=storage):
+            response = self.admin_client.get(self.review_download_url())
+        self.assertEqual(b"evidence", b"".join(response.streaming_content))
+        storage.open.assert_called_once_with("temp_files/permission letter.pdf", "rb")
+
+    def test_public_download(self):
+        session = self.client.session
+        session["registration_data"] = {
+            "written_permission_file_uploaded_filename": "abc123.pdf",
+            "written_permission_file_original_filename": "letter.pdf",
+        }
+        session.save()
+        url = reverse("download_file", args=["written_permission"])
+
+        storage = s3_storage(location="temp_files/")
+        with (
+            patch("request_a_govuk_domain.request.views.select_storage", return_value=storage),
+            patch.object(storage, "exists", return_value=True),
+        ):
+            response = self.client.get(url)
+        self.assertEqual(302, response.status_code)
+        self.assertEqual("/temp_files/abc123.pdf", urlparse(response["Location"]).path)
+        self.assertIn("filename%3D%22letter.pdf%22", response["Location"])
+
+        # Files on the file system are streamed
+        with tempfile.TemporaryDirectory() as media_root:
+            storage = FileSystemStorage(location=media_root)
+            storage.save("abc123.pdf", ContentFile(b"evidence"))
+            with patch("request_a_govuk_domain.request.views.select_storage", return_value=storage):
+                response = self.client.get(url)
+                self.assertEqual(b"evidence", b"".join(response.streaming_content))
+        self.assertEqual('inline; filename="letter.pdf"', response["Content-Disposition"])
+
+        self.assertEqual(404, self.client.get(reverse("download_file", args=["minister"])).status_code)
+
+    @override_settings(S3_STORAGE_ENABLED=False, FILE_DOWNLOAD_SENDFILE_URL="/protected-media/")
+    def test_file_system_downloads_are_sent_by_the_web_server(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            storage = FileSystemStorage(location=media_root)
+            Application.objects.filter(id=self.application.id).update(evidence_promotion={})
+            name = storage.save("session-key/permission letter.pdf", ContentFile(b"evidence"))
+            Application.objects.filter(id=self.application.id).update(written_permission_evidence=name)
+
+            with (
+                patch("request_a_govuk_domain.request.admin.model_admins.root_storage", return_value=storage),
+                patch.object(storage, "open") as mock_open,
+            ):
+                with override_settings(FILE_DOWNLOAD_SENDFILE="x-accel-redirect"):
+                    response = self.admin_client.get(self.review_download_url())
+                self.assertEqual("/protected-media/session-key/permission%20letter.pdf", response["X-Accel-Redirect"])
+                self.assertEqual('inline; filename="permission letter.pdf"', response["Content-Disposition"])
+                self.assertEqual("application/pdf", response["Content-Type"])
+                self.assertEqual(b"", response.content)
+
+                with override_settings(FILE_DOWNLOAD_SENDFILE="x-sendfile"):
+                    response = self.admin_client.get(self.review_download_url())
+                self.assertEqual(f"{media_root}/session-key/permission letter.pdf", response["X-Sendfile"])
+                self.assertEqual(b"", response.content)
+            mock_open.assert_not_called()
+
+    @override_settings(S3_STORAGE_ENABLED=False)
+    def test_uploaded_file_is_saved_in_the_media_root(self):
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            storage = FileSystemStorage()
+            with patch("request_a_govuk_domain.request.utils.select_storage", return_value=storage):
+                name = handle_uploaded_file(SimpleUploadedFile("letter.pdf", b"evidence"), "session-key")
+            self.assertTrue(name.startswith("session-key/"))
+            with storage.open(name) as file:
+                self.assertEqual(b"evidence", file.read())
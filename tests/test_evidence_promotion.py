@@ -0,0 +1,111 @@
+import threading
+from unittest.mock import Mock, patch
+
+from botocore.exceptions import ClientError
+from django.test import TestCase
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.models import Application, EvidencePromotion
+from request_a_govuk_domain.request.models.application import EVIDENCE_FIELDS
+from tests.util import AdminScreenTestMixin, SessionDict
+
+
+@patch("request_a_govuk_domain.request.models.application.S3_STORAGE_ENABLED", True)
+class EvidencePromotionTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        self.application = Application.objects.get(reference="GOVUK00000000001")
+        self.storage = Mock()
+        self.storage.bucket_name = "bucket"
+        patcher = patch("request_a_govuk_domain.request.models.application.select_storage", return_value=self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def submit_evidence(self):
+        with (
+            patch("request_a_govuk_domain.request.tasks.promote_evidence.delay") as mock_delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for field_name in EVIDENCE_FIELDS:
+                setattr(self.application, field_name, f"{field_name} 1.pdf")
+            self.application.save()
+            # Queued once the transaction commits
+            mock_delay.assert_not_called()
+        mock_delay.assert_called_once_with(self.application.id)
+
+    def test_evidence_is_promoted_concurrently_after_the_save(self):
+        self.submit_evidence()
+        self.assertEqual([], self.storage.mock_calls)
+        self.assertEqual(dict.fromkeys(EVIDENCE_FIELDS, EvidencePromotion.PENDING), self.application.evidence_promotion)
+
+        copy_threads = set()
+        self.storage.connection.meta.client.copy_object.side_effect = lambda **kwargs: copy_threads.add(
+            threading.get_ident()
+        )
+        self.assertEqual(list(EVIDENCE_FIELDS), Application.promote_evidence(self.application.id))
+        self.assertEqual(3, self.storage.connection.meta.client.copy_object.call_count)
+        self.assertNotIn(threading.get_ident(), copy_threads)
+        self.storage.connection.meta.client.delete_objects.assert_called_once_with(
+            Bucket="bucket",
+            Delete={"Objects": [{"Key": f"temp_files/{field_name} 1.pdf"} for field_name in EVIDENCE_FIELDS]},
+        )
+
+        self.application.refresh_from_db()
+        self.assertEqual(
+            dict.fromkeys(EVIDENCE_FIELDS, EvidencePromotion.PROMOTED), self.application.evidence_promotion
+        )
+        for field_name in EVIDENCE_FIELDS:
+            self.assertEqual(
+                f"applications/GOVUK00000000001/{field_name}_1.pdf", self.application.evidence_path(field_name)
+            )
+
+        # Saving the application again queues nothing
+        with patch("request_a_govuk_domain.request.tasks.promote_evidence.delay") as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.application.domain_purpose = "Website"
+                self.application.save()
+        mock_delay.assert_not_called()
+
+    def test_failed_copy_leaves_the_evidence_pending(self):
+        self.submit_evidence()
+        self.storage.connection.meta.client.copy_object.side_effect = ClientError({}, "CopyObject")
+        with self.assertRaises(ClientError):
+            Application.promote_evidence(self.application.id)
+        self.storage.connection.meta.client.delete_objects.assert_not_called()
+
+        self.application.refresh_from_db()
+        self.assertEqual(dict.fromkeys(EVIDENCE_FIELDS, EvidencePromotion.PENDING), self.application.evidence_promotion)
+        self.assertEqual(
+            "temp_files/written_permission_evidence 1.pdf", self.application.evidence_path(EVIDENCE_FIELDS[2])
+        )
+
+    def test_evidence_replaced_while_copied_is_left_pending(self):
+        self.submit_evidence()
+        lock = Application.objects.select_for_update
+
+        def replace_evidence_then_lock():
+            # Another file is uploaded while the files are copied, without holding the lock
+            Application.objects.filter(id=self.application.id).update(written_permission_evidence="letter 2.pdf")
+            return lock()
+
+        with patch.object(Application.objects, "select_for_update", side_effect=replace_evidence_then_lock):
+            self.assertEqual(list(EVIDENCE_FIELDS[:2]), Application.promote_evidence(self.application.id))
+        self.assertEqual(3, self.storage.connection.meta.client.copy_object.call_count)
+        self.storage.connection.meta.client.delete_objects.assert_called_once_with(
+            Bucket="bucket",
+            Delete={"Objects": [{"Key": f"temp_files/{field_name} 1.pdf"} for field_name in EVIDENCE_FIELDS[:2]]},
+        )
+
+        self.application.refresh_from_db()
+        self.assertEqual(
+            {
+                EVIDENCE_FIELDS[0]: EvidencePromotion.PROMOTED,
+                EVIDENCE_FIELDS[1]: EvidencePromotion.PROMOTED,
+                EVIDENCE_FIELDS[2]: EvidencePromotion.PENDING,
+            },
+            self.application.evidence_promotion,
+        )
+        self.assertEqual("temp_files/letter 2.pdf", self.application.evidence_path(EVIDENCE_FIELDS[2]))
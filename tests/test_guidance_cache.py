@@ -0,0 +1,49 @@
+from unittest.mock import Mock, patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.caches import guidance_html
+from request_a_govuk_domain.request.models import Review, ReviewFormGuidance
+from tests.util import AdminScreenTestMixin, SessionDict, get_admin_change_view_url
+
+
+class GuidanceCacheTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("ABCDEFGHIJK", request)
+        self.review = Review.objects.get(application__reference="ABCDEFGHIJK")
+
+    def test_guidance_is_stored_as_html(self):
+        guidance = ReviewFormGuidance.objects.get(name="registrar_details")
+        guidance.how_to = "Check the **registrar**"
+        guidance.save()
+        guidance.refresh_from_db()
+        self.assertEqual("<p>Check the <strong>registrar</strong></p>", guidance.how_to_html)
+
+    def test_review_page_does_not_query_or_render_guidance_once_cached(self):
+        self.admin_client.get(get_admin_change_view_url(self.review))
+        with patch("markdown.markdown") as markdown_, CaptureQueriesContext(connection) as queries:
+            response = self.admin_client.get(get_admin_change_view_url(self.review))
+        self.assertEqual(200, response.status_code)
+        markdown_.assert_not_called()
+        self.assertFalse([q for q in queries.captured_queries if "reviewformguidance" in q["sql"]])
+
+    def test_changed_guidance_is_shown_on_the_review_page(self):
+        self.admin_client.get(get_admin_change_view_url(self.review))
+        guidance = ReviewFormGuidance.objects.get(name="registry_details")
+        guidance.how_to = "Updated *registry* guidance"
+        guidance.save()
+
+        response = self.admin_client.get(get_admin_change_view_url(self.review))
+        self.assertContains(response, "<p>Updated <em>registry</em> guidance</p>", html=True)
+
+    def test_missing_guidance_raises_does_not_exist(self):
+        guidance_html("registrar_details")
+        ReviewFormGuidance.objects.filter(name="registrar_details").delete()
+        with self.assertRaises(ReviewFormGuidance.DoesNotExist):
+            guidance_html("registrar_details")
@@ -0,0 +1,122 @@
+from unittest.mock import Mock, patch
+
+from django.db import connection, transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from simple_history.models import HistoricalRecords
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.middleware import admin_history_request_middleware
+from request_a_govuk_domain.request.models import Application, Review
+from request_a_govuk_domain.request.models.history import buffered_history
+from tests.test_dirty_fields import REVIEW_FORM
+from tests.util import AdminScreenTestMixin, SessionDict, get_admin_change_view_url
+
+
+@patch.dict("os.environ", {"NOMINET_ROMSID": "test", "NOMINET_SECRET": "test"})  # pragma: allowlist secret
+class HistoryBufferTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        self.application = Application.objects.get(reference="GOVUK00000000001")
+        self.review = Review.objects.get(application=self.application)
+
+    def history_inserts(self, queries) -> list[str]:
+        return [q["sql"] for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "request_historical')]
+
+    @override_settings(HISTORY_BUFFERED_WRITES=True)
+    def test_admin_history_is_written_at_the_end_of_the_request(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.admin_client.post(get_admin_change_view_url(self.review), REVIEW_FORM)
+        self.assertEqual(302, response.status_code)
+        inserts = self.history_inserts(queries)
+        self.assertEqual(2, len(inserts))
+        # Written after every change of the request
+        sqls = [q["sql"] for q in queries.captured_queries]
+        last_update = max(i for i, sql in enumerate(sqls) if sql.startswith('UPDATE "request_'))
+        self.assertLess(last_update, min(sqls.index(insert) for insert in inserts))
+
+        record = Review.history.filter(id=self.review.id).latest("history_date")
+        self.assertEqual(self.superuser, record.history_user)
+        self.assertEqual("I approve", record.registrar_details_notes)
+        self.assertEqual("approve", record.registrar_details)
+        self.assertEqual(self.superuser, Application.history.filter(id=self.application.id).latest().history_user)
+
+    def test_records_are_written_as_deltas(self):
+        with buffered_history():
+            self.review.registrar_details = "approve"
+            self.review.save()
+            self.review.registrar_details_notes = "Checked"
+            self.review.save()
+            self.application.domain_purpose = "Website"
+            self.application.save()
+            self.assertEqual(1, Review.history.filter(id=self.review.id).count())
+
+        first, second = Review.history.model.objects.filter(id=self.review.id).order_by("history_date")[1:]
+        self.assertEqual({"registrar_details": "approve"}, first.history_delta)
+        self.assertEqual({"registrar_details_notes": "Checked"}, second.history_delta)
+        self.assertEqual(("approve", "Checked"), (second.registrar_details, second.registrar_details_notes))
+        self.assertEqual(2, Application.history.filter(id=self.application.id).count())
+
+    def test_records_of_rolled_back_changes_are_discarded(self):
+        with buffered_history():
+            try:
+                with transaction.atomic():
+                    self.review.registrar_details = "approve"
+                    self.review.save()
+                    raise ValueError
+            except ValueError:
+                pass
+            with transaction.atomic():
+                self.application.domain_purpose = "Website"
+                self.application.save()
+            self.application.domain_purpose = "Email"
+            self.application.save()
+            self.assertEqual(1, Application.history.filter(id=self.application.id).count())
+        self.assertEqual(1, Review.history.filter(id=self.review.id).count())
+        self.assertEqual(3, Application.history.filter(id=self.application.id).count())
+
+        with self.assertRaises(ValueError), buffered_history():
+            self.application.status = "approved"
+            self.application.save()
+            raise ValueError
+        self.assertEqual(3, Application.history.filter(id=self.application.id).count())
+
+    def test_records_of_savepoints_nested_in_a_rolled_back_one_are_discarded(self):
+        with buffered_history():
+            try:
+                with transaction.atomic():
+                    with transaction.atomic():
+                        self.review.registrar_details = "approve"
+                        self.review.save()
+                    raise ValueError
+            except ValueError:
+                pass
+            with transaction.atomic():
+                self.review.registrar_details = "reject"
+                self.review.save()
+        history = Review.history.filter(id=self.review.id).order_by("history_date")
+        self.assertEqual([None, "reject"], [record.registrar_details for record in history])
+
+    def test_changes_are_rolled_back_when_the_history_is_not_written(self):
+        with (
+            patch.object(Application.history.model, "insert_history", side_effect=ValueError),
+            self.assertRaises(ValueError),
+            buffered_history(),
+        ):
+            self.application.domain_purpose = "Website"
+            self.application.save()
+        self.application.refresh_from_db()
+        self.assertNotEqual("Website", self.application.domain_purpose)
+        self.assertEqual(1, Application.history.filter(id=self.application.id).count())
+
+    def test_history_request_is_only_set_for_the_admin(self):
+        def get_response(request):
+            return getattr(HistoricalRecords.context, "request", None)
+
+        middleware = admin_history_request_middleware(get_response)
+        admin_request = RequestFactory().get("/admin/request/review/")
+        self.assertIs(admin_request, middleware(admin_request))
+        self.assertIsNone(middleware(RequestFactory().get("/registrar-details/")))
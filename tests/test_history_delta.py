@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta, timezone
+from importlib import import_module
+from unittest.mock import Mock
+
+from dateutil.relativedelta import relativedelta
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.models import Application, Review
+from request_a_govuk_domain.request.models.history import (
+    buffered_history,
+    convert_history,
+)
+from tests.util import AdminScreenTestMixin, SessionDict
+
+NOTES = "x" * 5000
+
+
+class HistoryDeltaTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        self.review = Review.objects.get(application__reference="GOVUK00000000001")
+        self.review.registrar_details_notes = NOTES
+        self.review.save()
+        self.review.registrar_details = "approve"
+        self.review.save()
+
+    def stored(self) -> list[tuple]:
+        return list(
+            Review.history.model.objects.filter(id=self.review.id)
+            .order_by("history_date", "history_id")
+            .values_list("history_delta", "registrar_details", "registrar_details_notes")
+        )
+
+    def test_only_changed_fields_are_stored(self):
+        stored = self.stored()
+        self.assertEqual(3, len(stored))
+        # The first record holds all the fields
+        self.assertEqual(set(Review.history.model._history_delta_fields), set(stored[0][0]))
+        self.assertEqual(({"registrar_details_notes": NOTES}, None, None), stored[1])
+        self.assertEqual(({"registrar_details": "approve"}, None, None), stored[2])
+
+    def test_records_are_rebuilt_when_read(self):
+        with CaptureQueriesContext(connection) as queries:
+            latest, previous, first = Review.history.filter(id=self.review.id).order_by("-history_date")
+        self.assertEqual(2, len(queries.captured_queries))
+        self.assertEqual(("approve", NOTES), (latest.registrar_details, latest.registrar_details_notes))
+        self.assertEqual((None, NOTES), (previous.registrar_details, previous.registrar_details_notes))
+        self.assertEqual((None, None), (first.registrar_details, first.registrar_details_notes))
+        self.assertEqual(["registrar_details"], latest.diff_against(previous).changed_fields)
+        self.assertEqual(NOTES, latest.instance.registrar_details_notes)
+
+        # Records read one at a time are rebuilt when a delta field is read
+        record = Review.history.model.objects.get(history_id=latest.history_id)
+        self.assertEqual("approve", record.registrar_details)
+        self.assertEqual(NOTES, record.registrar_details_notes)
+        self.assertEqual(NOTES, record.prev_record.registrar_details_notes)
+
+    def test_first_record_of_the_month_holds_all_the_fields(self):
+        self.review._history_date = datetime.now(timezone.utc).replace(day=1) + relativedelta(months=1)
+        self.review.reason = "Looks good"
+        self.review.save()
+        record = Review.history.filter(id=self.review.id).latest("history_date")
+        self.assertEqual(set(Review.history.model._history_delta_fields), set(record.history_delta))
+        self.assertEqual((NOTES, "Looks good"), (record.registrar_details_notes, record.reason))
+
+    def test_history_views(self):
+        history = list(Review.history.filter(id=self.review.id).order_by("-history_date"))
+        response = self.admin_client.get(reverse("admin:request_review_history", args=[self.review.id]))
+        self.assertContains(response, "registrar_details_notes")
+        response = self.admin_client.get(
+            reverse("admin:request_review_simple_history", args=[self.review.id, history[1].history_id])
+        )
+        self.assertContains(response, NOTES)
+
+    def test_convert_history(self):
+        history_model = Review.history.model
+        fields = history_model._history_delta_fields
+        expected = [
+            (record.history_id, *(getattr(record, field) for field in fields))
+            for record in Review.history.filter(id=self.review.id).order_by("history_date")
+        ]
+
+        self.assertEqual(3, convert_history(history_model, fields, to_deltas=False))
+        rows = history_model.objects.filter(id=self.review.id).order_by("history_date")
+        self.assertEqual(expected, list(rows.values_list("history_id", *fields)))
+        self.assertEqual([None, None, None], list(rows.values_list("history_delta", flat=True)))
+
+        convert_history(history_model, fields, to_deltas=True)
+        self.assertEqual(
+            [{"registrar_details_notes": NOTES}, {"registrar_details": "approve"}],
+            list(rows.values_list("history_delta", flat=True))[1:],
+        )
+        self.assertEqual(
+            expected,
+            [
+                (record.history_id, *(getattr(record, field) for field in fields))
+                for record in Review.history.filter(id=self.review.id).order_by("history_date")
+            ],
+        )
+
+    def test_migration(self):
+        migration = import_module("request_a_govuk_domain.request.migrations.0031_review_history_delta")
+        expected = self.rebuilt()
+        migration.review_history_to_rows(apps, None)
+        self.assertEqual([None, None, None], [delta for delta, *_ in self.stored()])
+        migration.review_history_to_deltas(apps, None)
+        self.assertEqual({"registrar_details": "approve"}, self.stored()[2][0])
+        self.assertEqual(expected, self.rebuilt())
+
+    def rebuilt(self) -> list[tuple]:
+        return [
+            (record.registrar_details, record.registrar_details_notes, record.reason)
+            for record in Review.history.filter(id=self.review.id).order_by("history_date", "history_id")
+        ]
+
+    def test_record_stored_after_a_later_one(self):
+        # Saved by a transaction which committed after the one saving the latest record
+        notes = Review.history.filter(id=self.review.id).order_by("history_date")[1]
+        self.review._history_date = notes.history_date + timedelta(microseconds=1)
+        self.review.registrar_details = None
+        self.review.reason = "Late"
+        self.review.save()
+        self.assertEqual(
+            [(None, None, None), (None, NOTES, None), (None, NOTES, "Late"), ("approve", NOTES, None)], self.rebuilt()
+        )
+        # Both the late record and the one after it hold all the fields
+        fields = set(Review.history.model._history_delta_fields)
+        self.assertEqual([fields, fields], [set(delta) for delta, *_ in self.stored()[2:]])
+
+    def test_buffered_records_stored_around_a_later_one(self):
+        latest = Review.history.filter(id=self.review.id).latest("history_date")
+        with buffered_history():
+            self.review._history_date = latest.history_date - timedelta(microseconds=1)
+            self.review.reason = "Late"
+            self.review.save()
+            self.review._history_date = latest.history_date + timedelta(microseconds=1)
+            self.review.reason = "Later"
+            self.review.save()
+        self.assertEqual(
+            [
+                (None, None, None),
+                (None, NOTES, None),
+                ("approve", NOTES, "Late"),
+                ("approve", NOTES, None),
+                ("approve", NOTES, "Later"),
+            ],
+            self.rebuilt(),
+        )
+
+    def test_full_rows_are_read_as_they_are(self):
+        application = Application.objects.get(reference="GOVUK00000000001")
+        Review.history.bulk_history_create([Review(id=self.review.id, application=application, reason="bulk")])
+        record = Review.history.filter(id=self.review.id).latest("history_date")
+        self.assertIsNone(record.history_delta)
+        self.assertEqual(("bulk", None), (record.reason, record.registrar_details_notes))
@@ -0,0 +1,132 @@
+from datetime import datetime, timezone
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from dateutil.relativedelta import relativedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from request_a_govuk_domain.request import db
+from request_a_govuk_domain.request.admin.history import since_submission
+from request_a_govuk_domain.request.models import Application, Review
+from request_a_govuk_domain.request.partitioning import (
+    HistoryPartitioningStrategy,
+    history_models,
+    manage_history_partitions,
+)
+from tests.util import AdminScreenTestMixin, SessionDict
+
+
+def month_start(months_from_now: int) -> datetime:
+    now = datetime.now(timezone.utc)
+    return datetime(now.year, now.month, 1, tzinfo=timezone.utc) + relativedelta(months=months_from_now)
+
+
+class HistoryPartitioningTestCase(AdminScreenTestMixin, TestCase):
+    def partitions(self, table: str) -> set[str]:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = %s::regclass", [table])
+            return {name for (name,) in cursor.fetchall()}
+
+    def table_exists(self, table: str) -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [table])
+            return cursor.fetchone()[0] is not None
+
+    def partition_name(self, table: str, start: datetime) -> str:
+        return f"{table}_{start.strftime('%Y_%b').lower()}"
+
+    def test_history_tables_are_partitioned(self):
+        tables = {model._meta.db_table for model in history_models()}
+        self.assertIn(Application.history.model._meta.db_table, tables)
+        self.assertIn(Review.history.model._meta.db_table, tables)
+        self.assertEqual(7, len(tables))
+        for table in tables:
+            self.assertEqual(
+                {
+                    f"{table}_legacy",
+                    f"{table}_default",
+                    *(self.partition_name(table, month_start(months)) for months in (1, 2, 3)),
+                },
+                self.partitions(table),
+            )
+
+    def test_history_is_written_to_the_partitions(self):
+        request = Mock()
+        request.session = SessionDict({"registration_data": self.registration_data})
+        db.save_data_in_database("GOVUK00000000001", request)
+        application = Application.objects.get(reference="GOVUK00000000001")
+        application.status = "approved"
+        application.save()
+        history = Application.history.filter(id=application.id)
+        self.assertEqual(2, history.count())
+        self.assertEqual(2, len(set(history.values_list("history_id", flat=True))))
+
+    def test_upcoming_partitions_are_created_and_expired_ones_detached(self):
+        table = Application.history.model._meta.db_table
+        with (
+            patch.object(
+                HistoryPartitioningStrategy,
+                "get_start_datetime",
+                return_value=month_start(2) - relativedelta(seconds=1),
+            ),
+            override_settings(HISTORY_RETENTION_MONTHS=1),
+        ):
+            plan = manage_history_partitions(dry_run=True)
+        # The legacy partition ends at the start of next month, so it is kept until a month after that
+        self.assertEqual(0, len(plan.deletions))
+
+        with (
+            patch.object(HistoryPartitioningStrategy, "get_start_datetime", return_value=month_start(4)),
+            override_settings(HISTORY_RETENTION_MONTHS=1),
+            self.assertLogs("request_a_govuk_domain.request.partitioning", "INFO") as logs,
+        ):
+            plan = manage_history_partitions()
+        self.assertIn(
+            f"INFO:request_a_govuk_domain.request.partitioning:Detached partition "
+            f"{month_start(1).strftime('%Y_%b').lower()} of {table}",
+            logs.output,
+        )
+
+        partitions = self.partitions(table)
+        created = {self.partition_name(table, month_start(months)) for months in (5, 6, 7)}
+        detached = {self.partition_name(table, month_start(months)) for months in (1, 2, 3)}
+        self.assertEqual(created, created & partitions)
+        self.assertFalse(detached & partitions)
+        # Detached partitions are kept as tables
+        for partition in detached:
+            self.assertTrue(self.table_exists(partition))
+        # The legacy partition was not created by the partitioning, but is detached once expired too
+        self.assertNotIn(f"{table}_legacy", partitions)
+        self.assertTrue(self.table_exists(f"{table}_legacy"))
+        self.assertEqual(7 * 3, len(plan.creations))
+        self.assertEqual(7 * 4, len(plan.deletions))
+
+        # Nothing left to detach
+        with (
+            patch.object(HistoryPartitioningStrategy, "get_start_datetime", return_value=month_start(4)),
+            override_settings(HISTORY_RETENTION_MONTHS=1),
+        ):
+            self.assertEqual(0, len(manage_history_partitions(dry_run=True).deletions))
+
+    def test_command_dry_run(self):
+        table = Application.history.model._meta.db_table
+        stdout = StringIO()
+        with patch.object(HistoryPartitioningStrategy, "get_start_datetime", return_value=month_start(1)):
+            call_command("partition_history", "--dry-run", stdout=stdout)
+        self.assertIn(f"+ {self.partition_name(table, month_start(4))}", stdout.getvalue())
+        self.assertIn("7 partitions created, 0 partitions detached", stdout.getvalue())
+        self.assertNotIn(self.partition_name(table, month_start(4)), self.partitions(table))
+
+        stdout = StringIO()
+        call_command("partition_history", stdout=stdout)
+        self.assertIn("0 partitions created, 0 partitions detached", stdout.getvalue())
+
+    def test_history_since_submission_skips_older_partitions(self):
+        table = Application.history.model._meta.db_table
+        application = Application(id=1, time_submitted=month_start(2))
+        plan = since_submission(Application.history.filter(id=application.id), application).explain()
+        self.assertNotIn(f"{table}_legacy", plan)
+        self.assertNotIn(self.partition_name(table, month_start(1)), plan)
+        self.assertIn(self.partition_name(table, month_start(2)), plan)
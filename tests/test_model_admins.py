@@ -10,7 +10,11 @@ from parameterized import parameterized
 
 from request_a_govuk_domain.request import db
 from request_a_govuk_domain.request.admin.model_admins import convert_to_local_time
-from request_a_govuk_domain.request.models import Application, Registrar
+from request_a_govuk_domain.request.models import (
+    Application,
+    EvidencePromotion,
+    Registrar,
+)
 
 
 class ModelAdminTestCase(TestCase):
@@ -78,39 +82,64 @@ class ModelAdminTestCase(TestCase):
                 mock_storage.bucket_name = "mock-data-bucket"
                 mock_select_storage.return_value = mock_storage
                 # run test
-                response = c.post(
-                    get_admin_change_view_url(app),
-                    data={
-                        "written_permission_evidence": written_permission_evidence,
-                        "reference": app.reference,
-                        "time_decided_0": "2024-06-24",
-                        "time_decided_1": "12:00",
-                        "status": app.status,
-                        "domain_name": app.domain_name,
-                        "registrar_person": app.registrar_person.id,
-                        "registrant_person": app.registrant_person.id,
-                        "registry_published_person": app.registry_published_person.id,
-                        "registrant_org": app.registrant_org.id,
-                        "registrar_org": app.registrar_org.id,
-                    },
-                    follow=True,
+                with (
+                    patch("request_a_govuk_domain.request.tasks.promote_evidence.delay") as mock_delay,
+                    self.captureOnCommitCallbacks(execute=True),
+                ):
+                    response = c.post(
+                        get_admin_change_view_url(app),
+                        data={
+                            "written_permission_evidence": written_permission_evidence,
+                            "reference": app.reference,
+                            "time_decided_0": "2024-06-24",
+                            "time_decided_1": "12:00",
+                            "status": app.status,
+                            "domain_name": app.domain_name,
+                            "registrar_person": app.registrar_person.id,
+                            "registrant_person": app.registrant_person.id,
+                            "registry_published_person": app.registry_published_person.id,
+                            "registrant_org": app.registrant_org.id,
+                            "registrar_org": app.registrar_org.id,
+                        },
+                        follow=True,
+                    )
+                # The file is uploaded to the temporary folder by the request, and promoted by a task
+                mock_storage.assert_has_calls(
+                    [
+                        call.connection.meta.client.put_object(
+                            Bucket="mock-data-bucket",
+                            Key=f"temp_files/{file_name}",
+                            Body=b"file_content",
+                        ),
+                    ]
                 )
+                mock_delay.assert_called_once_with(app.id)
+                app.refresh_from_db()
+                self.assertEqual({"written_permission_evidence": EvidencePromotion.PENDING}, app.evidence_promotion)
+                self.assertEqual(f"temp_files/{file_name}", app.evidence_path("written_permission_evidence"))
+
+                mock_storage.reset_mock()
+                self.assertEqual(["written_permission_evidence"], Application.promote_evidence(app.id))
+                # Promoting the files again does nothing
+                self.assertEqual([], Application.promote_evidence(app.id))
 
         mock_storage.assert_has_calls(
             [
-                call.connection.meta.client.put_object(
-                    Bucket="mock-data-bucket",
-                    Key=f"temp_files/{file_name}",
-                    Body=b"file_content",
-                ),
                 call.connection.meta.client.copy_object(
                     Bucket="mock-data-bucket",
                     CopySource=f"mock-data-bucket/temp_files/{file_name}",
                     Key=f"applications/ABCDEFGHIJK/{expected_name}",
                 ),
-                call.delete(f"temp_files/{file_name}"),
+                call.connection.meta.client.delete_objects(
+                    Bucket="mock-data-bucket",
+                    Delete={"Objects": [{"Key": f"temp_files/{file_name}"}]},
+                ),
             ]
         )
+        self.assertEqual(2, len(mock_storage.mock_calls))
+        app.refresh_from_db()
+        self.assertEqual({"written_permission_evidence": EvidencePromotion.PROMOTED}, app.evidence_promotion)
+        self.assertEqual(f"applications/ABCDEFGHIJK/{expected_name}", app.evidence_path("written_permission_evidence"))
         self.assertEqual(response.status_code, 200)
 
 
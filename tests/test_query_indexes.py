@@ -0,0 +1,141 @@
+import random
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from simple_history.utils import bulk_create_with_history
+
+from request_a_govuk_domain.request.admin.views import AdminDashboardView
+from request_a_govuk_domain.request.models import (
+    Application,
+    ApplicationStatus,
+    Registrant,
+    RegistrantPerson,
+    Registrar,
+    RegistrarPerson,
+    RegistryPublishedPerson,
+    Review,
+)
+from request_a_govuk_domain.request.models.application import OPEN_STATUSES
+
+SEEDED_APPLICATIONS = 10000
+
+
+class QueryIndexesTestCase(TestCase):
+    """
+    Check the hot queries of the reviewer workflow are planned with an index, on a dataset
+    shaped like production: most applications are decided, spread over a couple of years.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(1)
+        registrar = Registrar.objects.create(name="dummy registrar")
+        people = dict(
+            registrar_org=registrar,
+            registrar_person=RegistrarPerson.objects.create(name="dummy registrar person", registrar=registrar),
+            registrant_person=RegistrantPerson.objects.create(name="dummy registrant person"),
+            registry_published_person=RegistryPublishedPerson.objects.create(name="dummy reg publish person"),
+        )
+        cls.users = User.objects.bulk_create(User(username=f"reviewer{i}") for i in range(20))
+        registrants = Registrant.objects.bulk_create(
+            Registrant(name=f"Organisation {i}", type="central_government") for i in range(2000)
+        )
+        decided = [ApplicationStatus.APPROVED, ApplicationStatus.REJECTED]
+        applications = bulk_create_with_history(
+            [
+                Application(
+                    reference=f"GOVUK{i:011}",
+                    domain_name=f"domain{i}.gov.uk",
+                    status=rng.choice(OPEN_STATUSES) if rng.random() < 0.15 else rng.choice(decided),
+                    owner=rng.choice(cls.users),
+                    last_updated_by=rng.choice(cls.users),
+                    registrant_org=rng.choice(registrants),
+                    **people,
+                )
+                for i in range(SEEDED_APPLICATIONS)
+            ],
+            Application,
+            batch_size=2000,
+        )
+        bulk_create_with_history([Review(application=application) for application in applications], Review)
+        with connection.cursor() as cursor:
+            # Spread the submissions over two years
+            cursor.execute("UPDATE request_application SET time_submitted = now() - (id % 730) * interval '1 day'")
+            cursor.execute("ANALYZE")
+        cls.application = applications[len(applications) // 2]
+        cls.history_record = Application.history.filter(id=cls.application.id).first()
+
+    def assertUsesIndex(self, queryset, index_name: str):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f"{index_name} not used by:\n{plan}")
+
+    def assertUsesPartitionIndex(self, queryset, index_name: str):
+        """
+        The index of a partitioned table is used through the indexes of its partitions
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = %s::regclass", [index_name]
+            )
+            partition_indexes = [name for (name,) in cursor.fetchall()]
+        plan = queryset.explain()
+        self.assertTrue(
+            any(f" using {name} on " in plan for name in partition_indexes), f"{index_name} not used by:\n{plan}"
+        )
+
+    def test_changelist_filters(self):
+        newest_first = ("-time_submitted", "-id")
+        applications = Application.objects.order_by(*newest_first)
+        self.assertUsesIndex(applications.filter(status=ApplicationStatus.NEW)[:100], "application_status_idx")
+        self.assertUsesIndex(applications.filter(owner=self.users[0])[:100], "application_owner_idx")
+        self.assertUsesIndex(applications.filter(last_updated_by=self.users[0])[:100], "application_updated_by_idx")
+        # RegistrantOrgFilter is served by the unique (name, type) index of the registrant
+        self.assertUsesIndex(
+            applications.filter(registrant_org__name="Organisation 12")[:100], "request_registrant_name_type"
+        )
+
+    def explain_queries(self, func) -> list[tuple[str, str]]:
+        """
+        :return: (SQL, plan) of each query run by func
+        """
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        plans = []
+        with connection.cursor() as cursor:
+            for query in queries.captured_queries:
+                cursor.execute(f"EXPLAIN {query['sql']}")
+                plans.append((query["sql"], "\n".join(row for (row,) in cursor.fetchall())))
+        return plans
+
+    def test_dashboard(self):
+        reviewer = self.users[0]
+        superuser = self.users[1]
+        superuser.is_superuser = True
+        for user in (reviewer, superuser):
+            cache.clear()
+            (counts_sql, counts_plan), *lists = self.explain_queries(
+                lambda: AdminDashboardView().get_dashboard_data(user, {})
+            )
+            # The counts are read from the partial index of the open applications
+            self.assertIn("COUNT(", counts_sql)
+            self.assertIn("application_open_owner_idx", counts_plan, counts_plan)
+            self.assertTrue(lists)
+            for sql, plan in lists:
+                self.assertNotIn("Seq Scan on request_application", plan, sql)
+
+    def test_history(self):
+        history_index = Application.history.model._meta.indexes[-1].name
+        self.assertUsesPartitionIndex(Application.history.filter(id=self.application.id).order_by("-pk"), history_index)
+        # The shape of the query for HistoricalRecord.prev_record
+        self.assertUsesPartitionIndex(
+            Application.history.filter(id=self.application.id, history_date__lt=self.history_record.history_date)
+            .order_by("history_date")
+            .reverse()[:1],
+            history_index,
+        )
+        self.assertUsesPartitionIndex(
+            Review.history.filter(id=Review.objects.first().id), Review.history.model._meta.indexes[-1].name
+        )
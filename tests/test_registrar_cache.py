@@ -0,0 +1,77 @@
+import time
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from request_a_govuk_domain.request.caches import (
+    active_registrar_choices,
+    get_registrar,
+    registrar_cache,
+)
+from request_a_govuk_domain.request.forms import RegistrarDetailsForm
+from request_a_govuk_domain.request.models import Registrar
+
+
+class RegistrarCacheTestCase(TestCase):
+    def setUp(self):
+        self.registrar = Registrar.objects.create(name="dummy registrar")
+        self.inactive_registrar = Registrar.objects.create(name="inactive registrar", active=False)
+
+    def test_registrar_form_makes_no_queries_once_cached(self):
+        RegistrarDetailsForm()
+        with self.assertNumQueries(0):
+            form = RegistrarDetailsForm()
+        self.assertEqual(
+            [("", ""), (f"registrar-{self.registrar.id}", "dummy registrar")],
+            form.fields["registrar_organisation"].choices,
+        )
+
+    def test_get_registrar_makes_no_queries_once_cached(self):
+        registrar_cache.get()
+        with self.assertNumQueries(0):
+            registrar = get_registrar(self.inactive_registrar.id)
+        self.assertEqual(self.inactive_registrar, registrar)
+        self.assertEqual("inactive registrar", registrar.name)
+
+    def test_unknown_registrar_raises_does_not_exist(self):
+        with self.assertRaises(Registrar.DoesNotExist):
+            get_registrar(self.inactive_registrar.id + 1000)
+
+    def test_saving_a_registrar_invalidates_the_cache(self):
+        active_registrar_choices()
+        self.inactive_registrar.active = True
+        self.inactive_registrar.save()
+        self.assertIn((f"registrar-{self.inactive_registrar.id}", "inactive registrar"), active_registrar_choices())
+
+    def test_deleting_a_registrar_invalidates_the_cache(self):
+        active_registrar_choices()
+        self.registrar.delete()
+        self.assertEqual((), active_registrar_choices())
+
+    def test_process_snapshot_follows_the_shared_version(self):
+        """
+        A change made by another process replaces the shared version, which this process must pick up
+        """
+        active_registrar_choices()
+        Registrar.objects.filter(id=self.registrar.id).update(name="renamed registrar")
+        self.assertEqual("dummy registrar", get_registrar(self.registrar.id).name)
+        registrar_cache.shared_cache.set(registrar_cache.version_key, "another-version")
+        self.assertEqual("renamed registrar", get_registrar(self.registrar.id).name)
+
+    @override_settings(LOCAL_REFERENCE_CACHE_TIMEOUT=60)
+    def test_process_snapshot_expires_with_a_local_cache(self):
+        """
+        Another process can't replace the version in a local memory cache, so the snapshot expires instead
+        """
+        active_registrar_choices()
+        Registrar.objects.filter(id=self.registrar.id).update(name="renamed registrar")
+        self.assertEqual("dummy registrar", get_registrar(self.registrar.id).name)
+        with patch("time.time", return_value=time.time() + 61):
+            self.assertEqual("renamed registrar", get_registrar(self.registrar.id).name)
+
+    def test_add_initial_registrars_invalidates_the_cache(self):
+        Registrar.objects.all().delete()
+        active_registrar_choices()
+        call_command("add_initial_registrars")
+        self.assertEqual(Registrar.objects.filter(active=True).count(), len(active_registrar_choices()))
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import TestCase
+
+from request_a_govuk_domain.request.forms import DomainForm
+from request_a_govuk_domain.request.utils import add_to_session, add_value_to_session
+
+
+class SessionWritesTestCase(TestCase):
+    def setUp(self):
+        self.request = Mock()
+        self.request.session = SessionStore()
+
+    def _save_session(self):
+        self.request.session.save()
+        self.request.session.modified = False
+
+    def test_new_answer_marks_the_session_as_modified(self):
+        add_value_to_session(self.request, "registrant_type", "central_government")
+        self.assertTrue(self.request.session.modified)
+        self.assertEqual({"registrant_type": "central_government"}, self.request.session["registration_data"])
+
+    def test_unchanged_answer_does_not_write_the_session(self):
+        """
+        Submitting a page again with the same answer must not trigger a session write
+        """
+        form = DomainForm({"domain_name": "test"})
+        self.assertTrue(form.is_valid())
+        add_to_session(form, self.request, ["domain_name"])
+        self._save_session()
+
+        form = DomainForm({"domain_name": "test"})
+        self.assertTrue(form.is_valid())
+        registration_data = add_to_session(form, self.request, ["domain_name"])
+
+        self.assertFalse(self.request.session.modified)
+        self.assertEqual("test.gov.uk", registration_data["domain_name"])
+
+    def test_changed_answer_writes_the_session(self):
+        add_value_to_session(self.request, "domain_name", "test.gov.uk")
+        self._save_session()
+
+        add_value_to_session(self.request, "domain_name", "other.gov.uk")
+
+        self.assertTrue(self.request.session.modified)
+        self.assertEqual("other.gov.uk", self.request.session["registration_data"]["domain_name"])
+
+    def test_answer_set_to_none_is_kept(self):
+        add_value_to_session(self.request, "domain_name", "test.gov.uk")
+        self._save_session()
+
+        add_value_to_session(self.request, "domain_purpose", None)
+
+        self.assertTrue(self.request.session.modified)
+        self.assertIn("domain_purpose", self.request.session["registration_data"])
@@ -0,0 +1,60 @@
+import threading
+
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, override_settings
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from request_a_govuk_domain.request.models import Application
+from request_a_govuk_domain.request.models.storage_util import (
+    TEMP_STORAGE_ROOT,
+    s3_root_storage,
+    select_storage,
+    storage_registry,
+)
+
+
+@override_settings(AWS_S3_REGION_NAME="eu-west-2", AWS_S3_MAX_POOL_CONNECTIONS=7)
+class StorageRegistryTestCase(SimpleTestCase):
+    def setUp(self):
+        self.addCleanup(storage_registry.clear)
+        storage_registry.clear()
+
+    @override_settings(S3_STORAGE_ENABLED=True)
+    def test_storages_are_shared_by_the_threads_of_the_process(self):
+        storage = select_storage()
+        self.assertIsInstance(storage, S3Boto3Storage)
+        self.assertEqual(TEMP_STORAGE_ROOT, storage.location)
+        self.assertEqual(7, storage.client_config.max_pool_connections)
+        self.assertTrue(storage.client_config.tcp_keepalive)
+
+        from_threads = []
+        threads = [threading.Thread(target=lambda: from_threads.append(select_storage())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([storage] * 4, from_threads)
+
+        root_storage = s3_root_storage()
+        self.assertIs(root_storage, s3_root_storage())
+        self.assertIsNot(storage, root_storage)
+        self.assertEqual("", root_storage.location)
+
+    @override_settings(S3_STORAGE_ENABLED=True)
+    def test_storages_are_replaced_after_a_fork(self):
+        storage = select_storage()
+        connection = storage.connection
+        field = Application._meta.get_field("written_permission_evidence")
+        self.addCleanup(setattr, field, "storage", field.storage)
+        field.storage = storage
+
+        storage_registry.after_fork()
+        self.assertIsNot(storage, select_storage())
+        self.assertIs(select_storage(), field.storage)
+        self.assertIsNot(connection, select_storage().connection)
+        self.assertEqual(TEMP_STORAGE_ROOT, select_storage().location)
+
+    @override_settings(S3_STORAGE_ENABLED=False)
+    def test_file_system_storage(self):
+        self.assertIsInstance(select_storage(), FileSystemStorage)
+        self.assertIs(select_storage(), select_storage())
@@ -0,0 +1,281 @@
+import tempfile
+from importlib import import_module
+from unittest.mock import Mock, patch
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import (
+    Client,
+    LiveServerTestCase,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+
+from request_a_govuk_domain.request.clamav import (
+    ClamdBusyError,
+    ClamdConnectionError,
+    ClamdScanner,
+    ScanStream,
+    get_scanner,
+    reset_scanner,
+)
+from request_a_govuk_domain.request.fake_clamd import EICAR_SIGNATURE, FakeClamd
+from request_a_govuk_domain.request.forms import UploadForm
+from request_a_govuk_domain.request.models.storage_util import (
+    select_storage,
+    storage_registry,
+)
+from request_a_govuk_domain.request.uploads import (
+    EvidenceUploadHandler,
+    S3MultipartUpload,
+    sniff_content_type,
+)
+from tests.util import AdminScreenTestMixin
+
+PNG = b"\x89PNG\r\n\x1a\n"
+INFECTED = PNG + b"X5O!P%@AP[4\\PZX54(P^)7CC)7}$" + EICAR_SIGNATURE + b"!$H+H*"
+
+
+@override_settings(S3_STORAGE_ENABLED=False, IS_SCANNING_ENABLED=True, CLAMD_SCAN_ASYNC=False)
+class EvidenceUploadHandlerTestCase(AdminScreenTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        storage_registry.clear()
+        self.addCleanup(storage_registry.clear)
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.server = FakeClamd().start()
+        self.addCleanup(self.server.stop)
+        clamd_override = override_settings(CLAMD_HOSTS=["%s:%s" % self.server.address], CLAMD_HEALTH_CHECK_INTERVAL=0)
+        clamd_override.enable()
+        self.addCleanup(clamd_override.disable)
+        reset_scanner()
+        self.addCleanup(reset_scanner)
+
+        session = self.client.session
+        session["registration_data"] = self.registration_data | {"written_permission": "yes"}
+        session.save()
+
+    def upload(self, content: bytes, client: Client | None = None, content_type="image/png", **fields):
+        return (client or self.client).post(
+            reverse("written_permission_upload"),
+            # Other fields come first, like the CSRF token of the form
+            fields | {"file": SimpleUploadedFile("letter.png", content, content_type=content_type)},
+        )
+
+    def stored_files(self) -> list[str]:
+        directories, _ = select_storage().listdir("")
+        return [name for directory in directories for name in select_storage().listdir(directory)[1]]
+
+    def test_upload_is_stored_and_scanned_as_it_is_received(self):
+        content = PNG + b"x" * 200_000
+        response = self.upload(content)
+        self.assertRedirects(response, reverse("written_permission_upload_confirm"))
+        name = self.client.session["registration_data"]["written_permission_file_uploaded_filename"]
+        with select_storage().open(name) as file:
+            self.assertEqual(content, file.read())
+        self.assertEqual(1, self.server.counts["scans"])
+        metrics = get_scanner().metrics.snapshot()
+        self.assertEqual((1, len(content)), (metrics["scans"], metrics["bytes"]))
+
+        # The verdict is cached
+        self.assertFalse(get_scanner().scan(select_storage().open(name)).infected)
+        self.assertEqual(1, self.server.counts["scans"])
+
+    def test_infected_upload_is_not_kept(self):
+        response = self.upload(INFECTED)
+        self.assertContains(response, "File is infected with malware.")
+        self.assertEqual([], self.stored_files())
+
+    def test_file_type_is_sniffed(self):
+        response = self.upload(b"MZ\x90\x00 not a png")
+        self.assertContains(response, "The selected file must be a JPEG, PNG or PDF.")
+        response = self.upload(b"%PDF-1.7 letter", content_type="image/png")
+        self.assertRedirects(response, reverse("written_permission_upload_confirm"))
+        self.assertEqual(1, len(self.stored_files()))
+        self.assertEqual(1, self.server.counts["scans"])
+
+    @override_settings(MAX_UPLOAD_SIZE="100000")
+    def test_large_upload_is_refused_once_too_large(self):
+        with patch.object(
+            EvidenceUploadHandler,
+            "receive_data_chunk",
+            autospec=True,
+            side_effect=EvidenceUploadHandler.receive_data_chunk,
+        ) as receive_data_chunk:
+            response = self.client.post(
+                reverse("written_permission_upload"),
+                {"file": SimpleUploadedFile("letter.png", PNG + b"x" * 150_000), "after": "field"},
+            )
+        self.assertContains(response, "The selected file must be smaller than 10MB")
+        # The rest of the request is not read
+        self.assertEqual(2, receive_data_chunk.call_count)
+        self.assertNotIn("after", response.wsgi_request.POST)
+        self.assertEqual([], self.stored_files())
+        self.assertEqual(0, self.server.counts["scans"])
+
+    @override_settings(MAX_UPLOAD_SIZE="1000")
+    def test_large_upload_is_refused_on_its_content_length(self):
+        client = Client(enforce_csrf_checks=True)
+        session = client.session
+        session["registration_data"] = self.registration_data | {"written_permission": "yes"}
+        session.save()
+        client.get(reverse("written_permission_upload"))
+        token = client.cookies[settings.CSRF_COOKIE_NAME].value
+        with patch.object(EvidenceUploadHandler, "receive_data_chunk") as receive_data_chunk:
+            response = self.upload(PNG + b"x" * 100_000, client, csrfmiddlewaretoken=token)
+            self.assertContains(response, "The selected file must be smaller than 10MB")
+            receive_data_chunk.assert_not_called()
+            # Still protected from CSRF
+            self.assertEqual(403, self.upload(PNG + b"x" * 100_000, client).status_code)
+        self.assertEqual([], self.stored_files())
+
+    def test_upload_is_scanned_from_the_storage_when_the_stream_fails(self):
+        with patch.object(ScanStream, "result", side_effect=ClamdConnectionError("connection closed")):
+            response = self.upload(INFECTED)
+        self.assertContains(response, "File is infected with malware.")
+        self.assertEqual(1, self.server.counts["scans"])
+        self.assertEqual([], self.stored_files())
+
+    def test_upload_is_scanned_from_the_storage_when_clamd_is_busy(self):
+        with patch.object(ClamdScanner, "stream", side_effect=ClamdBusyError("busy")) as stream:
+            response = self.upload(INFECTED)
+        stream.assert_called_once_with(wait=False)
+        self.assertContains(response, "File is infected with malware.")
+        self.assertEqual(1, self.server.counts["scans"])
+        self.assertEqual([], self.stored_files())
+
+    def test_cached_verdict_is_not_waited_for(self):
+        content = PNG + b"x" * 200_000
+        for _ in range(2):
+            response = self.upload(content)
+            self.assertRedirects(response, reverse("written_permission_upload_confirm"))
+        self.assertEqual(1, self.server.counts["scans"])
+        metrics = get_scanner().metrics.snapshot()
+        self.assertEqual((1, 1), (metrics["cache_hits"], metrics["cache_misses"]))
+
+        response = self.upload(INFECTED)
+        self.assertContains(response, "File is infected with malware.")
+        response = self.upload(INFECTED)
+        self.assertContains(response, "File is infected with malware.")
+        self.assertEqual(2, self.server.counts["scans"])
+        # Only the clean uploads are kept
+        self.assertEqual(2, len(self.stored_files()))
+
+    def test_csrf_is_checked(self):
+        client = Client(enforce_csrf_checks=True)
+        with patch("request_a_govuk_domain.request.uploads.open_storage_upload") as open_storage_upload:
+            self.assertEqual(403, self.upload(PNG, client).status_code)
+        # Checked before anything is stored or scanned
+        open_storage_upload.assert_not_called()
+        self.assertEqual(0, self.server.counts["connections"])
+        self.assertEqual([], self.stored_files())
+
+    def test_files_not_kept_are_deleted(self):
+        with patch.object(UploadForm, "clean_file", side_effect=ValidationError("Not this one")):
+            response = self.upload(PNG + b"letter")
+        self.assertContains(response, "Not this one")
+        self.assertEqual([], self.stored_files())
+
+        response = self.upload(PNG + b"letter", other=SimpleUploadedFile("other.png", PNG + b"other"))
+        self.assertRedirects(response, reverse("written_permission_upload_confirm"))
+        name = self.client.session["registration_data"]["written_permission_file_uploaded_filename"]
+        self.assertEqual([name.split("/")[1]], self.stored_files())
+
+
+@override_settings(
+    S3_STORAGE_ENABLED=False,
+    IS_SCANNING_ENABLED=False,
+    MAX_UPLOAD_SIZE="100000",
+    CSRF_COOKIE_SECURE=False,
+    SESSION_COOKIE_SECURE=False,
+)
+class RefusedUploadLiveTestCase(LiveServerTestCase):
+    """
+    The error page of a refused upload must reach the browser over a real connection
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        storage_registry.clear()
+        self.addCleanup(storage_registry.clear)
+
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session["registration_data"] = {"registrant_type": "parish_council", "written_permission": "yes"}
+        session.save()
+        self.http = requests.Session()
+        self.http.cookies.set(settings.SESSION_COOKIE_NAME, session.session_key)
+        self.url = self.live_server_url + reverse("written_permission_upload")
+        self.http.get(self.url).raise_for_status()
+
+    def upload(self, size: int) -> requests.Response:
+        return self.http.post(
+            self.url,
+            data={"csrfmiddlewaretoken": self.http.cookies[settings.CSRF_COOKIE_NAME]},
+            files={"file": ("letter.png", PNG + b"x" * size, "image/png")},
+        )
+
+    def test_error_page_of_a_refused_upload_arrives(self):
+        # Refused part way through, then on its Content-Length
+        for size in (120_000, 5_000_000):
+            with self.subTest(size=size):
+                response = self.upload(size)
+                self.assertEqual(200, response.status_code)
+                self.assertIn("The selected file must be smaller than 10MB", response.text)
+        # The connection is still usable
+        self.assertEqual(200, self.http.get(self.url).status_code)
+
+
+class S3MultipartUploadTestCase(SimpleTestCase):
+    def test_parts(self):
+        storage = Mock(bucket_name="bucket")
+        storage._normalize_name.side_effect = lambda name: f"temp_files/{name}"
+        storage.get_object_parameters.return_value = {"ServerSideEncryption": "AES256"}
+        client = storage.connection.meta.client
+        client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+        client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+        upload = S3MultipartUpload(storage, "session/letter.pdf")
+        client.create_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="temp_files/session/letter.pdf",
+            ContentType="application/pdf",
+            ServerSideEncryption="AES256",
+        )
+        for _ in range(100):
+            upload.write(b"x" * 65536)
+        self.assertEqual("session/letter.pdf", upload.complete())
+        sizes = [len(call.kwargs["Body"]) for call in client.upload_part.call_args_list]
+        self.assertEqual([S3MultipartUpload.PART_SIZE, 100 * 65536 - S3MultipartUpload.PART_SIZE], sizes)
+        client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="temp_files/session/letter.pdf",
+            UploadId="upload-id",
+            MultipartUpload={"Parts": [{"ETag": "etag-1", "PartNumber": 1}, {"ETag": "etag-2", "PartNumber": 2}]},
+        )
+
+        S3MultipartUpload(storage, "session/letter.pdf").abort()
+        client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="temp_files/session/letter.pdf", UploadId="upload-id"
+        )
+
+    def test_sniff_content_type(self):
+        self.assertEqual("image/png", sniff_content_type(PNG + b"data"))
+        self.assertEqual("image/jpeg", sniff_content_type(b"\xff\xd8\xff\xe0"))
+        self.assertEqual("application/pdf", sniff_content_type(b"%PDF-1.4"))
+        self.assertEqual("application/octet-stream", sniff_content_type(b"GIF89a"))